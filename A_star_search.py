@@ -1,69 +1,116 @@
 import heapq
+from array import array
 
-class Node:
-    def __init__(self, x, y, g=0, h=0, parent=None):
-        self.x = x
-        self.y = y
-        self.g = g
-        self.h = h
-        self.f = g + h
-        self.parent = parent
+from maze_grid import MazeGrid
+from neighbor_table import NeighborTable, RIGHT, DOWN, LEFT, UP
+from solver_stream import VISIT, PUSH, PATH, STOPPED, collect
 
-    def __lt__(self, other):
-        return self.f < other.f
+# Neighbor order of the search, in (row, col) terms: (r, c+1), (r+1, c), (r, c-1), (r-1, c)
+_ORDER = (RIGHT, DOWN, LEFT, UP)
 
 
 def heuristic(a, b):
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
 
-def get_neighbors(node, maze):
-    directions = [(0,1), (1,0), (0,-1), (-1,0)]
-    neighbors = []
-
-    for dx, dy in directions:
-        nx, ny = node.x + dx, node.y + dy
-
-        if 0 <= nx < len(maze) and 0 <= ny < len(maze[0]):
-            if maze[nx][ny] == 0:  # not a wall
-                neighbors.append((nx, ny))
-
-    return neighbors
-
-
-def reconstruct_path(node):
+def _trace(came_from, i, w):
+    # Flat cells back to the start (parent -1), as (row, col)
     path = []
-    while node:
-        path.append((node.x, node.y))
-        node = node.parent
+    while i != -1:
+        path.append(divmod(i, w))
+        i = came_from[i]
     return path[::-1]
 
 
-def a_star(maze, start, goal):
-    open_list = []
-    closed_set = set()
-
-    start_node = Node(start[0], start[1], g=0,
-                      h=heuristic(start, goal))
-    heapq.heappush(open_list, start_node)
+def a_star(maze, start, goal, budget=None, metrics=None):
+    '''
+    A* over maze[row][col] (0 = open) from start to goal, both (row, col).
+
+    Frontier entries are plain (f, h, cell) tuples: ties on f go to the
+    smaller h, then to the smaller cell, so the search is deterministic.
+    A best-g table rejects any push that does not improve a known cost, and
+    entries made stale by a later improvement are skipped when popped
+    (lazy deletion), so the heap holds at most a few entries per cell and no
+    separate closed set is needed.
+
+    Returns (path, explored): path is the list of (row, col) cells from start
+    to goal, or None when unreachable; explored lists cells in expansion order.
+
+    With a search_budget.Budget, the search checks it every budget.every
+    expansions; once it runs out (budget.reason is set), path is only the
+    path to the reached cell closest to the goal.
+
+    A solver_metrics.SolverMetrics passed as metrics records every push, pop
+    and neighbor check.
+    '''
+    return collect(iter_a_star(maze, start, goal, budget=budget, metrics=metrics))
+
+
+def iter_a_star(maze, start, goal, frontier=False, budget=None, metrics=None):
+    '''
+    Same search as a_star, as a stream of solver_stream events: (VISIT, cell)
+    per expansion, (PUSH, cell) per accepted push when frontier is set, and
+    a final (PATH, path), preceded by (STOPPED, reason) if the budget ran out.
+    '''
+    # Lists of lists are packed once so the search can use a neighbor table.
+    # Cells are flat indices r * w + c internally, which order exactly like
+    # the (row, col) tuples they stand for, so heap ties break the same way.
+    grid = maze if isinstance(maze, MazeGrid) else MazeGrid.from_rows(maze)
+    table = NeighborTable.of(grid)
+    mask, steps, w = table.mask, table.steps(_ORDER), grid.width
+    gr, gc = goal
+    s, t = start[0] * w + start[1], gr * w + gc
+    best_g = array('i', [-1]) * len(grid.cells)    # -1: not reached yet
+    best_g[s] = 0
+    came_from = array('i', [-1]) * len(grid.cells)
+    h_start = heuristic(start, goal)
+    open_list = [(h_start, h_start, s)]
+    left = -1 if budget is None else 0     # expansions until the next budget check
+    if metrics is not None:
+        metrics.push(1)
 
     while open_list:
-        current = heapq.heappop(open_list)
-
-        if (current.x, current.y) == goal:
-            return reconstruct_path(current)
-
-        closed_set.add((current.x, current.y))
-
-        for nx, ny in get_neighbors(current, maze):
-            if (nx, ny) in closed_set:
+        f, h, current = heapq.heappop(open_list)
+        if metrics is not None:
+            metrics.pop()
+        g_cost = f - h
+        if g_cost > best_g[current]:
+            if metrics is not None:
+                metrics.stale()
+            continue        # stale entry: superseded by a cheaper push
+        if not left:
+            left = budget.grant()
+            if not left:
+                reached = (i for i, g in enumerate(best_g) if g >= 0)
+                yield STOPPED, budget.reason
+                yield PATH, _trace(came_from, min(reached, key=lambda i: abs(i // w - gr) + abs(i % w - gc)), w)
+                return
+        left -= 1
+        yield VISIT, divmod(current, w)
+
+        if current == t:
+            yield PATH, _trace(came_from, current, w)
+            return
+
+        # The heuristic is consistent, so an expanded cell already has its
+        # final g and the best-g check below doubles as the closed set.
+        g_cost += 1
+        nbrs = steps[mask[current]]
+        if metrics is not None:
+            metrics.expand(len(nbrs))
+        for d in nbrs:
+            n = current + d
+            if 0 <= best_g[n] <= g_cost:
+                if metrics is not None:
+                    metrics.duplicate()
                 continue
-
-            g_cost = current.g + 1
-            h_cost = heuristic((nx, ny), goal)
-            neighbor = Node(nx, ny, g_cost, h_cost, current)
-
-            heapq.heappush(open_list, neighbor)
-
-    return None  # No path found
-
+            best_g[n] = g_cost
+            came_from[n] = current
+            h_cost = abs(n // w - gr) + abs(n % w - gc)
+            heapq.heappush(open_list, (g_cost + h_cost, h_cost, n))
+            if metrics is not None:
+                metrics.push(len(open_list))
+            if frontier:
+                yield PUSH, divmod(n, w)
+
+    yield PATH, None  # No path found
@@ -1,4 +1,12 @@
-def bfs_maze_solver(maze, start, end, wall_char='#'):
+from array import array
+from collections import deque
+
+from maze_grid import MazeGrid, CharGridView, WALL
+from neighbor_table import NeighborTable, UP, DOWN, LEFT, RIGHT
+from search_budget import Budget
+
+
+def bfs_maze_solver(maze, start, end, wall_char='#', budget=None, metrics=None):
     '''
     Finds the shortest path between a start and end point in a grid using (Breadth-First Search (BFS)).
         #===========
@@ -7,38 +15,86 @@ def bfs_maze_solver(maze, start, end, wall_char='#'):
         # Inputs:
         #--------
         # maze : list[list] [A 2D grid representing the maze. Each element can be a character or integer.]
+        #        A MazeGrid works directly with wall_char=WALL, or through maze.char_view() with '#'.
         # start : tuple (row, col) [The starting coordinates, e.g., (0, 0).]
         # end : tuple (row, col) [The target coordinates to reach, e.g., (5, 5).]
         # wall_char : anything actually it's optional but (default='#') [The value inside the maze grid that represents a wall/obstacle.]
         # The algorithm will not traverse cells containing this value.
+        # budget : search_budget.Budget, optional [Cancellation token and time / expansion limits,
+        #          checked every budget.every expansions.]
+        # metrics : solver_metrics.SolverMetrics, optional [Records pushes, pops, neighbor checks, ...]
 
         #Returns:
         #--------
         # list[tuple] or None
         # - List[tuple]: Returns a list of coordinates [(r, c), (r, c), ...] representing the path from start to end (inclusive).
         # - None: Returns None if the end is unreachable (blocked by walls).
+        # - If the budget runs out first (budget.reason is set), the path only leads
+        #   to the reached cell closest to the end.
     '''
-    rows, cols = len(maze), len(maze[0])
-    queue = [(start, [start])]
-    visited = {start}
-    # Directions: Up, Down, Left, Right.
-    moves = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    # Walls are read through a neighbor table: a MazeGrid (or its character
+    # view) shares its own, any other grid is packed into one first
+    if isinstance(maze, MazeGrid) and wall_char == WALL:
+        grid = maze
+    elif isinstance(maze, CharGridView) and wall_char == '#':
+        grid = maze.maze
+    else:
+        grid = MazeGrid.from_rows(maze, wall_char=wall_char)
+    table = NeighborTable.of(grid)
+    cols = grid.width
+    mask = table.mask
+    # Cells are flat indices (row * cols + col); tuples are only built for the path.
+    s, t = start[0] * cols + start[1], end[0] * cols + end[1]
+    queue = deque([s])
+    # Parent of every discovered cell (doubles as the visited set: -2 means
+    # undiscovered, -1 is the start); the path is rebuilt once at the end
+    # instead of copying a growing path into the queue.
+    parent = array('i', [-2]) * len(grid.cells)
+    parent[s] = -1
+    # Directions: Up, Down, Left, Right, as flat offsets per neighbor mask.
+    steps = table.steps((UP, DOWN, LEFT, RIGHT))
+    left = -1 if budget is None else 0   # Expansions until the next budget check
+    if metrics is not None:
+        metrics.push(1)
 
     while queue:
-        (curr_r, curr_c), path = queue.pop(0)
+        if not left:
+            left = budget.grant()
+            if not left:
+                # Stopped early: best partial path toward the end
+                reached = (i for i, p in enumerate(parent) if p != -2)
+                return _trace(parent, min(reached, key=lambda i: abs(i // cols - end[0]) + abs(i % cols - end[1])), cols)
+        left -= 1
+        current = queue.popleft()
+        if metrics is not None:
+            metrics.pop()
 
-        if (curr_r, curr_c) == end:
-            return path
+        if current == t:
+            return _trace(parent, t, cols)
 
-        for dr, dc in moves:
-            nr, nc = curr_r + dr, curr_c + dc
-            if (0 <= nr < rows and 0 <= nc < cols and
-                    maze[nr][nc] != wall_char and (nr, nc) not in visited):
-                visited.add((nr, nc))
-                queue.append(((nr, nc), path + [(nr, nc)]))
+        nbrs = steps[mask[current]]
+        if metrics is not None:
+            metrics.expand(len(nbrs))
+        for d in nbrs:
+            n = current + d
+            if parent[n] == -2:
+                parent[n] = current
+                queue.append(n)
+                if metrics is not None:
+                    metrics.push(len(queue))
+            elif metrics is not None:
+                metrics.duplicate()
 
     return None
 
+
+def _trace(parent, i, cols):
+    path = []
+    while i != -1:
+        path.append(divmod(i, cols))
+        i = parent[i]
+    return path[::-1]
+
 #============================================================================================================
 # ==================== 2. The Test Suite =========================
 def tests():
@@ -76,6 +132,24 @@ def tests():
     assert len(result_3) == expected_len, "Test 3 Failed: Path should be direct"
     print("Test 3 Passed: Found immediate neighbor.")
 
+    # TEST CASE 4: Compact MazeGrid, both directly and through its character view
+    maze_4 = MazeGrid.from_rows(maze_1, wall_char='#')
+    result_4 = bfs_maze_solver(maze_4, (0, 0), (0, 3), wall_char=WALL)
+    assert result_4 == result_1, "Test 4 Failed: MazeGrid path differs"
+    result_4 = bfs_maze_solver(maze_4.char_view((0, 0), (0, 3)), (0, 0), (0, 3))
+    assert result_4 == result_1, "Test 4 Failed: character view path differs"
+    print("Test 4 Passed: MazeGrid solved in place.")
+
+    # TEST CASE 5: Budget runs out before the end is reached
+    budget = Budget(expansions=2)
+    result_5 = bfs_maze_solver(maze_1, (0, 0), (0, 3), budget=budget)
+    assert budget.reason == Budget.EXPANSIONS, "Test 5 Failed: budget should have stopped the search"
+    assert result_5[0] == (0, 0) and result_5[-1] != (0, 3), "Test 5 Failed: expected a partial path"
+    cancelled = Budget()
+    cancelled.cancel()
+    assert bfs_maze_solver(maze_1, (0, 0), (0, 3), budget=cancelled) == [(0, 0)], "Test 5 Failed: cancel ignored"
+    print("Test 5 Passed: Budget stops the search with a partial path.")
+
     print("\nAll tests passed successfully!")
 
 # --- 3. Run It ---
@@ -0,0 +1,250 @@
+"""
+Headless benchmark for the maze generator and every solver implementation.
+
+Times generation and solving across a grid of maze sizes and fixed seeds,
+and writes machine-readable JSON so runs can be diffed between versions:
+
+    python benchmark.py --sizes 15 101 1001 2001 --seeds 1 2 3 --out bench.json
+
+Wall time is measured with ``time.perf_counter`` (best of ``--repeat`` runs);
+peak memory is measured in a separate run under ``tracemalloc`` so tracing
+overhead never leaks into the timings, and so are the solver counters of
+``--metrics`` (expansions, pushes, pops, ...). Nothing here imports tkinter.
+"""
+
+import argparse
+import inspect
+import itertools
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from maze_algorithms import GENERATORS, MazeSolver
+from maze_cache import MazeCache
+from dfs_maze_solver import DFSMazeSolver
+from BFS_maze_solver import bfs_maze_solver
+from A_star_search import a_star
+from maze_grid import WALL
+from solver_metrics import SolverMetrics
+
+
+DEFAULT_SIZES = [15, 31, 101, 251, 501, 1001, 2001]
+DEFAULT_SEEDS = [1, 2, 3]
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# SOLVER ADAPTERS
+# ══════════════════════════════════════════════════════════════════════════════
+# Every adapter takes a MazeGrid (and an optional SolverMetrics hook) and
+# returns (path, explored_count). Solvers that do not return their explored
+# cells report the expansions counted by a SolverMetrics hook instead.
+
+def _maze_solver_method(name):
+    def run(maze, metrics=None):
+        path, explored = getattr(MazeSolver(maze), name)(metrics=metrics)
+        return path, len(explored)
+    return run
+
+
+def _dfs_solver(maze, metrics=None):
+    metrics = SolverMetrics() if metrics is None else metrics
+    return DFSMazeSolver(maze).solve(metrics=metrics), metrics.expansions
+
+
+def _bfs_function(maze, metrics=None):
+    # (row, col) coordinates on the grid's own buffer
+    end = (maze.height - 2, maze.width - 2)
+    metrics = SolverMetrics() if metrics is None else metrics
+    return bfs_maze_solver(maze, (1, 1), end, wall_char=WALL, metrics=metrics), metrics.expansions
+
+
+def _a_star_function(maze, metrics=None):
+    end = (maze.height - 2, maze.width - 2)
+    path, explored = a_star(maze, (1, 1), end, metrics=metrics)
+    return path, len(explored)
+
+
+def _counters(solve, maze):
+    """SolverMetrics counters of one cold ``solve`` run, without its peak memory."""
+    metrics = SolverMetrics()
+    maze.invalidate()
+    solve(maze, metrics)
+    counters = metrics.as_dict()
+    del counters['peak_bytes']
+    return counters
+
+
+def _is_single_query(name):
+    # solve_* methods that need arguments (e.g. solve_batch) are not single solvers
+    params = inspect.signature(getattr(MazeSolver, name)).parameters.values()
+    return all(p.default is not p.empty for p in list(params)[1:])
+
+
+def solvers():
+    """Name -> adapter for every solver, including all ``MazeSolver.solve_*``."""
+    table = {f"MazeSolver.{name}": _maze_solver_method(name)
+             for name in sorted(dir(MazeSolver))
+             if name.startswith('solve_') and _is_single_query(name)}
+    table['DFSMazeSolver.solve'] = _dfs_solver
+    table['bfs_maze_solver'] = _bfs_function
+    table['A_star_search.a_star'] = _a_star_function
+    return table
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# MEASUREMENT
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _timed(fn, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def _peak_bytes(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def generate(size, seed, generator='backtracker'):
+    return GENERATORS[generator](size, size, seed).generate()
+
+
+def run(sizes, seeds, names=None, repeat=1, memory=True, log=None, cache=None,
+        generators=('backtracker',), metrics=False):
+    """Run the benchmark grid and return a list of result records.
+
+    Every solver runs on the maze of every generator in ``generators``
+    (names from ``maze_algorithms.GENERATORS``). With a ``MazeCache`` the
+    mazes are loaded from it (generated and stored on a miss) and the load
+    is timed instead of the generation. With ``metrics``, every solve record
+    also carries the solver's counters, from one more (untimed) run.
+    """
+    table = solvers()
+    if names:
+        unknown = set(names) - set(table)
+        if unknown:
+            raise ValueError(f"unknown solvers: {', '.join(sorted(unknown))}")
+        table = {n: table[n] for n in names}
+
+    unknown = set(generators) - set(GENERATORS)
+    if unknown:
+        raise ValueError(f"unknown generators: {', '.join(sorted(unknown))}")
+
+    records = []
+    for size, generator, seed in itertools.product(sizes, generators, seeds):
+        cls = GENERATORS[generator]
+        if cache is not None:
+            cache.generate(cls, size, size, seed)    # Warm on the first run
+            build, kind, label = (lambda: cache.generate(cls, size, size, seed),
+                                  'load', 'MazeCache.generate')
+        else:
+            build, kind, label = lambda: generate(size, seed, generator), 'generate', f'{cls.__name__}.generate'
+        seconds, maze = _timed(build, repeat)
+        record = {'kind': kind, 'name': label, 'generator': generator,
+                  'size': size, 'seed': seed, 'time_ms': seconds * 1000,
+                  'peak_bytes': _peak_bytes(build) if memory else None}
+        records.append(record)
+        if log:
+            log(record)
+
+        for name, solve in table.items():
+            # Drop per-maze preprocessing cached by earlier runs so every
+            # measurement is a cold solve
+            def cold():
+                maze.invalidate()
+                return solve(maze)
+            seconds, (path, explored) = _timed(cold, repeat)
+            record = {'kind': 'solve', 'name': name, 'generator': generator,
+                      'size': size, 'seed': seed,
+                      'time_ms': seconds * 1000,
+                      'path_length': len(path) if path else None,
+                      'explored': explored,
+                      'peak_bytes': _peak_bytes(cold) if memory else None}
+            if metrics:
+                record['metrics'] = _counters(solve, maze)
+            records.append(record)
+            if log:
+                log(record)
+    return records
+
+
+def _print_record(r):
+    extra = ''
+    if r['kind'] == 'solve':
+        extra = f"  path={r['path_length']}  explored={r['explored']}"
+        if 'metrics' in r:
+            extra += f"  pushes={r['metrics']['pushes']}  peak_frontier={r['metrics']['peak_frontier']}"
+    peak = f"  peak={r['peak_bytes'] / 1024:.0f}KiB" if r['peak_bytes'] is not None else ''
+    print(f"{r['size']:>5} {r['generator']:<11} seed={r['seed']:<3} {r['name']:<28} {r['time_ms']:>10.2f}ms{peak}{extra}",
+          file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="odd maze side lengths")
+    parser.add_argument('--seeds', type=int, nargs='+', default=DEFAULT_SEEDS)
+    parser.add_argument('--generators', nargs='+', metavar='NAME', default=['backtracker'],
+                        choices=list(GENERATORS), help="maze generators to run (default: backtracker)")
+    parser.add_argument('--solvers', nargs='+', metavar='NAME',
+                        help="subset of solvers to run (default: all)")
+    parser.add_argument('--repeat', type=int, default=1,
+                        help="timed runs per measurement; the best is reported")
+    parser.add_argument('--no-memory', action='store_true',
+                        help="skip the tracemalloc peak-memory runs")
+    parser.add_argument('--metrics', action='store_true',
+                        help="record solver counters (expansions, pushes, ...) in an extra run")
+    parser.add_argument('--list', action='store_true', help="list solver names and exit")
+    parser.add_argument('--out', default='-', help="JSON output path ('-' for stdout)")
+    parser.add_argument('--maze-cache', nargs='?', const='', metavar='DIR',
+                        help="load mazes from an on-disk cache instead of generating them "
+                             "(default DIR: $MAZE_CACHE_DIR or ~/.cache/super_maze_bros)")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print('\n'.join(solvers()))
+        return 0
+    if any(s < 5 or s % 2 == 0 for s in args.sizes):
+        parser.error("sizes must be odd and at least 5")
+
+    cache = MazeCache(args.maze_cache or None) if args.maze_cache is not None else None
+    records = run(args.sizes, args.seeds, args.solvers, max(1, args.repeat),
+                  memory=not args.no_memory, log=_print_record, cache=cache,
+                  generators=args.generators, metrics=args.metrics)
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'sizes': args.sizes,
+            'seeds': args.seeds,
+            'generators': args.generators,
+            'repeat': args.repeat,
+            'maze_cache': cache.directory if cache else None,
+        },
+        'results': records,
+    }
+    text = json.dumps(report, indent=2)
+    if args.out == '-':
+        print(text)
+    else:
+        with open(args.out, 'w') as f:
+            f.write(text + '\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+Bucket priority queue for small integer keys (Dial's algorithm).
+
+Dijkstra on a maze whose step costs are integers in ``1..C`` never has keys
+in its frontier that differ by more than ``C``: every key is at least the
+last one popped and at most that plus one step. ``BucketQueue`` exploits
+this with a ring of ``C + 1`` buckets indexed by ``key % (C + 1)``, so a push
+is a list append and a pop scans at most ``C + 1`` buckets instead of
+sifting a binary heap. The same holds for A* with a consistent heuristic,
+whose keys grow by at most ``C + 1`` per step.
+"""
+
+
+class BucketQueue:
+    """Monotone priority queue of items under integer keys.
+
+    Every pushed key must lie between the last popped key and that key plus
+    ``span`` (the first push may use any key). Items sharing a key come out
+    last in, first out.
+    """
+
+    __slots__ = ('_buckets', '_key', '_size')
+
+    def __init__(self, span):
+        """
+        span: largest possible gap between a pushed key and the last popped key
+        """
+        self._buckets = [[] for _ in range(span + 1)]
+        self._key = 0       # No key below this is queued
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def push(self, key, item):
+        if not self._size or key < self._key:
+            self._key = key
+        self._buckets[key % len(self._buckets)].append(item)
+        self._size += 1
+
+    def pop(self):
+        """Remove and return ``(key, item)`` for the smallest queued key."""
+        if not self._size:
+            raise IndexError("pop from an empty BucketQueue")
+        buckets, n = self._buckets, len(self._buckets)
+        key = self._key
+        while not buckets[key % n]:
+            key += 1
+        self._key = key
+        self._size -= 1
+        return key, buckets[key % n].pop()
+
+
+def tests():
+    import random
+
+    print("Running Bucket Queue Tests...\n")
+
+    # TEST CASE 1: Keys come out in order, like a Dijkstra frontier
+    rng = random.Random(0)
+    queue = BucketQueue(5)
+    queue.push(3, 'start')
+    popped, pushed = [], 1
+    while queue:
+        key, item = queue.pop()
+        popped.append(key)
+        for _ in range(rng.randrange(3) if pushed < 500 else 0):
+            queue.push(key + rng.randint(1, 5), pushed)
+            pushed += 1
+    assert len(popped) == pushed, "Test 1 Failed: Items lost"
+    assert popped == sorted(popped) and popped[0] == 3, "Test 1 Failed: Keys out of order"
+    print("Test 1 Passed: Pops follow key order.")
+
+    # TEST CASE 2: Equal keys are last in, first out; lower keys jump ahead
+    queue = BucketQueue(2)
+    for item in 'abc':
+        queue.push(4, item)
+    queue.push(5, 'd')
+    assert queue.pop() == (4, 'c') and queue.pop() == (4, 'b'), "Test 2 Failed: Equal keys not LIFO"
+    queue.push(4, 'e')
+    assert [queue.pop() for _ in range(3)] == [(4, 'e'), (4, 'a'), (5, 'd')], "Test 2 Failed: Wrong order"
+    print("Test 2 Passed: Ties pop last in, first out.")
+
+    # TEST CASE 3: Empty queue
+    try:
+        queue.pop()
+        assert False, "Test 3 Failed: Pop from an empty queue"
+    except IndexError:
+        pass
+    print("Test 3 Passed: Empty queue raises IndexError.")
+
+    print("\nAll tests passed successfully!")
+
+
+if __name__ == "__main__":
+    tests()
@@ -0,0 +1,289 @@
+"""
+Headless batch pipeline: generate and solve mazes by the million.
+
+A run covers a range of seeds. The range is cut into shards of
+``shard_size`` consecutive seeds, and each shard is one task for a process
+pool. A worker generates every maze of its shard, solves it and streams the
+records straight into that shard's output file. Only a small summary goes
+back to the parent, so throughput scales with the number of workers. At most
+``in_flight`` shards are queued at a time, which bounds memory however long
+the run is.
+
+Each shard is written to a temporary file and renamed into place once
+complete. A shard file that exists is therefore whole, and a run that was
+interrupted (or extended with a larger ``--count``) resumes by skipping the
+shards already on disk. ``manifest.json`` records the settings of the run so
+that a resume with different settings is refused instead of mixing datasets.
+
+    python dataset_pipeline.py out/ --size 41 41 --count 1000000 --workers 8
+    python dataset_pipeline.py out/ --size 101 101 --format bin --solver solve_bfs
+
+Output formats, one file per shard (``shard-000000.jsonl`` / ``.bin``):
+
+    jsonl  one JSON object per maze: seed, generator, width, height, start,
+           end, ``cells`` (the bit-packed body of maze_file, base64),
+           ``path`` ([[x, y], ...] or null) and ``explored`` (cell count)
+    bin    per maze, a complete maze_file record (header + packed body)
+           followed by the path: u32 length, then u32 flat cell indices
+           (little-endian; length 0 when there is no path)
+
+``read_shard`` reads either format back as ``(grid, info, path, explored)``.
+Output is deterministic: the same settings always produce the same bytes.
+"""
+
+import argparse
+import base64
+import inspect
+import json
+import multiprocessing
+import os
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from maze_algorithms import GENERATORS, MazeSolver
+from maze_grid import MazeGrid
+import maze_file
+
+
+FORMATS = ('jsonl', 'bin')
+MANIFEST = 'manifest.json'
+_U32 = struct.Struct('<I')
+
+
+def shard_path(directory, shard, fmt):
+    return os.path.join(directory, f'shard-{shard:06d}.{fmt}')
+
+
+def _check_solver(name):
+    # Single-query solve_* methods only (solve_batch needs its queries)
+    method = getattr(MazeSolver, name, None) if name.startswith('solve_') else None
+    if method is None:
+        raise ValueError(f"unknown solver {name!r}")
+    params = list(inspect.signature(method).parameters.values())[1:]
+    if any(p.default is p.empty for p in params):
+        raise ValueError(f"{name} needs arguments and cannot run in a batch")
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# RECORDS
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _write_jsonl(out, grid, seed, generator, solver, path, explored):
+    record = {'seed': seed, 'generator': generator,
+              'width': grid.width, 'height': grid.height,
+              'start': solver.start, 'end': solver.end,
+              'cells': base64.b64encode(maze_file.pack(grid.cells)).decode('ascii'),
+              'path': path, 'explored': explored}
+    out.write(json.dumps(record, separators=(',', ':')).encode('ascii') + b'\n')
+
+
+def _write_bin(out, grid, seed, generator, solver, path, explored):
+    maze_file.write_rows(out, grid.width, grid.height, [grid.cells], seed=seed,
+                         generator=generator, start=solver.start, end=solver.end)
+    w = grid.width
+    cells = [y * w + x for x, y in path] if path else []
+    out.write(_U32.pack(len(cells)))
+    out.write(struct.pack(f'<{len(cells)}I', *cells))
+
+
+_WRITERS = {'jsonl': _write_jsonl, 'bin': _write_bin}
+
+
+def read_shard(path):
+    """Yield ``(grid, info, path, explored)`` for every maze of a shard file.
+
+    ``info`` is a ``maze_file.MazeInfo``; ``path`` is a list of ``(x, y)``
+    cells or None. ``explored`` is not stored in binary shards (None).
+    """
+    if path.endswith('.jsonl'):
+        with open(path, 'rb') as f:
+            for line in f:
+                r = json.loads(line)
+                w, h = r['width'], r['height']
+                cells = maze_file.unpack(base64.b64decode(r['cells']), w * h)
+                info = maze_file.MazeInfo(w, h, r['seed'], r['generator'],
+                                          tuple(r['start']), tuple(r['end']))
+                cells_path = None if r['path'] is None else [tuple(c) for c in r['path']]
+                yield MazeGrid(w, h, cells), info, cells_path, r['explored']
+        return
+    with open(path, 'rb') as f:
+        data = f.read()
+    offset = 0
+    while offset < len(data):
+        info = maze_file.read_info(data[offset:])
+        count = info.width * info.height
+        body = offset + maze_file.HEADER_SIZE
+        offset = body + (count + 7) // 8
+        cells = maze_file.unpack(data[body:offset], count)
+        n, = _U32.unpack_from(data, offset)
+        flat = struct.unpack_from(f'<{n}I', data, offset + 4)
+        offset += 4 + 4 * n
+        w = info.width
+        yield MazeGrid(w, info.height, cells), info, [(i % w, i // w) for i in flat] or None, None
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# WORKERS
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _run_shard(directory, shard, seeds, width, height, generator, solver, fmt):
+    """Generate and solve ``seeds`` into one shard file; returns a summary."""
+    t0 = time.perf_counter()
+    cls, write = GENERATORS[generator], _WRITERS[fmt]
+    final = shard_path(directory, shard, fmt)
+    tmp = final + '.tmp'
+    solved = 0
+    with open(tmp, 'wb', buffering=1 << 20) as out:
+        for seed in seeds:
+            grid = cls(width, height, seed).generate()
+            s = MazeSolver(grid)
+            path, explored = getattr(s, solver)()
+            solved += path is not None
+            write(out, grid, seed, generator, s, path, len(explored))
+    os.replace(tmp, final)
+    return shard, len(seeds), solved, time.perf_counter() - t0
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# PIPELINE
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _check_manifest(directory, settings):
+    """Check the run's settings against an earlier run's in ``directory``.
+
+    Only ``count`` may change between runs, and only grow. Returns the
+    earlier settings (None for a new dataset).
+    """
+    path = os.path.join(directory, MANIFEST)
+    try:
+        with open(path) as f:
+            previous = json.load(f)
+    except FileNotFoundError:
+        previous = None
+    if previous is not None:
+        fixed = {k: v for k, v in settings.items() if k != 'count'}
+        if {k: previous.get(k) for k in fixed} != fixed:
+            raise ValueError(f"{directory} holds a dataset with different settings: {previous}")
+        if settings['count'] < previous['count']:
+            raise ValueError(f"{directory} already holds {previous['count']} mazes; count may only grow")
+    return previous
+
+
+def _write_manifest(directory, settings):
+    # Renamed into place like the shards, so it is never seen half written
+    path = os.path.join(directory, MANIFEST)
+    with open(path + '.tmp', 'w') as f:
+        json.dump(settings, f, indent=2)
+        f.write('\n')
+    os.replace(path + '.tmp', path)
+
+
+def run(directory, count, width, height, first_seed=0, generator='backtracker',
+        solver='solve_astar', fmt='jsonl', shard_size=1000, workers=None,
+        in_flight=None, log=None):
+    """Produce ``count`` solved mazes (seeds ``first_seed`` onward) in ``directory``.
+
+    workers: pool size (default: one per CPU)
+    in_flight: most shards queued or running at once (default: 2 per worker)
+    log: called with each finished shard's summary dict
+
+    Shards already on disk are skipped. Returns the summaries of the shards
+    made by this call.
+    """
+    if generator not in GENERATORS:
+        raise ValueError(f"unknown generator {generator!r}, expected one of {sorted(GENERATORS)}")
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown format {fmt!r}, expected one of {FORMATS}")
+    _check_solver(solver)
+    last_seed = first_seed + count - 1
+    if fmt == 'bin' and count and not (maze_file.storable_seed(first_seed) and maze_file.storable_seed(last_seed)
+                                       and not first_seed <= -1 <= last_seed):
+        raise ValueError("binary shards store 64-bit seeds other than -1")
+    os.makedirs(directory, exist_ok=True)
+    settings = {'first_seed': first_seed, 'count': count, 'width': width, 'height': height,
+                'generator': generator, 'solver': solver, 'format': fmt, 'shard_size': shard_size}
+    previous = _check_manifest(directory, settings)
+
+    shards = (count + shard_size - 1) // shard_size
+    if previous is not None and previous['count'] != count and previous['count'] % shard_size:
+        # The earlier run's last shard was cut short by its count; redo it.
+        # It goes before the manifest is updated, so the two never disagree.
+        stale = shard_path(directory, previous['count'] // shard_size, fmt)
+        if os.path.exists(stale):
+            os.remove(stale)
+    _write_manifest(directory, settings)
+    todo = [k for k in range(shards) if not os.path.exists(shard_path(directory, k, fmt))]
+    workers = workers or os.cpu_count() or 1
+    in_flight = max(1, in_flight or 2 * workers)
+    summaries = []
+    # 'spawn' for the same reason as ParallelSolver: workers share no state with the caller
+    context = multiprocessing.get_context('spawn')
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+    pending = set()
+    try:
+        todo.reverse()
+        while todo or pending:
+            while todo and len(pending) < in_flight:
+                k = todo.pop()
+                first = first_seed + k * shard_size
+                seeds = range(first, min(first + shard_size, first_seed + count))
+                pending.add(pool.submit(_run_shard, directory, k, seeds, width, height,
+                                        generator, solver, fmt))
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                shard, mazes, solved, seconds = future.result()
+                summary = {'shard': shard, 'mazes': mazes, 'solved': solved, 'seconds': seconds}
+                summaries.append(summary)
+                if log:
+                    log(summary)
+    finally:
+        # Executor.shutdown(cancel_futures=True) needs Python 3.9
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
+    return summaries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate and solve mazes in parallel into sharded dataset files.")
+    parser.add_argument('directory', help="output directory (resumed if it already holds shards)")
+    parser.add_argument('--size', type=int, nargs=2, metavar=('W', 'H'), default=[41, 41],
+                        help="odd maze width and height (default: 41 41)")
+    parser.add_argument('--count', type=int, default=10000, help="number of mazes")
+    parser.add_argument('--first-seed', type=int, default=0)
+    parser.add_argument('--generator', choices=sorted(GENERATORS), default='backtracker')
+    parser.add_argument('--solver', default='solve_astar', help="MazeSolver method (default: solve_astar)")
+    parser.add_argument('--format', choices=FORMATS, default='jsonl')
+    parser.add_argument('--shard-size', type=int, default=1000, help="mazes per output file")
+    parser.add_argument('--workers', type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument('--in-flight', type=int, help="shards queued at once (default: 2 per worker)")
+    args = parser.parse_args(argv)
+    width, height = args.size
+    if width < 5 or height < 5 or width % 2 == 0 or height % 2 == 0:
+        parser.error("sizes must be odd and at least 5")
+    if args.count < 0 or args.shard_size < 1:
+        parser.error("count must be >= 0 and shard size >= 1")
+
+    t0 = time.perf_counter()
+    total = 0
+    shards = (args.count + args.shard_size - 1) // args.shard_size
+
+    def progress(s):
+        nonlocal total
+        total += s['mazes']
+        rate = total / max(time.perf_counter() - t0, 1e-9)
+        print(f"shard {s['shard']:>6}/{shards}  {s['mazes']} mazes  {s['solved']} solved  "
+              f"{s['seconds']:.2f}s  ({rate:.0f} mazes/s overall)", file=sys.stderr)
+
+    try:
+        run(args.directory, args.count, width, height, args.first_seed, args.generator,
+            args.solver, args.format, args.shard_size, args.workers, args.in_flight, log=progress)
+    except ValueError as e:
+        parser.error(str(e))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
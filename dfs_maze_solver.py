@@ -1,5 +1,11 @@
 # DFS maze.py
 
+from array import array
+
+from maze_grid import MazeGrid, CharGridView
+from neighbor_table import NeighborTable, UP, DOWN, LEFT, RIGHT
+
+
 class DFSMazeSolver:
     def __init__(self, maze):
         """
@@ -8,50 +14,97 @@ class DFSMazeSolver:
             - maze.grid  -> 2D list of characters
             - maze.rows  -> number of rows
             - maze.cols  -> number of columns
+        A MazeGrid is also accepted; it is read in place through its
+        character view, with 'S'/'E' at the default corners.
         """
+        if isinstance(maze, MazeGrid):
+            maze = maze.char_view()
         self.maze = maze
         self.grid = maze.grid
         self.rows = maze.rows
         self.cols = maze.cols
-
-    def solve(self):
+        # Walls come from the shared neighbor table of the viewed MazeGrid, or
+        # of a compact copy packed once from a character grid
+        if isinstance(maze, CharGridView):
+            cells = maze.maze
+        else:
+            cells = MazeGrid.from_rows(maze.grid, wall_char='#')
+        table = NeighborTable.of(cells)
+        self.mask = table.mask
+        # Movement directions: Up, Down, Left, Right, as flat offsets per mask
+        self.steps = table.steps((UP, DOWN, LEFT, RIGHT))
+
+    def solve(self, budget=None, metrics=None):
         """
         Solves the maze using DFS.
+        Args:
+            budget -> optional search_budget.Budget, checked every
+                      budget.every expansions
+            metrics -> optional solver_metrics.SolverMetrics hook
         Returns:
-            path -> list of (row, col) from start 'S' to end 'E'
+            path -> list of (row, col) from start 'S' to end 'E'; if the
+                    budget runs out first, only up to the reached cell
+                    closest to 'E'
         """
 
         start, goal = self._find_start_and_goal()
-
-        stack = [start]                 # DFS stack
-        visited = set([start])          # Visited cells
-        parent = {start: None}          # Parent tracking for path reconstruction
-
-        # Movement directions: Up, Down, Left, Right
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        mask, steps, cols = self.mask, self.steps, self.cols
+        # Cells are flat indices (row * cols + col); tuples only in the path
+        s, t = start[0] * cols + start[1], goal[0] * cols + goal[1]
+
+        stack = [s]                                     # DFS stack
+        visited = bytearray(self.rows * cols)           # Visited cells
+        visited[s] = 1
+        parent = array('i', [-1]) * len(visited)        # Parent tracking for path reconstruction
+        left = -1 if budget is None else 0   # Expansions until the next budget check
+        if metrics is not None:
+            metrics.push(1)
 
         while stack:
-            r, c = stack.pop()
+            if not left:
+                left = budget.grant()
+                if not left:
+                    gr, gc = goal
+                    reached = (i for i, v in enumerate(visited) if v)
+                    nearest = min(reached, key=lambda i: abs(i // cols - gr) + abs(i % cols - gc))
+                    return self._reconstruct_path(parent, nearest)
+            left -= 1
+            current = stack.pop()
+            if metrics is not None:
+                metrics.pop()
 
             # Stop when goal is reached
-            if (r, c) == goal:
+            if current == t:
                 break
 
-            for dr, dc in directions:
-                nr, nc = r + dr, c + dc
+            nbrs = steps[mask[current]]       # Open neighbors only
+            if metrics is not None:
+                metrics.expand(len(nbrs))
+            for d in nbrs:
+                n = current + d
 
-                if self._is_valid_move(nr, nc, visited):
-                    visited.add((nr, nc))
-                    parent[(nr, nc)] = (r, c)
-                    stack.append((nr, nc))
+                if not visited[n]:
+                    visited[n] = 1
+                    parent[n] = current
+                    stack.append(n)
+                    if metrics is not None:
+                        metrics.push(len(stack))
+                elif metrics is not None:
+                    metrics.duplicate()
 
-        return self._reconstruct_path(parent, goal)
+        return self._reconstruct_path(parent, t)
 
     # -------------------------------------------------
     # Helper functions
     # -------------------------------------------------
 
     def _find_start_and_goal(self):
+        # Views that know their endpoints spare us a scan of the whole grid
+        start = getattr(self.maze, 'start', None)
+        goal = getattr(self.maze, 'end', None)
+        if start is not None and goal is not None:
+            return start, goal
+
         start = goal = None
 
         for r in range(self.rows):
@@ -66,21 +119,13 @@ class DFSMazeSolver:
 
         return start, goal
 
-    def _is_valid_move(self, r, c, visited):
-        return (
-            0 <= r < self.rows and
-            0 <= c < self.cols and
-            self.grid[r][c] != '#' and
-            (r, c) not in visited
-        )
-
     def _reconstruct_path(self, parent, goal):
         path = []
         cell = goal
 
-        while cell is not None:
-            path.append(cell)
-            cell = parent.get(cell)
+        while cell != -1:
+            path.append(divmod(cell, self.cols))
+            cell = parent[cell]
 
         path.reverse()
         return path
@@ -0,0 +1,151 @@
+"""
+Precomputed distance field toward a fixed goal.
+
+One reverse BFS from the goal stores, for every cell, its distance to the goal
+and the next cell on a shortest path (``next_hop``), each in a flat
+``array('i')``. After that, a path from any start is read off by following
+next hops: O(path length) per query with no search at all. This suits batch
+workloads that solve the same maze toward one exit from many starts.
+
+A field costs two ints per cell, so ``DistanceField.of`` keeps only the
+``CACHED_FIELDS`` most recently used goals of each grid.
+"""
+
+from array import array
+from collections import OrderedDict, deque
+import threading
+
+from maze_grid import OPEN
+from neighbor_table import NeighborTable
+
+
+UNREACHABLE = -1
+CACHED_FIELDS = 4   # Per grid, least recently used goal evicted first
+
+_lock = threading.Lock()   # Guards every grid's field cache
+
+
+class DistanceField:
+    def __init__(self, grid, goal, hops=True):
+        """
+        grid: MazeGrid
+        goal: (x, y) cell every distance is measured to
+        hops: also record ``next_hop`` (None otherwise), which path queries need
+        """
+        self.grid = grid
+        self.goal = goal
+        cells = grid.cells
+        size = len(cells)
+        self.dist = dist = array('i', [UNREACHABLE]) * size
+        self.next_hop = next_hop = array('i', [UNREACHABLE]) * size if hops else None
+        self.max_distance = 0
+
+        g = grid.index(*goal)
+        if not (0 <= g < size) or cells[g] != OPEN:
+            return
+        dist[g] = 0
+        table = NeighborTable.of(grid)
+        mask, steps = table.mask, table.steps()
+        queue = deque([g])
+        while queue:
+            i = queue.popleft()
+            d = dist[i] + 1
+            for step in steps[mask[i]]:
+                n = i + step
+                if dist[n] == UNREACHABLE:
+                    dist[n] = d
+                    if hops:
+                        next_hop[n] = i
+                    queue.append(n)
+        self.max_distance = d - 1
+
+    @classmethod
+    def of(cls, grid, goal):
+        """The field toward ``goal``, reused while among the grid's recent goals."""
+        goal = tuple(goal)
+        fields = grid.derived('distance_fields', lambda g: OrderedDict())
+        with _lock:
+            field = fields.get(goal)
+            if field is not None:
+                fields.move_to_end(goal)
+                return field
+        field = cls(grid, goal)
+        with _lock:
+            fields[goal] = field
+            while len(fields) > CACHED_FIELDS:
+                fields.popitem(last=False)
+        return field
+
+    def distance(self, cell):
+        """Steps from ``cell`` to the goal, or ``UNREACHABLE``."""
+        x, y = cell
+        if not (0 <= x < self.grid.width and 0 <= y < self.grid.height):
+            return UNREACHABLE
+        return self.dist[self.grid.index(x, y)]
+
+    def path_from(self, start):
+        """Shortest path ``start .. goal`` as (x, y) cells, or None if unreachable."""
+        if self.distance(start) == UNREACHABLE:
+            return None
+        to_xy = self.grid.coords
+        next_hop = self.next_hop
+        i = self.grid.index(*start)
+        path = [start]
+        for _ in range(self.dist[i]):
+            i = next_hop[i]
+            path.append(to_xy(i))
+        return path
+
+    def paths_from(self, starts):
+        """Yield ``path_from(start)`` for each start, sharing the one field."""
+        for start in starts:
+            yield self.path_from(start)
+
+
+def tests():
+    import random
+    from maze_algorithms import GENERATORS, MazeSolver
+
+    print("Running Distance Field Tests...\n")
+
+    # TEST CASE 1: Paths match BFS on every generator
+    for name, cls in sorted(GENERATORS.items()):
+        for seed in range(3):
+            grid = cls(21, 15, seed).generate()
+            rng = random.Random(seed)
+            open_cells = [grid.coords(i) for i in range(len(grid.cells)) if grid.cells[i] == OPEN]
+            goal = rng.choice(open_cells)
+            field = DistanceField(grid, goal)
+            for start in rng.sample(open_cells, 10):
+                path = field.path_from(start)
+                expected, _ = MazeSolver(grid, start=start, end=goal).solve_bfs()
+                assert path is not None and len(path) == len(expected), \
+                    f"Test 1 Failed: {name} seed {seed} path length differs from BFS"
+                assert path[0] == start and path[-1] == goal, "Test 1 Failed: Wrong path endpoints"
+                assert all(abs(ax - bx) + abs(ay - by) == 1 and grid.is_open(bx, by)
+                           for (ax, ay), (bx, by) in zip(path, path[1:])), "Test 1 Failed: Path is not a walk"
+    print("Test 1 Passed: Field paths are as short as BFS paths.")
+
+    # TEST CASE 2: A walled goal reaches nothing
+    grid = GENERATORS['backtracker'](11, 11, 0).generate()
+    field = DistanceField(grid, (0, 0))
+    assert field.path_from((1, 1)) is None, "Test 2 Failed: Path to a wall"
+    assert field.distance((-1, 5)) == UNREACHABLE, "Test 2 Failed: Off-grid cell has a distance"
+    assert DistanceField(grid, (1, 1), hops=False).next_hop is None, "Test 2 Failed: Hops kept without hops"
+    print("Test 2 Passed: Unreachable cells have no path.")
+
+    # TEST CASE 3: The per-grid cache keeps only the most recent goals
+    goals = [(x, 1) for x in range(1, 2 * CACHED_FIELDS + 3, 2)]
+    fields = [DistanceField.of(grid, goal) for goal in goals[:CACHED_FIELDS]]
+    assert DistanceField.of(grid, goals[0]) is fields[0], "Test 3 Failed: Cached field rebuilt"
+    DistanceField.of(grid, goals[CACHED_FIELDS])    # Evicts goals[1], now the least recent
+    assert len(grid.derived('distance_fields', None)) == CACHED_FIELDS, "Test 3 Failed: Cache not bounded"
+    assert DistanceField.of(grid, goals[0]) is fields[0], "Test 3 Failed: Recently used field evicted"
+    assert DistanceField.of(grid, goals[1]) is not fields[1], "Test 3 Failed: Least recently used field kept"
+    print("Test 3 Passed: Least recently used goals are evicted.")
+
+    print("\nAll tests passed successfully!")
+
+
+if __name__ == "__main__":
+    tests()
@@ -0,0 +1,161 @@
+"""
+Row-streaming maze generation with Eller's algorithm.
+
+Eller's algorithm builds a perfect maze one row of rooms at a time, keeping
+only the set (connected component) label of each room in the current row.
+``EllerGenerator.rows`` therefore yields the maze one cell row at a time in
+O(width) memory, whatever the height, so very tall mazes can be written
+straight to a file or pipe without ever existing in memory as a whole:
+
+    python eller_generator.py 201 1000001 --seed 7 > tall.maze
+    python eller_generator.py 41 41 --format text | less
+"""
+
+import argparse
+import random
+import sys
+
+from maze_grid import MazeGrid, OPEN, WALL
+import maze_file
+
+
+class EllerGenerator:
+    name = 'eller'
+
+    def __init__(self, width, height, seed=None):
+        """
+        width, height: odd maze dimensions in cells
+        seed: makes the maze reproducible; a random one is drawn when omitted
+        """
+        self.width = width
+        self.height = height
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+
+    def rows(self):
+        """Yield the maze as ``height`` bytearrays of ``width`` cells, top to bottom."""
+        w, h = self.width, self.height
+        cols, room_rows = (w - 1) // 2, (h - 1) // 2
+        rng = random.Random(self.seed)
+        yield bytearray([WALL]) * w
+        if cols == 0 or room_rows == 0:
+            for _ in range(h - 1):
+                yield bytearray([WALL]) * w
+            return
+
+        labels = [0] * cols     # Set label of each room in the current row
+        fresh = 0               # 0 marks a room that is not in any set yet
+        for j in range(room_rows):
+            last = j == room_rows - 1
+            members = {}
+            for i in range(cols):
+                if not labels[i]:
+                    fresh += 1
+                    labels[i] = fresh
+                members.setdefault(labels[i], []).append(i)
+
+            # Join horizontal neighbours from different sets at random; the
+            # last row joins all of them so the maze ends up connected
+            row = bytearray([WALL]) * w
+            row[1:2 * cols:2] = bytes(cols)
+            joins = rng.getrandbits(8 * cols).to_bytes(cols, 'little')  # One byte per room
+            for i in range(cols - 1):
+                a, b = labels[i], labels[i + 1]
+                if a != b and (last or joins[i] & 1):
+                    row[2 * i + 2] = OPEN
+                    # Relabel the smaller set so merging stays cheap
+                    if len(members[a]) < len(members[b]):
+                        a, b = b, a
+                    for k in members[b]:
+                        labels[k] = a
+                    members[a].extend(members.pop(b))
+            yield row
+
+            below = bytearray([WALL]) * w
+            if not last:
+                # Every set carries on downward through at least one room
+                drops = rng.getrandbits(8 * cols).to_bytes(cols, 'little')
+                carried = [0] * cols
+                for label, cells in members.items():
+                    down = [i for i in cells if drops[i] & 1] or [rng.choice(cells)]
+                    for i in down:
+                        carried[i] = label
+                        below[2 * i + 1] = OPEN
+                labels = carried
+            yield below
+
+        for _ in range(h - 2 * room_rows - 1):
+            yield bytearray([WALL]) * w
+
+    def generate(self):
+        return MazeGrid(self.width, self.height, bytearray(b''.join(self.rows())))
+
+
+def write_text(out, rows):
+    """Write rows in the ``'#'`` wall / ``' '`` open text convention."""
+    table = bytes.maketrans(bytes([OPEN, WALL]), b' #')
+    for row in rows:
+        out.write(bytes(row).translate(table) + b'\n')
+
+
+def tests():
+    # The command line writes mazes, so run these with
+    # python -c "import eller_generator; eller_generator.tests()"
+    import io
+    from maze_grid import is_perfect
+
+    print("Running Eller Generator Tests...\n")
+
+    # TEST CASE 1: Every maze is perfect
+    for width, height in ((5, 5), (21, 15), (41, 61), (3, 31)):
+        for seed in range(5):
+            maze = EllerGenerator(width, height, seed).generate()
+            assert is_perfect(maze), f"Test 1 Failed: {width}x{height} seed {seed} is not perfect"
+            assert maze.is_open(1, 1) and maze.is_open(width - 2, height - 2), "Test 1 Failed: Corners walled"
+    print("Test 1 Passed: Eller mazes are perfect.")
+
+    # TEST CASE 2: A seed always gives the same maze
+    first = EllerGenerator(31, 21, 7).generate()
+    assert EllerGenerator(31, 21, 7).generate().cells == first.cells, "Test 2 Failed: Not reproducible"
+    assert EllerGenerator(31, 21, 8).generate().cells != first.cells, "Test 2 Failed: Seed ignored"
+    print("Test 2 Passed: Seeds are reproducible.")
+
+    # TEST CASE 3: Streamed rows write the same file as the whole maze
+    gen = EllerGenerator(31, 21, 7)
+    rows = list(gen.rows())
+    assert len(rows) == 21 and all(len(row) == 31 for row in rows), "Test 3 Failed: Wrong row shape"
+    streamed, whole = io.BytesIO(), io.BytesIO()
+    maze_file.write_rows(streamed, gen.width, gen.height, gen.rows(), seed=gen.seed, generator=gen.name)
+    maze_file.write_rows(whole, first.width, first.height, [first.cells], seed=7, generator='eller')
+    assert streamed.getvalue() == whole.getvalue(), "Test 3 Failed: Streamed file differs"
+    print("Test 3 Passed: Row streaming matches generate().")
+
+    print("\nAll tests passed successfully!")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream an Eller's-algorithm maze to stdout.")
+    parser.add_argument('width', type=int)
+    parser.add_argument('height', type=int)
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--format', choices=['maze', 'text'], default='maze',
+                        help="bit-packed .maze file (default) or '#'/' ' text rows")
+    args = parser.parse_args(argv)
+    if args.width < 3 or args.height < 3:
+        parser.error("width and height must be at least 3")
+    if args.format == 'maze' and args.seed is not None and not maze_file.storable_seed(args.seed):
+        parser.error("a .maze file stores 64-bit seeds other than -1")
+
+    gen = EllerGenerator(args.width, args.height, args.seed)
+    out = sys.stdout.buffer
+    try:
+        if args.format == 'text':
+            write_text(out, gen.rows())
+        else:
+            maze_file.write_rows(out, gen.width, gen.height, gen.rows(), seed=gen.seed, generator=gen.name)
+        out.flush()
+    except BrokenPipeError:
+        pass    # Reader went away (e.g. `| head`)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
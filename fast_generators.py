@@ -0,0 +1,183 @@
+"""
+Vectorized maze generators: binary tree and sidewinder.
+
+Unlike the recursive backtracker, both algorithms make every carving choice
+independently per cell (binary tree) or within one row (sidewinder), so the
+whole grid can be carved with a handful of NumPy array operations instead of
+a Python loop per cell. NumPy is optional: without it the same algorithms run
+as plain Python loops.
+
+Rooms sit on odd coordinates like the backtracker's; room ``(i, j)`` (column,
+row) is cell ``(2i + 1, 2j + 1)``. All random choices are drawn as raw bytes
+from ``random.Random(seed)``, so a seed gives the same maze with or without
+NumPy and the maze cache stays valid across environments.
+"""
+
+import random
+
+from maze_grid import MazeGrid, OPEN, WALL
+
+try:
+    import numpy as np
+except ImportError:  # Optional: fall back to the pure-Python loops
+    np = None
+
+
+class _GridGenerator:
+    name = None
+
+    def __init__(self, width, height, seed=None):
+        """
+        width, height: odd maze dimensions in cells
+        seed: makes the maze reproducible; a random one is drawn when omitted
+        """
+        self.width = width
+        self.height = height
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.cols = (width - 1) // 2
+        self.rows = (height - 1) // 2
+
+    def _random_bytes(self, per_room):
+        """``per_room`` random bytes for every room, seeded by ``self.seed``."""
+        n = self.rows * self.cols * per_room
+        return random.Random(self.seed).getrandbits(8 * n).to_bytes(n, 'little') if n else b''
+
+    def generate(self):
+        w, h = self.width, self.height
+        if self.rows == 0 or self.cols == 0:
+            return MazeGrid(w, h)
+        if np is not None:
+            cells = np.full((h, w), WALL, dtype=np.uint8)
+            cells[1:2 * self.rows:2, 1:2 * self.cols:2] = OPEN
+            self._carve_array(cells)
+            maze = MazeGrid(w, h, bytearray(cells.tobytes()))
+        else:
+            maze = MazeGrid(w, h)
+            for j in range(self.rows):
+                y = (2 * j + 1) * w
+                maze.cells[y + 1:y + 2 * self.cols:2] = bytes(self.cols)
+            self._carve_loops(maze.cells)
+        maze.cells[w + 1] = OPEN
+        maze.cells[(h - 2) * w + w - 2] = OPEN
+        return maze
+
+
+class BinaryTreeGenerator(_GridGenerator):
+    """Each room opens north or west at random (forced west on the top row
+    and north on the left column), giving a perfect maze with long corridors
+    along the top and left edges."""
+
+    name = 'binary_tree'
+
+    def _carve_array(self, cells):
+        rows, cols = self.rows, self.cols
+        north = (np.frombuffer(self._random_bytes(1), dtype=np.uint8).reshape(rows, cols) & 1).astype(bool)
+        north[:, 0] = True
+        north[0, :] = False
+        west = ~north
+        west[0, 0] = False  # Room (0, 0) has nowhere to go
+        # Wall cells between a room and its north / west neighbour
+        cells[0:2 * rows:2, 1:2 * cols:2][north] = OPEN
+        cells[1:2 * rows:2, 0:2 * cols:2][west] = OPEN
+
+    def _carve_loops(self, cells):
+        w, cols = self.width, self.cols
+        bits = self._random_bytes(1)
+        for j in range(self.rows):
+            y = 2 * j + 1
+            for i in range(cols):
+                if j == 0 and i == 0:
+                    continue
+                x = 2 * i + 1
+                if i == 0 or (j > 0 and bits[j * cols + i] & 1):
+                    cells[(y - 1) * w + x] = OPEN
+                else:
+                    cells[y * w + x - 1] = OPEN
+
+
+class SidewinderGenerator(_GridGenerator):
+    """Rooms in a row are joined eastward into runs; closing a run opens one
+    random room of it to the north. The top row is a single corridor."""
+
+    name = 'sidewinder'
+
+    def _carve_array(self, cells):
+        rows, cols = self.rows, self.cols
+        data = np.frombuffer(self._random_bytes(3), dtype=np.uint8).reshape(rows, cols, 3)
+        close = (data[:, :, 0] & 1).astype(bool)
+        close[:, -1] = True
+        close[0, :] = False
+        pick16 = data[:, :, 1].astype(np.int64) | (data[:, :, 2].astype(np.int64) << 8)
+        # Open the wall east of every room whose run continues
+        east = ~close
+        east[:, -1] = False
+        cells[1:2 * rows:2, 2:2 * cols + 1:2][east] = OPEN
+        # Each run starts right after the previous close in its row
+        idx = np.arange(cols)
+        after_close = np.zeros((rows, cols), dtype=np.int64)
+        after_close[:, 1:] = np.where(close[:, :-1], idx[1:], 0)
+        start = np.maximum.accumulate(after_close, axis=1)
+        # Where a run closes, open north from a random room of the run
+        j, e = np.nonzero(close)
+        s = start[j, e]
+        pick = s + ((pick16[j, e] * (e - s + 1)) >> 16)
+        cells[2 * j, 2 * pick + 1] = OPEN
+
+    def _carve_loops(self, cells):
+        w, cols = self.width, self.cols
+        data = self._random_bytes(3)
+        for j in range(self.rows):
+            y = 2 * j + 1
+            start = 0
+            for i in range(cols):
+                k = 3 * (j * cols + i)
+                if j > 0 and (i == cols - 1 or data[k] & 1):
+                    pick = start + (((data[k + 1] | data[k + 2] << 8) * (i - start + 1)) >> 16)
+                    cells[(y - 1) * w + 2 * pick + 1] = OPEN
+                    start = i + 1
+                elif i < cols - 1:
+                    cells[y * w + 2 * i + 2] = OPEN
+
+
+def tests():
+    global np
+    from maze_grid import is_perfect
+
+    print("Running Fast Generator Tests...\n")
+
+    # TEST CASE 1: Every maze is perfect
+    for cls in (BinaryTreeGenerator, SidewinderGenerator):
+        for width, height in ((5, 5), (21, 15), (41, 61)):
+            for seed in range(5):
+                maze = cls(width, height, seed).generate()
+                assert is_perfect(maze), f"Test 1 Failed: {cls.name} {width}x{height} seed {seed} is not perfect"
+                assert maze.is_open(1, 1) and maze.is_open(width - 2, height - 2), "Test 1 Failed: Corners walled"
+    print("Test 1 Passed: Binary tree and sidewinder mazes are perfect.")
+
+    # TEST CASE 2: A seed always gives the same maze
+    for cls in (BinaryTreeGenerator, SidewinderGenerator):
+        first = cls(31, 21, 7).generate()
+        assert cls(31, 21, 7).generate().cells == first.cells, f"Test 2 Failed: {cls.name} is not reproducible"
+        assert cls(31, 21, 8).generate().cells != first.cells, f"Test 2 Failed: {cls.name} ignores the seed"
+    print("Test 2 Passed: Seeds are reproducible.")
+
+    # TEST CASE 3: NumPy and the pure-Python loops carve the same maze
+    if np is None:
+        print("Test 3 Skipped: NumPy is not installed.")
+    else:
+        vectorized = [cls(41, 31, seed).generate().cells
+                      for cls in (BinaryTreeGenerator, SidewinderGenerator) for seed in range(5)]
+        saved, np = np, None
+        try:
+            loops = [cls(41, 31, seed).generate().cells
+                     for cls in (BinaryTreeGenerator, SidewinderGenerator) for seed in range(5)]
+        finally:
+            np = saved
+        assert vectorized == loops, "Test 3 Failed: NumPy and loops disagree"
+        print("Test 3 Passed: NumPy and loops carve the same mazes.")
+
+    print("\nAll tests passed successfully!")
+
+
+if __name__ == "__main__":
+    tests()
@@ -0,0 +1,80 @@
+"""
+Adaptive frame scheduling for the canvas animations.
+
+``FrameScheduler`` drives every running animation from a single timer. Each
+frame it measures how long the previous frame actually took and hands every
+task the elapsed wall time, so a task paints ``rate * elapsed`` cells rather
+than a fixed count: when painting is slow the frames get further apart and
+each one paints more, and intermediate frames the UI could not keep up with
+are simply dropped instead of queuing behind each other. The frame interval
+itself stretches to the measured paint time so the Tk event loop always gets
+time back for input between frames.
+"""
+
+import time
+import traceback
+
+
+class FrameScheduler:
+    def __init__(self, after, on_fps=None, fps=60):
+        """
+        after: Tk-style ``after(ms, callback)``
+        on_fps: called with the achieved frames per second about twice a second
+        fps: target frame rate
+        """
+        self.after = after
+        self.on_fps = on_fps
+        self.interval = 1.0 / fps
+        self.tasks = []
+        self.paint_time = 0.0       # Moving average of seconds spent per frame
+        self.fps = 0.0
+        self._running = False
+        self._last = 0.0
+        self._frames = 0
+        self._window = 0.0
+
+    def add(self, task):
+        """Run ``task(elapsed_seconds)`` every frame until it returns True."""
+        self.tasks.append(task)
+        if not self._running:
+            self._running = True
+            self._last = time.perf_counter()
+            self._frames, self._window = 0, self._last
+            self.after(1, self._tick)
+
+    def _tick(self):
+        now = time.perf_counter()
+        # Elapsed time since the previous frame, capped so a stall (window
+        # drag, breakpoint) does not make everything jump to the end at once
+        elapsed = min(now - self._last, 1.0)
+        self._last = now
+        spent = 0.0
+        try:
+            self.tasks = [task for task in list(self.tasks) if self._run(task, elapsed)]
+            spent = time.perf_counter() - now
+            self.paint_time += (spent - self.paint_time) * 0.2
+
+            self._frames += 1
+            if now - self._window >= 0.5:
+                self.fps = self._frames / (now - self._window)
+                self._frames, self._window = 0, now
+                if self.on_fps:
+                    self.on_fps(self.fps)
+        finally:
+            # Whatever went wrong above, the timer must keep (or stop) running
+            # consistently, or add() would never restart it
+            if self.tasks:
+                # Leave at least as much idle time as a frame costs to paint
+                delay = max(self.interval - spent, self.paint_time)
+                self.after(max(1, int(delay * 1000)), self._tick)
+            else:
+                self._running = False
+
+    @staticmethod
+    def _run(task, elapsed):
+        """Whether ``task`` keeps running; one that raises is reported and dropped."""
+        try:
+            return not task(elapsed)
+        except Exception:
+            traceback.print_exc()
+            return False
@@ -0,0 +1,281 @@
+"""
+Corridor-compressed junction graph of a maze.
+
+Perfect mazes are mostly one-cell-wide corridors. ``JunctionGraph`` keeps only
+the junctions and dead ends (open cells whose open degree is not 2) as nodes
+and collapses every corridor between two of them into a single edge weighted
+by its length. Searches run on that much smaller graph and the result is
+expanded back into a full cell path plus an equivalent ``explored`` list.
+
+Build it once per maze with ``JunctionGraph.of(grid)``; the graph is cached on
+the grid so repeated queries and all players share it.
+"""
+
+from array import array
+from collections import deque
+import heapq
+
+from maze_grid import OPEN
+from neighbor_table import NeighborTable, DEGREE
+from solver_stream import VISIT, PUSH, PATH, STOPPED, collect
+
+
+class JunctionGraph:
+    METHODS = ('bfs', 'dijkstra', 'astar')
+
+    def __init__(self, grid):
+        self.grid = grid
+        cells = grid.cells
+
+        self.node_cell = array('i')     # node id -> flat cell index
+        self.node_of = {}               # flat cell index -> node id
+        self.adj = []                   # node id -> [(node, weight, corridor id)]
+        self.corridors = []             # corridor id -> (node a, node b, interior cells a->b)
+
+        table = NeighborTable.of(grid)
+        self._mask, self._steps = table.mask, table.steps()
+        # Open degree of every cell, read off the neighbor masks in one pass
+        degree = table.mask.translate(DEGREE)
+        i = cells.find(OPEN)
+        while i != -1:
+            if degree[i] != 2:
+                self._add_node(i)
+            i = cells.find(OPEN, i + 1)
+
+        covered = bytearray(len(cells))   # corridor interiors already collapsed
+        walked = set()                    # (node cell, first step) pairs already followed
+        for node in range(len(self.node_cell)):
+            self._walk_from(node, walked, covered)
+        # Corridors that close on themselves have no junction at all; promote
+        # one cell of each such loop to a node so every open cell is reachable.
+        for i, d in enumerate(degree):
+            if d == 2 and not covered[i] and i not in self.node_of:
+                self._walk_from(self._add_node(i), walked, covered)
+
+    @classmethod
+    def of(cls, grid):
+        """The junction graph of ``grid``, built on first use and then reused."""
+        return grid.derived('junction_graph', cls)
+
+    def _add_node(self, i):
+        node = len(self.node_cell)
+        self.node_cell.append(i)
+        self.node_of[i] = node
+        self.adj.append([])
+        return node
+
+    def _open_neighbors(self, i):
+        # Same order as MazeSolver.get_neighbors: down, up, right, left
+        return [i + d for d in self._steps[self._mask[i]]]
+
+    def _walk(self, prev, current):
+        """Follow a corridor from ``prev`` through ``current`` up to the next node.
+
+        Returns ``(interior cells, node cell, cell before the node)``.
+        """
+        interior = []
+        mask, steps, node_of = self._mask, self._steps, self.node_of
+        while current not in node_of:
+            interior.append(current)
+            a, b = steps[mask[current]]     # Corridor cell: exactly two ways on
+            prev, current = current, (current + b if current + a == prev else current + a)
+        return interior, current, prev
+
+    def _walk_from(self, node, walked, covered):
+        a = self.node_cell[node]
+        for first in self._open_neighbors(a):
+            if (a, first) in walked:
+                continue
+            interior, end, last = self._walk(a, first)
+            walked.add((a, first))
+            walked.add((end, last))
+            for i in interior:
+                covered[i] = 1
+            cid = len(self.corridors)
+            other = self.node_of[end]
+            self.corridors.append((node, other, array('i', interior)))
+            weight = len(interior) + 1
+            self.adj[node].append((other, weight, cid))
+            if other != node:
+                self.adj[other].append((node, weight, cid))
+
+    # ─── queries ───
+
+    def _attach(self, cell):
+        """Ways from ``cell`` onto the graph: ``[(node, cost, cells cell..node)]``."""
+        if cell in self.node_of:
+            return [(self.node_of[cell], 0, [cell])]
+        legs = []
+        for first in self._open_neighbors(cell):
+            interior, end, _ = self._walk(cell, first)
+            legs.append((self.node_of[end], len(interior) + 1, [cell] + interior + [end]))
+        return legs
+
+    def _corridor_cells(self, cid, from_node):
+        a, _, interior = self.corridors[cid]
+        return list(interior) if from_node == a else list(reversed(interior))
+
+    def _expand(self, parent, node):
+        """Cells from the query start up to and including ``node``."""
+        pieces = []
+        while True:
+            prev, link = parent[node]
+            if prev is None:
+                pieces.append(link)     # start leg: start .. node
+                break
+            pieces.append(self._corridor_cells(link, prev) + [self.node_cell[node]])
+            node = prev
+        path = []
+        for piece in reversed(pieces):
+            path.extend(piece)
+        return path
+
+    def solve(self, start, end, method='astar', budget=None, metrics=None):
+        """Shortest path from ``start`` to ``end`` (``(x, y)`` cells).
+
+        ``method`` is ``'bfs'`` (fewest junction hops), ``'dijkstra'`` or
+        ``'astar'``. Returns ``(path, explored)`` in cell coordinates, like
+        the ``MazeSolver.solve_*`` methods. A ``budget`` and ``metrics``
+        count junctions, not cells: a neighbor check follows one corridor.
+        """
+        return collect(self.iter_solve(start, end, method, budget=budget, metrics=metrics))
+
+    def iter_solve(self, start, end, method='astar', frontier=False, budget=None, metrics=None):
+        """``solve`` as a stream of solver_stream events.
+
+        Walking a corridor emits all of its cells at once, in the order a
+        cell-level search would have visited them, and no cell twice;
+        pushes are junctions. When the budget runs out, the path is the best one found so far or
+        else leads to the settled junction closest to the goal.
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"unknown method {method!r}, expected one of {self.METHODS}")
+        grid = self.grid
+        to_xy = grid.coords
+        w = grid.width
+        s, t = grid.index(*start), grid.index(*end)
+        if grid.cells[s] != OPEN or grid.cells[t] != OPEN:
+            yield PATH, None
+            return
+        if s == t:
+            yield VISIT, start
+            yield PATH, [start]
+            return
+
+        best, best_path = float('inf'), None
+
+        heads = self._attach(s)
+        if s not in self.node_of:
+            yield VISIT, start   # Once, although every leg starts there
+        for _, _, cells in heads:
+            for i in cells[1:-1]:
+                yield VISIT, to_xy(i)
+            # Goal on the same corridor as the start: walk straight to it
+            if t in cells and cells.index(t) < best:
+                best = cells.index(t)
+                best_path = cells[:best + 1]
+        tails = {}
+        for node, cost, cells in self._attach(t):
+            if node not in tails or cost < tails[node][0]:
+                tails[node] = (cost, cells[::-1])   # node .. goal
+
+        tx, ty = end
+        def h(node):
+            c = self.node_cell[node]
+            return abs(c % w - tx) + abs(c // w - ty)
+
+        # Nodes and corridors are small ints: flags live in bytearrays. dist
+        # and parent stay dicts, holding only the junctions actually reached.
+        dist, parent = {}, {}
+        settled = bytearray(len(self.node_cell))
+        scanned = bytearray(len(self.corridors))
+        # The start legs already emitted the start's own corridor
+        if s not in self.node_of:
+            for _, _, cid in self.adj[heads[0][0]]:
+                if s in self.corridors[cid][2]:
+                    scanned[cid] = 1
+                    break
+        fifo = deque()
+        heap = []
+        counter = 0
+
+        def push(node, d):
+            nonlocal counter
+            if method == 'bfs':
+                fifo.append(node)
+            else:
+                heapq.heappush(heap, (d + (h(node) if method == 'astar' else 0), counter, node))
+                counter += 1
+
+        for node, cost, cells in heads:
+            if cost < dist.get(node, float('inf')):
+                dist[node] = cost
+                parent[node] = (None, cells)
+                push(node, cost)
+                if metrics is not None:
+                    metrics.push(len(fifo) + len(heap))
+                if frontier:
+                    yield PUSH, to_xy(self.node_cell[node])
+
+        left = -1 if budget is None else 0  # Expansions until the next budget check
+        while fifo or heap:
+            if method == 'bfs':
+                node = fifo.popleft()
+            else:
+                key, _, node = heapq.heappop(heap)
+                # Every remaining node is at least this far (consistent heuristic)
+                if key >= best:
+                    break
+            if metrics is not None:
+                metrics.pop()
+            if settled[node]:
+                if metrics is not None:
+                    metrics.stale()
+                continue
+            if not left:
+                left = budget.grant()
+                if not left:
+                    if best_path is None:
+                        near = min((n for n, done in enumerate(settled) if done), key=h, default=None)
+                        best_path = [s] if near is None else self._expand(parent, near)
+                    yield STOPPED, budget.reason
+                    break
+            left -= 1
+            settled[node] = 1
+            yield VISIT, to_xy(self.node_cell[node])
+
+            if node in tails and dist[node] + tails[node][0] < best:
+                best = dist[node] + tails[node][0]
+                best_path = self._expand(parent, node) + tails[node][1][1:]
+                if method == 'bfs':
+                    break
+
+            if metrics is not None:
+                metrics.expand(len(self.adj[node]))
+            for nbr, weight, cid in self.adj[node]:
+                if not scanned[cid]:
+                    # A cell-level search would have walked this corridor too
+                    scanned[cid] = 1
+                    for i in self._corridor_cells(cid, node):
+                        yield VISIT, to_xy(i)
+                nd = dist[node] + weight
+                if settled[nbr] or nd >= dist.get(nbr, float('inf')):
+                    if metrics is not None:
+                        metrics.duplicate()
+                    continue
+                dist[nbr] = nd
+                parent[nbr] = (node, cid)
+                push(nbr, nd)
+                if metrics is not None:
+                    metrics.push(len(fifo) + len(heap))
+                if frontier:
+                    yield PUSH, to_xy(self.node_cell[nbr])
+
+        yield PATH, (None if best_path is None else [to_xy(i) for i in best_path])
+
+    def stats(self):
+        """Size of the compressed graph next to the cell graph it replaces."""
+        open_cells = self.grid.cells.count(OPEN)
+        return {'open_cells': open_cells, 'nodes': len(self.node_cell),
+                'edges': len(self.corridors),
+                'compression': open_cells / max(1, len(self.node_cell))}
@@ -0,0 +1,229 @@
+"""
+Batch shortest-path queries with landmark (ALT) heuristics.
+
+Manhattan distance is a very weak A* heuristic in a perfect maze, where the
+true distance between two cells is usually many times larger. ``LandmarkIndex``
+precomputes exact BFS distance tables from a few landmark cells; by the
+triangle inequality ``|d(L, a) - d(L, b)|`` is then a lower bound on the
+distance between ``a`` and ``b`` for every landmark ``L``, and the largest of
+those bounds is a consistent heuristic that is often close to exact.
+
+``BatchSolver`` builds the index once per maze and answers any number of
+``(start, goal)`` queries with A* on those bounds.
+"""
+
+import heapq
+from array import array
+
+from distance_field import DistanceField, UNREACHABLE
+from maze_grid import MazeGrid, OPEN
+from neighbor_table import NeighborTable
+from solver_stream import VISIT, PUSH, PATH, STOPPED, collect
+
+
+class LandmarkIndex:
+    def __init__(self, grid, count=4):
+        """
+        grid: MazeGrid
+        count: number of landmarks; each costs one BFS and one int per cell
+        """
+        self.grid = grid
+        self.landmarks = []     # (x, y) cells
+        self.tables = []        # distance arrays, one per landmark
+
+        first = grid.cells.find(OPEN)
+        if first == -1:
+            return
+        # Farthest-point selection: each new landmark is the cell farthest
+        # from all landmarks chosen so far, which spreads them to the
+        # periphery where their bounds are tightest.
+        # Distance tables only: landmarks never follow next hops, and they
+        # stay out of DistanceField.of's cache of goal fields
+        nearest = DistanceField(grid, grid.coords(first), hops=False).dist
+        for _ in range(count):
+            best = max(range(len(nearest)), key=nearest.__getitem__)
+            if nearest[best] <= 0:
+                break
+            cell = grid.coords(best)
+            table = DistanceField(grid, cell, hops=False).dist
+            self.landmarks.append(cell)
+            self.tables.append(table)
+            for i, d in enumerate(table):
+                if d != UNREACHABLE and d < nearest[i]:
+                    nearest[i] = d
+
+    @classmethod
+    def of(cls, grid, count=4):
+        """The index for ``grid``, built once and then shared by every query."""
+        return grid.derived(('landmarks', count), lambda g: cls(g, count))
+
+    def lower_bound(self, a, b):
+        """Lower bound on the steps between flat cells ``a`` and ``b``."""
+        w = self.grid.width
+        bound = abs(a % w - b % w) + abs(a // w - b // w)
+        for table in self.tables:
+            da, db = table[a], table[b]
+            if da != UNREACHABLE and db != UNREACHABLE and abs(da - db) > bound:
+                bound = abs(da - db)
+        return bound
+
+
+class BatchSolver:
+    """Answer many ``(start, goal)`` queries on one maze with ALT A*."""
+
+    def __init__(self, maze, landmarks=4):
+        self.grid = maze if isinstance(maze, MazeGrid) else MazeGrid.from_rows(maze)
+        self.index = LandmarkIndex.of(self.grid, landmarks)
+
+    def solve(self, start, goal, budget=None, metrics=None):
+        """Shortest path between two (x, y) cells as ``(path, explored)``."""
+        return collect(self.iter_solve(start, goal, budget=budget, metrics=metrics))
+
+    def iter_solve(self, start, goal, frontier=False, budget=None, metrics=None):
+        """``solve`` as a stream of solver_stream events over (x, y) cells.
+
+        A ``budget`` is checked only once the landmark tables exist: building
+        them is a handful of uninterrupted BFS passes per maze.
+        """
+        grid = self.grid
+        cells, w, size = grid.cells, grid.width, len(grid.cells)
+        to_xy = grid.coords
+        s, t = grid.index(*start), grid.index(*goal)
+        if not (0 <= s < size and 0 <= t < size) or cells[s] != OPEN or cells[t] != OPEN:
+            yield PATH, None
+            return
+
+        # Each landmark's distance to the goal is fixed for the whole query
+        goal_terms = [(table, table[t]) for table in self.index.tables if table[t] != UNREACHABLE]
+        # Cells in another component than the goal are unreachable outright
+        for table, dt in goal_terms:
+            if table[s] == UNREACHABLE:
+                yield PATH, None
+                return
+        gx, gy = t % w, t // w
+        table = NeighborTable.of(grid)
+        mask, steps = table.mask, table.steps()
+
+        def h(i):
+            bound = abs(i % w - gx) + abs(i // w - gy)
+            for table, dt in goal_terms:
+                d = table[i] - dt
+                if d > bound:
+                    bound = d
+                elif -d > bound:
+                    bound = -d
+            return bound
+
+        best_g = array('i', [-1]) * size     # -1: not reached yet
+        best_g[s] = 0
+        came_from = array('i', [-1]) * size
+        hs = h(s)
+        open_list = [(hs, hs, s)]
+        left = -1 if budget is None else 0  # Expansions until the next budget check
+        if metrics is not None:
+            metrics.push(1)
+        while open_list:
+            f, hc, current = heapq.heappop(open_list)
+            if metrics is not None:
+                metrics.pop()
+            g = f - hc
+            if g > best_g[current]:
+                if metrics is not None:
+                    metrics.stale()
+                continue
+            if not left:
+                left = budget.grant()
+                if not left:
+                    # Best partial path: to the reached cell with the lowest bound
+                    yield STOPPED, budget.reason
+                    reached = (i for i, g in enumerate(best_g) if g >= 0)
+                    yield PATH, self._trace(came_from, min(reached, key=h))
+                    return
+            left -= 1
+            yield VISIT, to_xy(current)
+            if current == t:
+                yield PATH, self._trace(came_from, current)
+                return
+            g += 1
+            nbrs = steps[mask[current]]
+            if metrics is not None:
+                metrics.expand(len(nbrs))
+            for step in nbrs:
+                n = current + step
+                if best_g[n] < 0 or best_g[n] > g:
+                    best_g[n] = g
+                    came_from[n] = current
+                    hn = h(n)
+                    heapq.heappush(open_list, (g + hn, hn, n))
+                    if metrics is not None:
+                        metrics.push(len(open_list))
+                    if frontier:
+                        yield PUSH, to_xy(n)
+                elif metrics is not None:
+                    metrics.duplicate()
+        yield PATH, None
+
+    def _trace(self, came_from, i):
+        """(x, y) cells from the query start to flat cell ``i``."""
+        to_xy = self.grid.coords
+        path = []
+        while i != -1:
+            path.append(to_xy(i))
+            i = came_from[i]
+        return path[::-1]
+
+    def solve_many(self, queries):
+        """Yield ``(path, explored)`` for each ``(start, goal)`` in ``queries``."""
+        for start, goal in queries:
+            yield self.solve(start, goal)
+
+
+def tests():
+    import random
+    from maze_algorithms import GENERATORS, MazeSolver
+
+    print("Running Landmark Tests...\n")
+
+    # TEST CASE 1: ALT and batch paths are as short as BFS paths
+    for name, cls in sorted(GENERATORS.items()):
+        for seed in range(3):
+            grid = cls(21, 15, seed).generate()
+            rng = random.Random(seed)
+            open_cells = [grid.coords(i) for i in range(len(grid.cells)) if grid.cells[i] == OPEN]
+            queries = [tuple(rng.sample(open_cells, 2)) for _ in range(8)]
+            solver = MazeSolver(grid)
+            expected = [MazeSolver(grid, start=s, end=e).solve_bfs()[0] for s, e in queries]
+            batch = solver.solve_batch(queries)
+            assert len(batch) == len(queries), "Test 1 Failed: Wrong number of results"
+            for (s, e), want, (path, _) in zip(queries, expected, batch):
+                assert path is not None and len(path) == len(want), \
+                    f"Test 1 Failed: {name} seed {seed} batch path length differs from BFS"
+                assert path[0] == s and path[-1] == e, "Test 1 Failed: Wrong path endpoints"
+                alt, _ = MazeSolver(grid, start=s, end=e).solve_alt()
+                assert len(alt) == len(want), f"Test 1 Failed: {name} seed {seed} ALT path length differs from BFS"
+    print("Test 1 Passed: ALT and batch paths match BFS lengths.")
+
+    # TEST CASE 2: Landmark bounds never overestimate
+    grid = GENERATORS['backtracker'](21, 21, 7).generate()
+    index = LandmarkIndex.of(grid)
+    assert LandmarkIndex.of(grid) is index, "Test 2 Failed: Index rebuilt for the same grid"
+    assert len(index.landmarks) == 4, "Test 2 Failed: Wrong number of landmarks"
+    goal = grid.index(1, 1)
+    exact = DistanceField(grid, (1, 1), hops=False).dist
+    for i, d in enumerate(exact):
+        if d != UNREACHABLE:
+            assert index.lower_bound(i, goal) <= d, "Test 2 Failed: Bound exceeds the true distance"
+    print("Test 2 Passed: Lower bounds are admissible.")
+
+    # TEST CASE 3: Walls and blocked queries
+    path, _ = BatchSolver(grid).solve((1, 1), (0, 0))
+    assert path is None, "Test 3 Failed: Path to a wall"
+    path, _ = BatchSolver(grid).solve((1, 1), (1, 1))
+    assert path == [(1, 1)], "Test 3 Failed: Start equal to goal"
+    print("Test 3 Passed: Unreachable goals have no path.")
+
+    print("\nAll tests passed successfully!")
+
+
+if __name__ == "__main__":
+    tests()
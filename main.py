@@ -3,145 +3,24 @@
 Classic Mario-Style Maze Generator & Solver
 """
 
-import tkinter as tk
-from tkinter import ttk
-import random
-from collections import deque
-import heapq
-import time
+import json
 import threading
+import tkinter as tk
+from tkinter import ttk, filedialog
+from concurrent.futures.process import BrokenProcessPool
 
-
-# ══════════════════════════════════════════════════════════════════════════════
-# MAZE ALGORITHMS
-# ══════════════════════════════════════════════════════════════════════════════
-
-class MazeGenerator:
-    def __init__(self, width, height):
-        self.width = width
-        self.height = height
-    
-    def generate(self):
-        maze = [[1] * self.width for _ in range(self.height)]
-        stack = [(1, 1)]
-        maze[1][1] = 0
-        
-        while stack:
-            x, y = stack[-1]
-            neighbors = []
-            for dx, dy in [(0, -2), (0, 2), (-2, 0), (2, 0)]:
-                nx, ny = x + dx, y + dy
-                if 0 < nx < self.width - 1 and 0 < ny < self.height - 1 and maze[ny][nx] == 1:
-                    neighbors.append((nx, ny, dx // 2, dy // 2))
-            if neighbors:
-                nx, ny, wx, wy = random.choice(neighbors)
-                maze[y + wy][x + wx] = 0
-                maze[ny][nx] = 0
-                stack.append((nx, ny))
-            else:
-                stack.pop()
-        
-        maze[1][1] = 0
-        maze[self.height - 2][self.width - 2] = 0
-        return maze
-
-
-class MazeSolver:
-    def __init__(self, maze):
-        self.maze = maze
-        self.height = len(maze)
-        self.width = len(maze[0])
-        self.start = (1, 1)
-        self.end = (self.width - 2, self.height - 2)
-    
-    def get_neighbors(self, x, y):
-        neighbors = []
-        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < self.width and 0 <= ny < self.height and self.maze[ny][nx] == 0:
-                neighbors.append((nx, ny))
-        return neighbors
-    
-    def solve_dfs(self):
-        stack = [(self.start, [self.start])]
-        visited = {self.start}
-        explored = []
-        while stack:
-            (x, y), path = stack.pop()
-            explored.append((x, y))
-            if (x, y) == self.end:
-                return path, explored
-            for n in self.get_neighbors(x, y):
-                if n not in visited:
-                    visited.add(n)
-                    stack.append((n, path + [n]))
-        return None, explored
-    
-    def solve_bfs(self):
-        queue = deque([(self.start, [self.start])])
-        visited = {self.start}
-        explored = []
-        while queue:
-            (x, y), path = queue.popleft()
-            explored.append((x, y))
-            if (x, y) == self.end:
-                return path, explored
-            for n in self.get_neighbors(x, y):
-                if n not in visited:
-                    visited.add(n)
-                    queue.append((n, path + [n]))
-        return None, explored
-    
-    def solve_astar(self):
-        def h(a): return abs(a[0] - self.end[0]) + abs(a[1] - self.end[1])
-        open_set = [(h(self.start), 0, self.start)]
-        came_from = {}
-        g = {self.start: 0}
-        visited = set()
-        explored = []
-        while open_set:
-            _, _, current = heapq.heappop(open_set)
-            if current in visited:
-                continue
-            visited.add(current)
-            explored.append(current)
-            if current == self.end:
-                path = [current]
-                while current in came_from:
-                    current = came_from[current]
-                    path.append(current)
-                return path[::-1], explored
-            for n in self.get_neighbors(current[0], current[1]):
-                ng = g[current] + 1
-                if n not in g or ng < g[n]:
-                    came_from[n] = current
-                    g[n] = ng
-                    heapq.heappush(open_set, (ng + h(n), ng, n))
-        return None, explored
-    
-    def solve_greedy(self):
-        def h(a): return abs(a[0] - self.end[0]) + abs(a[1] - self.end[1])
-        open_set = [(h(self.start), self.start)]
-        came_from = {}
-        visited = set()
-        explored = []
-        while open_set:
-            _, current = heapq.heappop(open_set)
-            if current in visited:
-                continue
-            visited.add(current)
-            explored.append(current)
-            if current == self.end:
-                path = [current]
-                while current in came_from:
-                    current = came_from[current]
-                    path.append(current)
-                return path[::-1], explored
-            for n in self.get_neighbors(current[0], current[1]):
-                if n not in visited:
-                    came_from[n] = current
-                    heapq.heappush(open_set, (h(n), n))
-        return None, explored
+from maze_algorithms import GENERATORS, MazeSolver
+import maze_file
+from maze_cache import MazeCache
+from parallel_solver import ParallelSolver
+from solution_cache import SolutionCache, cells_for
+from solver_stream import VISIT, PATH, SolverStream, ReplayStream
+from search_budget import Budget, CancelToken
+from solver_metrics import SolverMetrics
+from distance_field import DistanceField
+from terrain import add_terrain, clear_terrain, path_cost, SLOW, WATER, PIPE
+from frame_scheduler import FrameScheduler
+from pixel_buffer import PixelBuffer
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -169,6 +48,9 @@ class SuperMazeBros:
         'luigi_green': '#00a800',
         'toad_blue': '#0058f8',
         'peach_pink': '#f8a0c0',
+        'sand': '#f0d0a0',
+        'water': '#3cbcfc',
+        'pipe_light': '#80d010',
     }
     
     # Player themes
@@ -179,7 +61,33 @@ class SuperMazeBros:
         {'name': 'PEACH', 'icon': '🩷', 'explored': '#ffa0c0', 'solution': '#f8b800', 'border': '#f878a8'},
     ]
     
-    ALGORITHMS = {'DFS': 'solve_dfs', 'BFS': 'solve_bfs', 'A*': 'solve_astar', 'Greedy': 'solve_greedy'}
+    ALGORITHMS = {'DFS': 'solve_dfs', 'BFS': 'solve_bfs', 'A*': 'solve_astar', 'Greedy': 'solve_greedy',
+                  'Bi-BFS': 'solve_bibfs', 'Bi-A*': 'solve_biastar', 'Junction': 'solve_junction',
+                  'A* Search': 'solve_astar_search', 'ALT': 'solve_alt',
+                  'Dijkstra': 'solve_dijkstra', 'Weighted A*': 'solve_weighted_astar'}
+    
+    WORLDS = {'Backtracker': 'backtracker', 'Binary Tree': 'binary_tree', 'Sidewinder': 'sidewinder',
+              'Eller': 'eller', 'Kruskal': 'kruskal', 'Prim': 'prim'}
+    
+    CACHE_BYTES = 64 * 1024 * 1024  # Memory budget of the solution cache
+    WORLD_FILES = [('Maze worlds', '*.maze'), ('All files', '*')]
+    STATS_FILES = [('JSON', '*.json'), ('All files', '*')]
+    SECONDS_PER_SPEED = 0.05  # Exploration duration per step of self.speed (1 = fastest)
+    
+    # Cell render states kept in drawn_states (ordered: a cell is only ever upgraded)
+    SKY, HEAT, EXPLORED, SOLUTION, FIXED = 0, 1, 2, 3, 4
+    
+    # Mazes above this size are painted into a PhotoImage instead of canvas items
+    ITEM_MAX_SIZE = 31
+    # Pixel palette: SKY/EXPLORED/SOLUTION use their state number, then these
+    PAL_WALL, PAL_PIPE, PAL_STAR, PAL_HEAT = 5, 6, 7, 8
+    HEAT_LEVELS = 64
+    # Terrain tiles by step cost (see terrain.py): color key, in palette order after the heat levels
+    TERRAIN_COLORS = {SLOW: 'sand', WATER: 'water', PIPE: 'pipe_light'}
+    PAL_TERRAIN = PAL_HEAT + HEAT_LEVELS
+    
+    # Distance heatmap gradient: near the star -> far from it
+    HEAT_STOPS = ['#f8d830', '#e4a048', '#c84c0c', '#a43000']
     
     def __init__(self, root):
         self.root = root
@@ -189,6 +97,7 @@ class SuperMazeBros:
         self.maze_size = 21
         self.cell_size = 14
         self.maze = None
+        self.maze_origin = ('', None)  # (generator name, seed) of the current maze
         self.solving = False
         self.speed = 8
         self.num_players = 4
@@ -198,7 +107,20 @@ class SuperMazeBros:
         self.algo_vars = []
         self.player_frames = []
         self.cell_ids = []  # Cache for cell canvas IDs
+        self.buffers = []  # PixelBuffer per canvas for large mazes
         self.drawn_states = []  # Track drawn state per canvas
+        self.race = 0  # Bumped per START/RESET so stale animations stop
+        self.finished = []
+        self.records = [None] * len(self.PLAYERS)  # Last run of each player, as exported
+        self.details_open = set()  # Players whose stats details are expanded
+        self._measure_lock = threading.Lock()  # One traced memory measurement at a time
+        self.streams = []  # SolverStreams of the current race
+        self.cancel_token = CancelToken()  # Stops every search of the current race
+        self.pool = None  # ParallelSolver bound to the current maze
+        self.scheduler = FrameScheduler(self.root.after, self._show_fps)
+        self._open_cells = 1
+        self.solution_cache = SolutionCache(self.CACHE_BYTES)
+        self.maze_cache = MazeCache()
         
         self._build_ui()
         self._generate()
@@ -241,7 +163,8 @@ class SuperMazeBros:
                 fg=self.C['brick_dark'], bg=self.C['block']).pack(side=tk.LEFT, padx=(0, 5))
         self.size_var = tk.StringVar(value="21×21")
         size_cb = ttk.Combobox(size_inner, textvariable=self.size_var,
-                              values=["15×15", "21×21", "25×25", "31×31"], width=6, state='readonly')
+                              values=["15×15", "21×21", "25×25", "31×31", "51×51", "101×101", "201×201"],
+                              width=7, state='readonly')
         size_cb.pack(side=tk.LEFT)
         size_cb.bind('<<ComboboxSelected>>', self._on_size_change)
         
@@ -327,8 +250,33 @@ class SuperMazeBros:
             lbl.pack(side=tk.LEFT, padx=(0, 4))
             
             cb = ttk.Combobox(frame, textvariable=var, values=list(self.ALGORITHMS.keys()),
-                             width=6, state='readonly')
+                             width=11, state='readonly')
             cb.pack(side=tk.LEFT)
+        
+        # Execution mode: solve all players in worker processes
+        self._separator(row)
+        self.parallel_var = tk.BooleanVar(value=False)
+        self._ctrl_group(row, "⚙ MULTI-CORE",
+                         tk.Checkbutton(row, variable=self.parallel_var, bg=self.C['block'],
+                                        activebackground=self.C['block'], highlightthickness=0))
+        
+        # Maze generator used by NEW WORLD
+        self.world_var = tk.StringVar(value='Backtracker')
+        world_cb = ttk.Combobox(row, textvariable=self.world_var, values=list(self.WORLDS.keys()),
+                                width=11, state='readonly')
+        world_cb.bind('<<ComboboxSelected>>', lambda e: self._generate())
+        self._ctrl_group(row, "🧱 WORLD", world_cb)
+        
+        # Weighted terrain: slow tiles, water and pipes cost extra steps
+        self.terrain_var = tk.BooleanVar(value=False)
+        self._ctrl_group(row, "🌊 TERRAIN",
+                         tk.Checkbutton(row, variable=self.terrain_var, command=self._toggle_terrain,
+                                        bg=self.C['block'], activebackground=self.C['block'], highlightthickness=0))
+        
+        # Reproducible worlds: a typed seed rebuilds (or reloads) the same maze
+        self.seed_var = tk.StringVar(value="")
+        self._ctrl_group(row, "🌱 SEED",
+                         tk.Entry(row, textvariable=self.seed_var, width=10, font=('Consolas', 9)))
     
     def _ctrl_group(self, parent, label, widget):
         frame = tk.Frame(parent, bg=self.C['block'])
@@ -350,6 +298,10 @@ class SuperMazeBros:
         self.btn_gen = self._pipe_button(btn_frame, "? NEW WORLD", self._generate, self.C['block'], self.C['block_dark'])
         self.btn_solve = self._pipe_button(btn_frame, "★ START!", self._start_solve, self.C['pipe'], self.C['pipe_dark'])
         self.btn_clear = self._pipe_button(btn_frame, "✕ RESET", self._clear, self.C['mario_red'], self.C['brick_dark'])
+        self.btn_heat = self._pipe_button(btn_frame, "🌡 HEATMAP", self._show_heatmap, self.C['toad_blue'], self.C['pipe_dark'])
+        self.btn_save = self._pipe_button(btn_frame, "💾 SAVE WORLD", self._save_world, self.C['block'], self.C['block_dark'])
+        self.btn_load = self._pipe_button(btn_frame, "📂 LOAD WORLD", self._load_world, self.C['block'], self.C['block_dark'])
+        self.btn_export = self._pipe_button(btn_frame, "📊 EXPORT STATS", self._export_stats, self.C['toad_blue'], self.C['pipe_dark'])
         
         # Mazes container
         self.game_frame = tk.Frame(self.main, bg=self.C['sky'])
@@ -380,6 +332,7 @@ class SuperMazeBros:
         self.player_frames = []
         self.cell_ids = []
         self.drawn_states = []
+        self.buffers = []
         
         n = self.num_players
         
@@ -392,6 +345,9 @@ class SuperMazeBros:
             self.cell_size = 11
         else:
             self.cell_size = 9
+        # Large mazes keep the canvas about as big as a 31×31 one
+        if self.maze_size > self.ITEM_MAX_SIZE:
+            self.cell_size = max(1, self.cell_size * self.ITEM_MAX_SIZE // self.maze_size)
         
         # Container for all player panels
         container = tk.Frame(self.game_frame, bg=self.C['sky'])
@@ -471,7 +427,18 @@ class SuperMazeBros:
                                 fg=self.C['black'], bg=self.C['coin'])
         stats['time'].pack(side=tk.LEFT, padx=2)
         
+        # ─── Details: solver counters, expandable ───
+        stats['toggle'] = tk.Label(stats_outer, text="▸ DETAILS", font=('Consolas', 8, 'bold'),
+                                   fg=self.C['brick_dark'], bg=self.C['coin'], anchor='w', padx=8, cursor='hand2')
+        stats['toggle'].pack(fill=tk.X)
+        stats['toggle'].bind('<Button-1>', lambda e, i=idx: self._toggle_details(i))
+        stats['details'] = tk.Label(stats_outer, text="", font=('Consolas', 8), justify=tk.LEFT,
+                                    fg=self.C['black'], bg=self.C['coin'], anchor='w', padx=8)
+        
         self.stats.append(stats)
+        if idx in self.details_open:
+            self.details_open.discard(idx)
+            self._toggle_details(idx)
         
         return frame
     
@@ -497,6 +464,15 @@ class SuperMazeBros:
                                    font=('Consolas', 12, 'bold'),
                                    fg=self.C['white'], bg=self.C['ground'])
         self.status_lbl.place(relx=0.5, rely=0.5, anchor='center')
+        
+        # Achieved animation frame rate
+        self.fps_lbl = tk.Label(status_container, text="",
+                                font=('Consolas', 9, 'bold'),
+                                fg=self.C['white'], bg=self.C['ground'])
+        self.fps_lbl.place(relx=0.99, rely=0.5, anchor='e')
+    
+    def _show_fps(self, fps):
+        self.fps_lbl.config(text=f"🎞 {fps:.0f} FPS")
     
     def _on_size_change(self, e=None):
         size = int(self.size_var.get().split('×')[0])
@@ -518,39 +494,263 @@ class SuperMazeBros:
         self.status_lbl.config(text="🔨 BUILDING WORLD...")
         self.root.update()
         
-        gen = MazeGenerator(self.maze_size, self.maze_size)
-        self.maze = gen.generate()
+        generator = GENERATORS[self.WORLDS[self.world_var.get()]]
+        text = self.seed_var.get().strip()
+        try:
+            seed = int(text) if text.isascii() else None
+        except ValueError:
+            seed = None
+        # Must also fit the seed field of .maze files
+        rejected = bool(text) and not maze_file.storable_seed(seed)
+        if text and not rejected:
+            # Typed seeds are worth keeping: the same world loads from disk next time
+            maze = self.maze_cache.generate(generator, self.maze_size, self.maze_size, seed)
+        else:
+            gen = generator(self.maze_size, self.maze_size)
+            seed, maze = gen.seed, gen.generate()
+        self._set_maze(maze, generator.name, seed)
+        if rejected:
+            self.status_lbl.config(text=f"⚠ BAD SEED {text[:20]!r} - RANDOM SEED {seed} USED")
+        else:
+            self.status_lbl.config(text=f"🎮 SEED {seed} - PRESS START TO PLAY!")
+    
+    def _set_maze(self, maze, generator, seed=None):
+        """Show ``maze`` on every canvas; ``generator``/``seed`` go into saved files."""
+        self.maze = maze
+        self.maze_origin = (generator, seed)
+        # Terrain follows the checkbox and is drawn from the world's seed,
+        # so a seeded world always gets the same terrain
+        if self.terrain_var.get():
+            add_terrain(maze, seed)
+        elif maze.weights is not None:
+            clear_terrain(maze)
         
         # Clear cache for redraw
         self.cell_ids = []
         self.drawn_states = []
+        self.buffers = []
         
         for i in range(self.num_players):
             self._draw_maze(i)
-            self.stats[i]['path'].config(text="-")
-            self.stats[i]['explored'].config(text="-")
-            self.stats[i]['time'].config(text="-")
+            self._reset_stats(i)
+    
+    def _toggle_terrain(self):
+        if self.solving or not self.maze:
+            self.terrain_var.set(self.maze is not None and self.maze.weights is not None)
+            return
+        # Worker processes hold a copy of the maze without the new weights
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+        self._set_maze(self.maze, *self.maze_origin)
+        self.status_lbl.config(text="🌊 TERRAIN ON - SLOW, WATER AND PIPE TILES COST EXTRA"
+                               if self.maze.weights is not None else "🎮 TERRAIN OFF - EVERY STEP COSTS 1")
+    
+    def _reset_stats(self, idx):
+        st = self.stats[idx]
+        st['path'].config(text="-")
+        st['explored'].config(text="-")
+        st['time'].config(text="-")
+        self.records[idx] = None
+        self._show_details(idx)
+    
+    def _save_world(self):
+        if self.solving or not self.maze:
+            return
+        path = filedialog.asksaveasfilename(defaultextension='.maze', filetypes=self.WORLD_FILES)
+        if not path:
+            return
+        generator, seed = self.maze_origin
+        try:
+            maze_file.save(path, self.maze, seed=seed, generator=generator)
+        except OSError as exc:
+            self.status_lbl.config(text=f"⚠ COULD NOT SAVE: {exc.strerror or exc}")
+            return
+        self.status_lbl.config(text=f"💾 WORLD SAVED ({self.maze_size}×{self.maze_size})")
+    
+    def _load_world(self):
+        if self.solving:
+            return
+        path = filedialog.askopenfilename(filetypes=self.WORLD_FILES)
+        if not path:
+            return
+        try:
+            maze, info = maze_file.load(path)
+        except (OSError, ValueError) as exc:
+            self.status_lbl.config(text=f"⚠ COULD NOT LOAD: {exc}")
+            return
+        # The board is square with its pipe and star in the corners
+        if info.width != info.height or info.width < 5 or info.start != (1, 1) or info.end != (info.width - 2, info.height - 2):
+            self.status_lbl.config(text="⚠ UNSUPPORTED WORLD: NEEDS A SQUARE MAZE WITH CORNER START/END")
+            return
         
-        self.status_lbl.config(text="🎮 PRESS START TO PLAY!")
+        if info.width != self.maze_size:
+            self.maze_size = info.width
+            self.size_var.set(f"{info.width}×{info.height}")
+            self._create_player_panels()
+        self._set_maze(maze, info.generator, info.seed)
+        self.status_lbl.config(text=f"📂 WORLD LOADED ({info.width}×{info.height}) - PRESS START!")
     
     def _draw_maze(self, idx, explored=None, solution=None):
+        """Bring canvas ``idx`` to the given explored/solution state.
+
+        Cell items are created once per maze and cached in ``cell_ids``;
+        afterwards only cells whose entry in ``drawn_states`` differs from
+        the requested state are reconfigured.
+        """
         if idx >= len(self.canvases):
             return
         
-        canvas = self.canvases[idx]
-        canvas.delete('all')
+        self._ensure_cells(idx)
+        
+        n = self.maze_size
+        target = bytearray(n * n)
+        for x, y in explored or ():
+            target[y * n + x] = self.EXPLORED
+        for x, y in solution or ():
+            target[y * n + x] = self.SOLUTION
+        
+        drawn = self.drawn_states[idx]
+        for state in (self.SKY, self.EXPLORED, self.SOLUTION):
+            changed = [i for i in range(n * n)
+                       if target[i] == state and drawn[i] != state and drawn[i] != self.FIXED]
+            self._restyle(idx, changed, state)
+    
+    def _paint_cells(self, idx, cells, state):
+        """Upgrade ``cells`` to ``state`` (explored or solution).
+        
+        Cost is proportional to ``len(cells)``, not to the maze area, so the
+        animation only pays for the cells that are new in a frame.
+        """
+        if idx >= len(self.canvases):
+            return
         
+        self._ensure_cells(idx)
+        
+        n = self.maze_size
+        drawn = self.drawn_states[idx]
+        # Never downgrade a cell (solution beats explored) or touch walls/pipe/star
+        self._restyle(idx, [y * n + x for x, y in cells if drawn[y * n + x] < state], state)
+    
+    def _restyle(self, idx, flat_cells, state):
+        if not flat_cells:
+            return
+        
+        drawn = self.drawn_states[idx]
+        buffer = self.buffers[idx]
+        if buffer is not None:
+            if state == self.SKY and self.maze.weights is not None:
+                buffer.set_each(flat_cells, [self._sky_pixel(i) for i in flat_cells])
+            else:
+                buffer.set(flat_cells, state)
+            for i in flat_cells:
+                drawn[i] = state
+            return
+        
+        canvas = self.canvases[idx]
+        ids = self.cell_ids[idx]
         p = self.PLAYERS[idx]
-        explored_set = set(explored) if explored else set()
-        solution_set = set(solution) if solution else set()
+        
+        if state == self.SOLUTION:
+            style = {'fill': p['solution'], 'outline': self.C['coin_dark'], 'width': 1}
+        elif state == self.EXPLORED:
+            style = {'fill': p['explored'], 'outline': '', 'width': 0}
+        else:
+            style = {'fill': self.C['sky_light'], 'outline': '', 'width': 0}
+        
+        terrain = state == self.SKY and self.maze.weights is not None
+        for i in flat_cells:
+            if terrain:
+                style['fill'] = self._sky_color(i)
+            canvas.itemconfig(ids[i], **style)
+            drawn[i] = state
+    
+    def _sky_color(self, i):
+        """Color of open cell ``i`` while unexplored: its terrain tile, or plain sky."""
+        weights = self.maze.weights
+        key = self.TERRAIN_COLORS.get(weights[i]) if weights is not None else None
+        return self.C[key or 'sky_light']
+    
+    def _sky_pixel(self, i):
+        """Palette index counterpart of ``_sky_color``."""
+        weights = self.maze.weights
+        if weights is None or weights[i] not in self.TERRAIN_COLORS:
+            return self.SKY
+        return self.PAL_TERRAIN + list(self.TERRAIN_COLORS).index(weights[i])
+    
+    def _heat_color(self, t):
+        """Color for relative distance ``t`` in [0, 1] along HEAT_STOPS."""
+        stops = self.HEAT_STOPS
+        pos = min(max(t, 0.0), 1.0) * (len(stops) - 1)
+        k = min(int(pos), len(stops) - 2)
+        f = pos - k
+        a, b = stops[k], stops[k + 1]
+        rgb = [round(int(a[j:j+2], 16) * (1 - f) + int(b[j:j+2], 16) * f) for j in (1, 3, 5)]
+        return '#%02x%02x%02x' % tuple(rgb)
+    
+    def _paint_heat(self, idx, field):
+        """Color every open cell of canvas ``idx`` by its distance to the star."""
+        if idx >= len(self.canvases):
+            return
+        
+        self._ensure_cells(idx)
+        
+        drawn = self.drawn_states[idx]
+        dist = field.dist
+        top = max(1, field.max_distance)
+        last = self.HEAT_LEVELS - 1
+        cells = [i for i, state in enumerate(drawn) if state != self.FIXED and dist[i] >= 0]
+        for i in cells:
+            drawn[i] = self.HEAT
+        
+        buffer = self.buffers[idx]
+        if buffer is not None:
+            buffer.set_each(cells, [self.PAL_HEAT + dist[i] * last // top for i in cells])
+            return
+        
+        canvas = self.canvases[idx]
+        ids = self.cell_ids[idx]
+        # Quantized so a big maze needs only a handful of distinct color strings
+        levels = [self._heat_color(k / last) for k in range(self.HEAT_LEVELS)]
+        for i in cells:
+            canvas.itemconfig(ids[i], fill=levels[dist[i] * last // top], outline='', width=0)
+    
+    def _show_heatmap(self):
+        if self.solving or not self.maze:
+            return
+        
+        end = (self.maze_size - 2, self.maze_size - 2)
+        field = DistanceField.of(self.maze, end)
+        for i in range(self.num_players):
+            self._paint_heat(i, field)
+        self.status_lbl.config(text=f"🌡 DISTANCE TO ★ - FARTHEST CELL {field.max_distance} STEPS")
+    
+    def _ensure_cells(self, idx):
+        """Create the canvas items for every cell of ``idx`` once per maze."""
+        while len(self.cell_ids) <= idx:
+            self.cell_ids.append(None)
+            self.drawn_states.append(None)
+            self.buffers.append(None)
+        if self.cell_ids[idx] is not None:
+            return
+        
+        canvas = self.canvases[idx]
+        canvas.delete('all')
         
         start = (1, 1)
         end = (self.maze_size - 2, self.maze_size - 2)
         
+        n = self.maze_size
         cs = self.cell_size
         
-        for y in range(self.maze_size):
-            for x in range(self.maze_size):
+        if n > self.ITEM_MAX_SIZE:
+            self._ensure_pixels(idx, start, end)
+            return
+        ids = [0] * (n * n)
+        drawn = bytearray(n * n)
+        
+        for y in range(n):
+            for x in range(n):
                 x1, y1 = x * cs, y * cs
                 x2, y2 = x1 + cs, y1 + cs
                 pos = (x, y)
@@ -566,6 +766,7 @@ class SuperMazeBros:
                             canvas.create_line(mid_x, y1, mid_x, mid_y, fill=self.C['brick_dark'])
                         else:
                             canvas.create_line(mid_x, mid_y, mid_x, y2, fill=self.C['brick_dark'])
+                    drawn[y * n + x] = self.FIXED
                 
                 elif pos == start:
                     # PIPE (Start)
@@ -573,6 +774,7 @@ class SuperMazeBros:
                     if cs >= 12:
                         canvas.create_text((x1+x2)//2, (y1+y2)//2, text="▶",
                                           font=('Consolas', max(8, cs-5), 'bold'), fill=self.C['white'])
+                    drawn[y * n + x] = self.FIXED
                 
                 elif pos == end:
                     # FLAG/STAR (End)
@@ -580,102 +782,344 @@ class SuperMazeBros:
                     if cs >= 12:
                         canvas.create_text((x1+x2)//2, (y1+y2)//2, text="★",
                                           font=('Consolas', max(8, cs-4), 'bold'), fill=self.C['mario_red'])
-                
-                elif pos in solution_set:
-                    # SOLUTION PATH (Coins)
-                    canvas.create_rectangle(x1, y1, x2, y2, fill=p['solution'], outline=self.C['coin_dark'], width=1)
-                
-                elif pos in explored_set:
-                    # EXPLORED
-                    canvas.create_rectangle(x1, y1, x2, y2, fill=p['explored'], outline='', width=0)
+                    drawn[y * n + x] = self.FIXED
                 
                 else:
                     # SKY/PATH
-                    canvas.create_rectangle(x1, y1, x2, y2, fill=self.C['sky_light'], outline='', width=0)
+                    ids[y * n + x] = canvas.create_rectangle(x1, y1, x2, y2, fill=self._sky_color(y * n + x),
+                                                             outline='', width=0)
+        
+        self.cell_ids[idx] = ids
+        self.drawn_states[idx] = drawn
+    
+    def _palette(self, idx):
+        """Pixel colors of canvas ``idx``, indexed by state / PAL_* constant."""
+        p = self.PLAYERS[idx]
+        palette = [self.C['sky_light'], None, p['explored'], p['solution'], None,
+                   self.C['brick'], self.C['pipe'], self.C['coin']]
+        last = self.HEAT_LEVELS - 1
+        return (palette + [self._heat_color(k / last) for k in range(self.HEAT_LEVELS)]
+                + [self.C[key] for key in self.TERRAIN_COLORS.values()])
+    
+    def _ensure_pixels(self, idx, start, end):
+        """Pixel-buffer counterpart of ``_ensure_cells`` for large mazes."""
+        n = self.maze_size
+        cells = self.maze.cells
+        # Walls and the two endpoints are fixed; every open cell starts as sky
+        colors = bytearray(self.PAL_WALL if c else self.SKY for c in cells)
+        drawn = bytearray(self.FIXED if c else self.SKY for c in cells)
+        if self.maze.weights is not None:
+            for i, c in enumerate(cells):
+                if not c:
+                    colors[i] = self._sky_pixel(i)
+        for (x, y), color in ((start, self.PAL_PIPE), (end, self.PAL_STAR)):
+            colors[y * n + x] = color
+            drawn[y * n + x] = self.FIXED
+        
+        self.buffers[idx] = PixelBuffer(self.canvases[idx], n, n, self.cell_size, colors, self._palette(idx))
+        self.cell_ids[idx] = ()
+        self.drawn_states[idx] = drawn
     
     def _start_solve(self):
         if self.solving or not self.maze:
             return
         
         self.solving = True
+        self.race += 1
+        self.cancel_token.cancel()  # Also stops a memory measurement still running
+        self.cancel_token = CancelToken()
         self.btn_solve.config(state=tk.DISABLED)
         self.btn_gen.config(state=tk.DISABLED)
         
-        threading.Thread(target=self._solve, daemon=True).start()
+        # Wipe any heatmap or previous race before painting the new one
+        for i in range(self.num_players):
+            self._draw_maze(i)
+        
+        self.finished = []
+        self.status_lbl.config(text="🏃 GO GO GO!")
+        if self.parallel_var.get():
+            self._solve_parallel()
+        else:
+            self._solve()
+    
+    def _explore_rate(self):
+        """Cells per second so a full exploration takes the slider's duration."""
+        # Results stream in, so the rate comes from the maze itself
+        self._open_cells = max(1, self.maze.cells.count(0))
+        return self._open_cells / (self.speed * self.SECONDS_PER_SPEED)
     
     def _solve(self):
+        """Stream every player's search; animation starts with the first events."""
         solver = MazeSolver(self.maze)
+        race = self.race
+        rate = self._explore_rate()
+        cache = self.solution_cache
+        # Record the visit history only while it could still fit in the cache
+        record_limit = cells_for(self.CACHE_BYTES // len(self.PLAYERS))
         
-        results = []
         for i in range(self.num_players):
             algo = self.algo_vars[i].get()
-            t0 = time.time()
-            method = getattr(solver, self.ALGORITHMS[algo])
-            sol, exp = method()
-            t = (time.time() - t0) * 1000
-            results.append({'idx': i, 'algo': algo, 'solution': sol, 'explored': exp, 'time': t})
-        
-        self.root.after(0, lambda: self.status_lbl.config(text="🏃 GO GO GO!"))
-        
-        # Animate exploration - batch updates
-        max_exp = max(len(r['explored']) for r in results)
-        step = max(1, max_exp // 40)  # Fewer frames for speed
-        
-        def update_exploration(frame):
-            if not self.solving or frame > max_exp:
-                # Start solution animation
-                self.root.after(50, lambda: animate_solution(0))
-                return
-            for r in results:
-                exp = r['explored'][:min(frame, len(r['explored']))]
-                self._draw_maze(r['idx'], exp, None)
-            self.root.after(max(5, self.speed // 4), lambda: update_exploration(frame + step))
-        
-        def animate_solution(frame):
-            max_sol = max((len(r['solution']) for r in results if r['solution']), default=0)
-            if not self.solving or frame > max_sol:
-                finish_solve()
-                return
-            for r in results:
-                if r['solution']:
-                    sol = r['solution'][:min(frame, len(r['solution']))]
-                    self._draw_maze(r['idx'], r['explored'], sol)
-            self.root.after(max(5, self.speed // 8), lambda: animate_solution(frame + 1))
-        
-        def finish_solve():
-            for r in results:
-                self._draw_maze(r['idx'], r['explored'], r['solution'])
-                if r['solution']:
-                    st = self.stats[r['idx']]
-                    st['path'].config(text=str(len(r['solution'])))
-                    st['explored'].config(text=str(len(r['explored'])))
-                    st['time'].config(text=f"{r['time']:.0f}ms")
-            
-            valid = [r for r in results if r['solution']]
-            if valid:
-                best = min(valid, key=lambda x: (len(x['solution']), len(x['explored'])))
-                self.status_lbl.config(text=f"🏆 PLAYER {best['idx']+1} ({best['algo']}) WINS! ★ {len(best['solution'])} steps")
-            
-            self.solving = False
-            self.btn_solve.config(state=tk.NORMAL)
-            self.btn_gen.config(state=tk.NORMAL)
+            method = self.ALGORITHMS[algo]
+            key = cache.key(self.maze, method, solver.start, solver.end)
+            hit = cache.get(key)
+            metrics = None
+            if hit is not None:
+                stream, key = ReplayStream(*hit), None
+            else:
+                budget = Budget(token=self.cancel_token)
+                metrics = SolverMetrics()
+                stream = SolverStream(solver.iter_solve(method, budget=budget, metrics=metrics),
+                                      record_limit=record_limit)
+            self.streams.append(stream)
+            self._animate_player(race, {'idx': i, 'algo': algo, 'stream': stream.start(), 'key': key,
+                                        'metrics': metrics}, rate)
+    
+    def _solve_parallel(self):
+        """Solve every player in the process pool; each animates on arrival."""
+        if self.pool is None or self.pool.maze is not self.maze:
+            if self.pool is not None:
+                self.pool.shutdown()
+            self.pool = ParallelSolver(self.maze)
+        
+        race = self.race
+        rate = self._explore_rate()
         
-        self.root.after(10, lambda: update_exploration(0))
+        cache = self.solution_cache
+        for i in range(self.num_players):
+            algo = self.algo_vars[i].get()
+            key = cache.key(self.maze, self.ALGORITHMS[algo], (1, 1), (self.maze_size - 2, self.maze_size - 2))
+            hit = cache.get(key)
+            if hit is not None:
+                self._animate_player(race, {'idx': i, 'algo': algo, 'stream': ReplayStream(*hit), 'key': None,
+                                            'metrics': None}, rate)
+                continue
+            future = self.pool.submit(self.ALGORITHMS[algo], metrics=True)
+            future.add_done_callback(
+                lambda f, i=i, algo=algo, key=key: self.root.after(0, lambda: self._on_result(race, i, algo, f, rate, key)))
+    
+    def _on_result(self, race, idx, algo, future, rate, key):
+        if future.cancelled():
+            return
+        try:
+            sol, exp, t, stopped, metrics = future.result()
+        except Exception as exc:    # The solver raised, or the pool itself broke
+            if isinstance(exc, BrokenProcessPool) and self.pool is not None:
+                self.pool.shutdown()
+                self.pool = None    # Start a fresh pool next race
+            if race == self.race and self.solving:
+                self._animate_player(race, {'idx': idx, 'algo': algo, 'stream': ReplayStream(None, ()), 'key': None,
+                                            'metrics': None, 'error': f"{type(exc).__name__}: {exc}"}, rate)
+            return
+        if stopped is None:
+            self.solution_cache.put(key, (sol, exp))
+        if race != self.race or not self.solving:
+            return
+        self._animate_player(race, {'idx': idx, 'algo': algo, 'stream': ReplayStream(sol, exp, t), 'key': None,
+                                    'metrics': metrics}, rate)
+    
+    def _animate_player(self, race, r, rate):
+        """Play one player's exploration as it streams in, then its solution.
+        
+        Runs as a frame scheduler task: each frame paints ``rate`` cells per
+        second of elapsed time, so the speed holds however long frames take.
+        """
+        idx, stream = r['idx'], r['stream']
+        r['explored'], r['solution'] = 0, None
+        owed = 0.0      # Cells due but not painted yet (fractional carry)
+        pause = 0.05    # Beat between the exploration and the solution
+        traced = 0.0    # Solution cells painted so far (fractional)
+        
+        def update(elapsed):
+            nonlocal owed, pause, traced
+            if race != self.race or not self.solving:
+                stream.cancel()
+                return True
+            if not stream.done:
+                owed += rate * elapsed
+                visited = []
+                for kind, data in stream.poll(max(1, int(owed))):
+                    if kind == VISIT:
+                        visited.append(data)
+                    elif kind == PATH:
+                        r['solution'] = data
+                # Only the cells discovered since the previous frame are painted
+                self._paint_cells(idx, visited, self.EXPLORED)
+                r['explored'] += len(visited)
+                owed = max(0.0, owed - len(visited)) if visited else min(owed, rate)
+                return False
+            if pause > 0:
+                pause -= elapsed
+                return False
+            solution = r['solution'] or ()
+            # The path is traced in half the time the exploration was given
+            done = int(traced)
+            traced += elapsed * len(solution) * 2 * rate / self._open_cells
+            self._paint_cells(idx, solution[done:int(traced) + 1], self.SOLUTION)
+            if traced + 1 >= len(solution):
+                self._player_finished(r)
+                return True
+            return False
+        
+        self.scheduler.add(update)
+    
+    def _player_finished(self, r):
+        stream = r['stream']
+        r['time'] = stream.elapsed_ms
+        if r['key'] is not None and stream.result is not None:
+            self.solution_cache.put(r['key'], stream.result)
+        # On terrain the race is about the cheapest path, not the shortest
+        weighted = self.maze.weights is not None
+        r['cost'] = path_cost(self.maze, r['solution'])
+        st = self.stats[r['idx']]
+        error = r.get('error')
+        if error is None and stream.error is not None:
+            error = r['error'] = f"{type(stream.error).__name__}: {stream.error}"
+        if error is not None:
+            # A crashed solver is not a search that found no path
+            st['path'].config(text="💥")
+            self.status_lbl.config(text=f"💥 PLAYER {r['idx'] + 1} ({r['algo']}) FAILED: {error}")
+        elif r['solution']:
+            st['path'].config(text=f"{len(r['solution'])} ⚖{r['cost']}" if weighted else str(len(r['solution'])))
+            st['explored'].config(text=str(r['explored']))
+            st['time'].config(text=f"{r['time']:.0f}ms")
+        
+        # Threaded runs hand over a live SolverMetrics, worker processes a dict
+        metrics = r['metrics']
+        if isinstance(metrics, SolverMetrics):
+            metrics = metrics.as_dict()
+        self.records[r['idx']] = {
+            'player': r['idx'] + 1, 'algorithm': r['algo'], 'method': self.ALGORITHMS[r['algo']],
+            'path': len(r['solution']) if r['solution'] else None, 'cost': r['cost'], 'explored': r['explored'],
+            'time_ms': round(r['time'], 3), 'cached': r['metrics'] is None and error is None, 'metrics': metrics,
+            'error': error}
+        self._show_details(r['idx'])
+        
+        self.finished.append(r)
+        if len(self.finished) < self.num_players:
+            return
+        
+        self.streams = []
+        valid = [r for r in self.finished if r['solution']]
+        if valid:
+            best = min(valid, key=lambda x: (x['cost'] if weighted else len(x['solution']), x['explored']))
+            cache = self.solution_cache.stats()
+            score = f"⚖ cost {best['cost']} ({len(best['solution'])} steps)" if weighted else f"★ {len(best['solution'])} steps"
+            crashed = sum(r.get('error') is not None for r in self.finished)
+            self.status_lbl.config(text=f"🏆 PLAYER {best['idx']+1} ({best['algo']}) WINS! {score}"
+                                        f"  💾 {cache['hits']}/{cache['hits'] + cache['misses']} cached"
+                                        + (f"  💥 {crashed} failed" if crashed else ""))
+        
+        self.solving = False
+        self.btn_solve.config(state=tk.NORMAL)
+        self.btn_gen.config(state=tk.NORMAL)
+        # Open details can be measured now that no search is running
+        for i in sorted(self.details_open):
+            self._show_details(i)
+    
+    # ─── Solver details ───
+    
+    def _toggle_details(self, idx):
+        st = self.stats[idx]
+        if idx in self.details_open:
+            self.details_open.discard(idx)
+            st['details'].pack_forget()
+            st['toggle'].config(text="▸ DETAILS")
+        else:
+            self.details_open.add(idx)
+            st['details'].pack(fill=tk.X)
+            st['toggle'].config(text="▾ DETAILS")
+        self._show_details(idx)
+    
+    def _show_details(self, idx):
+        """Refresh player ``idx``'s details, measuring its memory first if they are open."""
+        if idx >= len(self.stats):
+            return
+        rec = self.records[idx]
+        if rec is None:
+            text = "no run yet"
+        elif rec['error'] is not None:
+            text = f"💥 solver failed\n{rec['error']}"
+        else:
+            m = rec['metrics']
+            if idx in self.details_open and not self.solving and (m is None or m['peak_bytes'] is None):
+                self._measure_memory(idx)
+            if m is None:
+                text = "replayed from cache\n📏 measuring..."
+            else:
+                mem = "📏 measuring..." if m['peak_bytes'] is None else f"{m['peak_bytes'] / 1024:,.0f} KiB"
+                text = (f"expanded  {m['expansions']:>9,}   peak front {m['peak_frontier']:>7,}\n"
+                        f"pushes    {m['pushes']:>9,}   pops       {m['pops']:>7,}\n"
+                        f"dupes     {m['duplicates']:>9,}   stale pops {m['stale_pops']:>7,}\n"
+                        f"nbr checks{m['neighbor_checks']:>9,}   peak mem   {mem}")
+        self.stats[idx]['details'].config(text=text)
+    
+    def _measure_memory(self, idx):
+        """Re-run player ``idx``'s search under tracemalloc to find its peak memory.
+        
+        The race itself is never traced: tracemalloc is process-wide, so it
+        would mix up the players' threads, and it slows every search down
+        several times. Measurements run one at a time on a background thread.
+        """
+        rec = self.records[idx]
+        if rec.get('measuring'):
+            return
+        rec['measuring'] = True
+        maze, method, token = self.maze, rec['method'], self.cancel_token
+        
+        def work():
+            with self._measure_lock:
+                metrics = SolverMetrics(memory=True)
+                budget = Budget(token=token)
+                metrics.measure(lambda: getattr(MazeSolver(maze), method)(budget=budget, metrics=metrics))
+            if not budget.stopped:
+                self.root.after(0, lambda: self._on_measured(idx, rec, metrics))
+        
+        threading.Thread(target=work, daemon=True).start()
+    
+    def _on_measured(self, idx, rec, metrics):
+        rec['measuring'] = False
+        rec['metrics'] = metrics.as_dict()
+        if self.records[idx] is rec:
+            self._show_details(idx)
+    
+    def _export_stats(self):
+        """Save the last run of every player, with its solver counters, as JSON."""
+        records = [rec for rec in self.records[:self.num_players] if rec is not None]
+        if not records:
+            self.status_lbl.config(text="⚠ NO STATS YET - PRESS START FIRST")
+            return
+        path = filedialog.asksaveasfilename(defaultextension='.json', filetypes=self.STATS_FILES)
+        if not path:
+            return
+        generator, seed = self.maze_origin
+        report = {'maze': {'width': self.maze.width, 'height': self.maze.height,
+                           'generator': generator, 'seed': seed, 'terrain': self.maze.weights is not None},
+                  'players': [{k: v for k, v in rec.items() if k != 'measuring'} for rec in records]}
+        try:
+            with open(path, 'w') as f:
+                json.dump(report, f, indent=2)
+        except OSError as exc:
+            self.status_lbl.config(text=f"⚠ COULD NOT EXPORT: {exc.strerror or exc}")
+            return
+        self.status_lbl.config(text=f"📊 STATS EXPORTED ({len(records)} PLAYERS)")
     
     def _clear(self):
         if self.solving:
             self.solving = False
+        self.race += 1  # Orphan any pending animation callbacks
+        # Stop the searches themselves, not just their animation
+        self.cancel_token.cancel()
+        if self.pool is not None:
+            self.pool.cancel()
+        for stream in self.streams:
+            stream.cancel()
+        self.streams = []
         
         if self.maze:
-            # Clear cache for clean redraw
-            self.cell_ids = []
-            self.drawn_states = []
-            
+            # Cached cells are diffed back to the empty state
             for i in range(self.num_players):
                 self._draw_maze(i)
-                self.stats[i]['path'].config(text="-")
-                self.stats[i]['explored'].config(text="-")
-                self.stats[i]['time'].config(text="-")
+                self._reset_stats(i)
             self.status_lbl.config(text="🎮 READY FOR NEW GAME!")
         
         self.btn_solve.config(state=tk.NORMAL)
@@ -692,8 +1136,11 @@ def main():
     root.geometry(f'{w}x{h}+{x}+{y}')
     root.minsize(750, 550)
     
-    SuperMazeBros(root)
+    app = SuperMazeBros(root)
     root.mainloop()
+    # Join the workers before exiting; a pool left behind can hang exit on Python 3.8
+    if app.pool is not None:
+        app.pool.shutdown()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,656 @@
+"""
+Maze generation and solving algorithms.
+
+Kept free of any GUI imports so they can be driven headlessly (see
+benchmark.py) as well as from the Tk front end in main.py.
+"""
+
+import random
+from array import array
+from collections import deque
+import heapq
+
+from maze_grid import MazeGrid, OPEN, WALL
+from junction_graph import JunctionGraph
+from neighbor_table import NeighborTable
+from bucket_queue import BucketQueue
+from terrain import step_costs
+from A_star_search import iter_a_star
+from distance_field import DistanceField
+from landmarks import BatchSolver
+from solver_stream import VISIT, PUSH, PATH, STOPPED, collect
+from fast_generators import BinaryTreeGenerator, SidewinderGenerator
+from eller_generator import EllerGenerator
+from spanning_tree_generators import KruskalGenerator, PrimGenerator
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# MAZE ALGORITHMS
+# ══════════════════════════════════════════════════════════════════════════════
+
+class MazeGenerator:
+    name = 'backtracker'  # Recorded in saved maze files and maze cache keys
+    
+    def __init__(self, width, height, seed=None):
+        """
+        width, height: odd maze dimensions in cells
+        seed: makes the maze reproducible; a random one is drawn when omitted
+        """
+        self.width = width
+        self.height = height
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)  # Own stream, independent of the global one
+    
+    def generate(self):
+        w, h = self.width, self.height
+        maze = MazeGrid(w, h)
+        cells = maze.cells
+        stack = [(1, 1)]
+        cells[w + 1] = OPEN
+        
+        while stack:
+            x, y = stack[-1]
+            neighbors = []
+            for dx, dy in [(0, -2), (0, 2), (-2, 0), (2, 0)]:
+                nx, ny = x + dx, y + dy
+                if 0 < nx < w - 1 and 0 < ny < h - 1 and cells[ny * w + nx] == WALL:
+                    neighbors.append((nx, ny, dx // 2, dy // 2))
+            if neighbors:
+                nx, ny, wx, wy = self.rng.choice(neighbors)
+                cells[(y + wy) * w + x + wx] = OPEN
+                cells[ny * w + nx] = OPEN
+                stack.append((nx, ny))
+            else:
+                stack.pop()
+        
+        cells[w + 1] = OPEN
+        cells[(h - 2) * w + w - 2] = OPEN
+        return maze
+
+
+# Every generator takes (width, height, seed=None) and returns a MazeGrid from generate()
+GENERATORS = {cls.name: cls for cls in (MazeGenerator, BinaryTreeGenerator, SidewinderGenerator,
+                                        EllerGenerator, KruskalGenerator, PrimGenerator)}
+
+
+def _flagged(flags):
+    """Flat indices of the cells set in the bytearray ``flags``."""
+    i = flags.find(1)
+    while i != -1:
+        yield i
+        i = flags.find(1, i + 1)
+
+
+def _reached(dist):
+    """Flat indices of the cells with a cost in ``dist`` (-1 = unreached)."""
+    return (i for i, d in enumerate(dist) if d >= 0)
+
+
+class MazeSolver:
+    def __init__(self, maze, cache=None, start=None, end=None):
+        # Legacy list-of-lists mazes are packed once; MazeGrid is used as-is
+        self.grid = maze if isinstance(maze, MazeGrid) else MazeGrid.from_rows(maze)
+        self.maze = maze
+        self.height = self.grid.height
+        self.width = self.grid.width
+        # (x, y) endpoints; the defaults are the generator's corners
+        self.start = tuple(start) if start is not None else (1, 1)
+        self.end = tuple(end) if end is not None else (self.width - 2, self.height - 2)
+        self.cache = cache  # Optional SolutionCache shared between solvers
+    
+    def solve(self, method, budget=None, metrics=None):
+        """Run ``self.<method>()``, answering from ``self.cache`` when possible.
+        
+        Results cut short by ``budget`` are partial and never cached; cache
+        hits run no search, so ``metrics`` records nothing for them.
+        """
+        if self.cache is None:
+            return getattr(self, method)(budget=budget, metrics=metrics)
+        key = self.cache.key(self.grid, method, self.start, self.end)
+        result = self.cache.get(key)
+        if result is None:
+            result = getattr(self, method)(budget=budget, metrics=metrics)
+            if budget is None or not budget.stopped:
+                self.cache.put(key, result)
+        return result
+    
+    def get_neighbors(self, x, y):
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return []
+        mask, steps = self._neighbor_steps()
+        i = y * self.width + x
+        return [self.grid.coords(i + d) for d in steps[mask[i]]]
+    
+    def _neighbor_steps(self):
+        """``(mask, steps)`` of the grid's shared NeighborTable.
+        
+        The open neighbors of flat cell ``i`` are ``i + d`` for each ``d`` in
+        ``steps[mask[i]]``, in the order down, up, right, left.
+        """
+        table = NeighborTable.of(self.grid)
+        return table.mask, table.steps()
+    
+    def _cell_array(self):
+        """One ``int`` per cell, all -1: parent links (-1 = none) or costs (-1 = unreached)."""
+        return array('i', [-1]) * (self.width * self.height)
+    
+    def _build_path(self, parent, i):
+        """(x, y) cells from the search root to flat cell ``i``."""
+        to_xy = self.grid.coords
+        path = []
+        while i != -1:
+            path.append(to_xy(i))
+            i = parent[i]
+        return path[::-1]
+    
+    def _stop(self, budget, parent, reached, path=None):
+        """Final events of a search stopped by ``budget``.
+        
+        ``path`` is the best complete path found so far, if any; otherwise the
+        partial path leads to the cell closest to the goal among ``reached``
+        (flat indices).
+        """
+        if path is None:
+            (ex, ey), w = self.end, self.width
+            best = min(reached, key=lambda i: abs(i % w - ex) + abs(i // w - ey))
+            path = self._build_path(parent, best)
+        yield STOPPED, budget.reason
+        yield PATH, path
+    
+    # ─── streaming searches ───
+    # Each iter_* generator yields (VISIT, cell) per expansion, (PUSH, cell)
+    # per frontier insertion when ``frontier`` is set, and finally
+    # (PATH, path or None). The solve_* methods drain them with ``collect``.
+    # With a ``budget`` (search_budget.Budget) they check in every
+    # ``budget.every`` expansions and, once it runs out, end with
+    # (STOPPED, reason) and the best partial path instead. A ``metrics`` hook
+    # (solver_metrics.SolverMetrics) is told about every frontier operation.
+    # Internally cells are flat indices (y * width + x) and per-cell state
+    # lives in preallocated bytearrays / array('i'); (x, y) tuples are only
+    # made for the events and paths handed out.
+    
+    def iter_solve(self, method, frontier=False, budget=None, metrics=None):
+        """Event stream of ``solve_<name>`` given as ``method`` (e.g. 'solve_bfs')."""
+        return getattr(self, 'iter_' + method[len('solve_'):])(frontier, budget=budget, metrics=metrics)
+    
+    def iter_dfs(self, frontier=False, budget=None, metrics=None):
+        # Parent pointers instead of per-entry path copies: memory stays linear in cells
+        mask, steps = self._neighbor_steps()
+        to_xy = self.grid.coords
+        s, t = self.grid.index(*self.start), self.grid.index(*self.end)
+        stack = [s]
+        parent = self._cell_array()
+        visited = bytearray(len(parent))
+        visited[s] = 1
+        left = -1 if budget is None else 0  # Expansions until the next budget check
+        if metrics is not None:
+            metrics.push(1)
+        while stack:
+            if not left:
+                left = budget.grant()
+                if not left:
+                    yield from self._stop(budget, parent, _flagged(visited))
+                    return
+            left -= 1
+            current = stack.pop()
+            if metrics is not None:
+                metrics.pop()
+            yield VISIT, to_xy(current)
+            if current == t:
+                yield PATH, self._build_path(parent, current)
+                return
+            nbrs = steps[mask[current]]
+            if metrics is not None:
+                metrics.expand(len(nbrs))
+            for d in nbrs:
+                n = current + d
+                if not visited[n]:
+                    visited[n] = 1
+                    parent[n] = current
+                    stack.append(n)
+                    if metrics is not None:
+                        metrics.push(len(stack))
+                    if frontier:
+                        yield PUSH, to_xy(n)
+                elif metrics is not None:
+                    metrics.duplicate()
+        yield PATH, None
+    
+    def iter_bfs(self, frontier=False, budget=None, metrics=None):
+        mask, steps = self._neighbor_steps()
+        to_xy = self.grid.coords
+        s, t = self.grid.index(*self.start), self.grid.index(*self.end)
+        queue = deque([s])
+        parent = self._cell_array()
+        visited = bytearray(len(parent))
+        visited[s] = 1
+        left = -1 if budget is None else 0  # Expansions until the next budget check
+        if metrics is not None:
+            metrics.push(1)
+        while queue:
+            if not left:
+                left = budget.grant()
+                if not left:
+                    yield from self._stop(budget, parent, _flagged(visited))
+                    return
+            left -= 1
+            current = queue.popleft()
+            if metrics is not None:
+                metrics.pop()
+            yield VISIT, to_xy(current)
+            if current == t:
+                yield PATH, self._build_path(parent, current)
+                return
+            nbrs = steps[mask[current]]
+            if metrics is not None:
+                metrics.expand(len(nbrs))
+            for d in nbrs:
+                n = current + d
+                if not visited[n]:
+                    visited[n] = 1
+                    parent[n] = current
+                    queue.append(n)
+                    if metrics is not None:
+                        metrics.push(len(queue))
+                    if frontier:
+                        yield PUSH, to_xy(n)
+                elif metrics is not None:
+                    metrics.duplicate()
+        yield PATH, None
+    
+    def iter_astar(self, frontier=False, budget=None, metrics=None):
+        mask, steps = self._neighbor_steps()
+        to_xy, w = self.grid.coords, self.width
+        s, t = self.grid.index(*self.start), self.grid.index(*self.end)
+        ex, ey = self.end
+        def h(i): return abs(i % w - ex) + abs(i // w - ey)
+        open_set = [(h(s), 0, s)]
+        parent = self._cell_array()
+        g = self._cell_array()
+        g[s] = 0
+        visited = bytearray(len(g))
+        left = -1 if budget is None else 0
+        if metrics is not None:
+            metrics.push(1)
+        while open_set:
+            _, _, current = heapq.heappop(open_set)
+            if metrics is not None:
+                metrics.pop()
+            if visited[current]:
+                if metrics is not None:
+                    metrics.stale()
+                continue
+            if not left:
+                left = budget.grant()
+                if not left:
+                    yield from self._stop(budget, parent, _reached(g))
+                    return
+            left -= 1
+            visited[current] = 1
+            yield VISIT, to_xy(current)
+            if current == t:
+                yield PATH, self._build_path(parent, current)
+                return
+            nbrs = steps[mask[current]]
+            if metrics is not None:
+                metrics.expand(len(nbrs))
+            ng = g[current] + 1
+            for d in nbrs:
+                n = current + d
+                if g[n] < 0 or ng < g[n]:
+                    parent[n] = current
+                    g[n] = ng
+                    heapq.heappush(open_set, (ng + h(n), ng, n))
+                    if metrics is not None:
+                        metrics.push(len(open_set))
+                    if frontier:
+                        yield PUSH, to_xy(n)
+                elif metrics is not None:
+                    metrics.duplicate()
+        yield PATH, None
+    
+    def iter_greedy(self, frontier=False, budget=None, metrics=None):
+        mask, steps = self._neighbor_steps()
+        to_xy, w = self.grid.coords, self.width
+        s, t = self.grid.index(*self.start), self.grid.index(*self.end)
+        ex, ey = self.end
+        def h(i): return abs(i % w - ex) + abs(i // w - ey)
+        open_set = [(h(s), s)]
+        parent = self._cell_array()
+        visited = bytearray(len(parent))
+        left = -1 if budget is None else 0
+        if metrics is not None:
+            metrics.push(1)
+        while open_set:
+            _, current = heapq.heappop(open_set)
+            if metrics is not None:
+                metrics.pop()
+            if visited[current]:
+                if metrics is not None:
+                    metrics.stale()
+                continue
+            if not left:
+                left = budget.grant()
+                if not left:
+                    visited[current] = 1    # Reached, though never expanded
+                    yield from self._stop(budget, parent, _flagged(visited))
+                    return
+            left -= 1
+            visited[current] = 1
+            yield VISIT, to_xy(current)
+            if current == t:
+                yield PATH, self._build_path(parent, current)
+                return
+            nbrs = steps[mask[current]]
+            if metrics is not None:
+                metrics.expand(len(nbrs))
+            for d in nbrs:
+                n = current + d
+                if not visited[n]:
+                    parent[n] = current
+                    heapq.heappush(open_set, (h(n), n))
+                    if metrics is not None:
+                        metrics.push(len(open_set))
+                    if frontier:
+                        yield PUSH, to_xy(n)
+                elif metrics is not None:
+                    metrics.duplicate()
+        yield PATH, None
+    
+    def _join_paths(self, parent_start, parent_end, meet):
+        """Splice the two half-paths of a bidirectional search at flat cell ``meet``."""
+        to_xy = self.grid.coords
+        path = self._build_path(parent_start, meet)
+        i = parent_end[meet]
+        while i != -1:
+            path.append(to_xy(i))
+            i = parent_end[i]
+        return path
+    
+    def iter_bibfs(self, frontier=False, budget=None, metrics=None):
+        """BFS from both ends at once, alternating one expansion per side."""
+        if self.start == self.end:
+            yield VISIT, self.start
+            yield PATH, [self.start]
+            return
+        mask, steps = self._neighbor_steps()
+        to_xy = self.grid.coords
+        s, t = self.grid.index(*self.start), self.grid.index(*self.end)
+        dist = (self._cell_array(), self._cell_array())
+        dist[0][s] = dist[1][t] = 0
+        parent = (self._cell_array(), self._cell_array())
+        queues = (deque([s]), deque([t]))
+        best, meet = float('inf'), None
+        side = 0
+        left = -1 if budget is None else 0
+        if metrics is not None:
+            metrics.push(1)
+            metrics.push(2)
+        while queues[0] and queues[1]:
+            # No unexpanded pair of cells can still beat the best meeting point
+            if dist[0][queues[0][0]] + dist[1][queues[1][0]] + 1 >= best:
+                break
+            if not left:
+                left = budget.grant()
+                if not left:
+                    yield from self._stop(budget, parent[0], _reached(dist[0]), None if meet is None
+                                          else self._join_paths(parent[0], parent[1], meet))
+                    return
+            left -= 1
+            queue, seen, other = queues[side], dist[side], dist[1 - side]
+            current = queue.popleft()
+            yield VISIT, to_xy(current)
+            nbrs = steps[mask[current]]
+            if metrics is not None:
+                metrics.pop()
+                metrics.expand(len(nbrs))
+            for d in nbrs:
+                n = current + d
+                if seen[n] < 0:
+                    seen[n] = seen[current] + 1
+                    parent[side][n] = current
+                    queue.append(n)
+                    if metrics is not None:
+                        metrics.push(len(queues[0]) + len(queues[1]))
+                    if frontier:
+                        yield PUSH, to_xy(n)
+                    if other[n] >= 0 and seen[n] + other[n] < best:
+                        best, meet = seen[n] + other[n], n
+                elif metrics is not None:
+                    metrics.duplicate()
+            side = 1 - side
+        yield PATH, (None if meet is None else self._join_paths(parent[0], parent[1], meet))
+    
+    def iter_biastar(self, frontier=False, budget=None, metrics=None):
+        """Bidirectional A* with balanced (averaged) potentials.
+        
+        Both sides order their frontier by ``2*g + (h_end - h_start)`` (sign
+        flipped for the backward side), which keeps the two searches
+        consistent with each other, so they can stop as soon as the two
+        frontier minima together reach the best meeting found so far.
+        """
+        if self.start == self.end:
+            yield VISIT, self.start
+            yield PATH, [self.start]
+            return
+        mask, steps = self._neighbor_steps()
+        to_xy, w = self.grid.coords, self.width
+        s, t = self.grid.index(*self.start), self.grid.index(*self.end)
+        (sx, sy), (ex, ey) = self.start, self.end
+        def p(i):
+            x, y = i % w, i // w
+            return (abs(x - ex) + abs(y - ey)) - (abs(x - sx) + abs(y - sy))
+        sign = (1, -1)
+        g = (self._cell_array(), self._cell_array())
+        g[0][s] = g[1][t] = 0
+        parent = (self._cell_array(), self._cell_array())
+        open_sets = ([(p(s), 0, s)], [(-p(t), 0, t)])
+        visited = (bytearray(len(g[0])), bytearray(len(g[1])))
+        best, meet = float('inf'), None
+        side = 0
+        left = -1 if budget is None else 0
+        if metrics is not None:
+            metrics.push(1)
+            metrics.push(2)
+        while open_sets[0] and open_sets[1]:
+            # Keys are doubled reduced distances, hence the comparison with 2*best
+            if open_sets[0][0][0] + open_sets[1][0][0] >= 2 * best:
+                break
+            open_set, cost, other = open_sets[side], g[side], g[1 - side]
+            _, _, current = heapq.heappop(open_set)
+            if metrics is not None:
+                metrics.pop()
+                if visited[side][current]:
+                    metrics.stale()
+            if not visited[side][current]:
+                if not left:
+                    left = budget.grant()
+                    if not left:
+                        yield from self._stop(budget, parent[0], _reached(g[0]), None if meet is None
+                                              else self._join_paths(parent[0], parent[1], meet))
+                        return
+                left -= 1
+                visited[side][current] = 1
+                yield VISIT, to_xy(current)
+                nbrs = steps[mask[current]]
+                if metrics is not None:
+                    metrics.expand(len(nbrs))
+                ng = cost[current] + 1
+                for d in nbrs:
+                    n = current + d
+                    if cost[n] < 0 or ng < cost[n]:
+                        parent[side][n] = current
+                        cost[n] = ng
+                        heapq.heappush(open_set, (2 * ng + sign[side] * p(n), ng, n))
+                        if metrics is not None:
+                            metrics.push(len(open_sets[0]) + len(open_sets[1]))
+                        if frontier:
+                            yield PUSH, to_xy(n)
+                        if other[n] >= 0 and ng + other[n] < best:
+                            best, meet = ng + other[n], n
+                    elif metrics is not None:
+                        metrics.duplicate()
+            side = 1 - side
+        yield PATH, (None if meet is None else self._join_paths(parent[0], parent[1], meet))
+    
+    def iter_dijkstra(self, frontier=False, budget=None, metrics=None):
+        """Cheapest path under the grid's terrain weights (see terrain.py).
+        
+        Dijkstra on a bucket queue (Dial's algorithm): step costs are small
+        integers, so pushes and pops are O(1) instead of O(log n) on a heap.
+        Without weights every step costs 1 and the path is a shortest one.
+        """
+        return self._iter_dial(False, frontier, budget, metrics)
+    
+    def iter_weighted_astar(self, frontier=False, budget=None, metrics=None):
+        """A* for the cheapest path under the terrain weights, on the same bucket queue.
+        
+        No step costs less than 1, so the Manhattan distance remains a
+        consistent heuristic and the path is as cheap as Dijkstra's.
+        """
+        return self._iter_dial(True, frontier, budget, metrics)
+    
+    def _iter_dial(self, guided, frontier, budget, metrics):
+        mask, steps = self._neighbor_steps()
+        to_xy, w = self.grid.coords, self.width
+        costs = step_costs(self.grid)
+        s, t = self.grid.index(*self.start), self.grid.index(*self.end)
+        ex, ey = self.end
+        if guided:
+            def h(i): return abs(i % w - ex) + abs(i // w - ey)
+        else:
+            def h(i): return 0
+        g = self._cell_array()
+        g[s] = 0
+        parent = self._cell_array()
+        visited = bytearray(len(g))
+        # A key exceeds the last popped one by at most the dearest step,
+        # plus 1 for the heuristic
+        queue = BucketQueue(max(costs) + guided)
+        queue.push(h(s), s)
+        left = -1 if budget is None else 0
+        if metrics is not None:
+            metrics.push(1)
+        while queue:
+            _, current = queue.pop()
+            if metrics is not None:
+                metrics.pop()
+            if visited[current]:
+                if metrics is not None:
+                    metrics.stale()
+                continue
+            if not left:
+                left = budget.grant()
+                if not left:
+                    yield from self._stop(budget, parent, _reached(g))
+                    return
+            left -= 1
+            visited[current] = 1
+            yield VISIT, to_xy(current)
+            if current == t:
+                yield PATH, self._build_path(parent, current)
+                return
+            nbrs = steps[mask[current]]
+            if metrics is not None:
+                metrics.expand(len(nbrs))
+            gc = g[current]
+            for d in nbrs:
+                n = current + d
+                ng = gc + costs[n]
+                if g[n] < 0 or ng < g[n]:
+                    g[n] = ng
+                    parent[n] = current
+                    queue.push(ng + h(n), n)
+                    if metrics is not None:
+                        metrics.push(len(queue))
+                    if frontier:
+                        yield PUSH, to_xy(n)
+                elif metrics is not None:
+                    metrics.duplicate()
+        yield PATH, None
+    
+    def iter_junction(self, frontier=False, method='astar', budget=None, metrics=None):
+        """Search the corridor-compressed junction graph ('bfs', 'dijkstra' or 'astar').
+        
+        The graph is built on first use and cached on the grid, so later
+        queries and other players on the same maze skip the preprocessing.
+        """
+        return JunctionGraph.of(self.grid).iter_solve(self.start, self.end, method, frontier, budget, metrics)
+    
+    def iter_astar_search(self, frontier=False, budget=None, metrics=None):
+        """A* from A_star_search (best-g table, lazy deletion), on (row, col) cells."""
+        (sx, sy), (ex, ey) = self.start, self.end
+        for kind, data in iter_a_star(self.grid, (sy, sx), (ey, ex), frontier, budget, metrics):
+            if kind == PATH:
+                yield PATH, ([(c, r) for r, c in data] if data else None)
+            elif kind == STOPPED:
+                yield kind, data
+            else:
+                yield kind, (data[1], data[0])
+    
+    def iter_field(self, frontier=False, budget=None, metrics=None):
+        """Walk the distance field toward ``self.end``: O(path) once the field exists.
+        
+        The field (one reverse BFS) is cached on the grid per goal, so every
+        later start solved toward the same end skips the search entirely;
+        there is no frontier, so ``metrics`` records nothing.
+        """
+        # Building the field is one uninterrupted BFS, so the budget is only
+        # checked before it starts
+        if budget is not None and not budget.grant():
+            yield from self._stop(budget, None, (), [self.start])
+            return
+        path = DistanceField.of(self.grid, self.end).path_from(self.start)
+        for cell in path or ():
+            yield VISIT, cell
+        yield PATH, path
+    
+    def iter_alt(self, frontier=False, budget=None, metrics=None):
+        """A* with landmark (ALT) lower bounds; the landmark tables are cached per maze."""
+        return BatchSolver(self.grid).iter_solve(self.start, self.end, frontier, budget, metrics)
+    
+    # ─── complete results ───
+    
+    def solve_dfs(self, budget=None, metrics=None):
+        return collect(self.iter_dfs(budget=budget, metrics=metrics))
+    
+    def solve_bfs(self, budget=None, metrics=None):
+        return collect(self.iter_bfs(budget=budget, metrics=metrics))
+    
+    def solve_astar(self, budget=None, metrics=None):
+        return collect(self.iter_astar(budget=budget, metrics=metrics))
+    
+    def solve_greedy(self, budget=None, metrics=None):
+        return collect(self.iter_greedy(budget=budget, metrics=metrics))
+    
+    def solve_bibfs(self, budget=None, metrics=None):
+        return collect(self.iter_bibfs(budget=budget, metrics=metrics))
+    
+    def solve_biastar(self, budget=None, metrics=None):
+        return collect(self.iter_biastar(budget=budget, metrics=metrics))
+    
+    def solve_dijkstra(self, budget=None, metrics=None):
+        return collect(self.iter_dijkstra(budget=budget, metrics=metrics))
+    
+    def solve_weighted_astar(self, budget=None, metrics=None):
+        return collect(self.iter_weighted_astar(budget=budget, metrics=metrics))
+    
+    def solve_junction(self, method='astar', budget=None, metrics=None):
+        return collect(self.iter_junction(method=method, budget=budget, metrics=metrics))
+    
+    def solve_astar_search(self, budget=None, metrics=None):
+        return collect(self.iter_astar_search(budget=budget, metrics=metrics))
+    
+    def solve_field(self, budget=None, metrics=None):
+        return collect(self.iter_field(budget=budget, metrics=metrics))
+    
+    def solve_alt(self, budget=None, metrics=None):
+        return collect(self.iter_alt(budget=budget, metrics=metrics))
+    
+    def solve_batch(self, queries, landmarks=4):
+        """Solve every ``(start, end)`` pair in ``queries`` against this maze.
+        
+        Landmark tables are built once and shared by all queries; returns a
+        list of ``(path, explored)`` in query order.
+        """
+        return list(BatchSolver(self.grid, landmarks).solve_many(queries))
@@ -0,0 +1,78 @@
+"""
+Persistent on-disk cache of generated mazes.
+
+Generation is deterministic for a given ``(generator, width, height, seed)``,
+so a maze only ever has to be generated once: ``MazeCache.generate`` stores
+each new maze as a bit-packed ``.maze`` file (see maze_file.py) and later
+calls load it back instead, which takes milliseconds even for mazes that
+take seconds to generate. Benchmark and regression runs use it to work on
+identical mazes across runs.
+
+Delete the cache directory after changing a generator: entries are keyed by
+the generator's name, not its code.
+"""
+
+import os
+import tempfile
+
+import maze_file
+
+
+def default_directory():
+    """``$MAZE_CACHE_DIR``, else a folder under the user's cache directory."""
+    return os.environ.get('MAZE_CACHE_DIR') or os.path.join(
+        os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+        'super_maze_bros')
+
+
+class MazeCache:
+    def __init__(self, directory=None):
+        self.directory = directory or default_directory()
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, generator, width, height, seed):
+        return os.path.join(self.directory, f"{generator}-{width}x{height}-{seed}.maze")
+
+    def get(self, generator, width, height, seed):
+        """The cached maze, or None if absent or unreadable (counted as a miss)."""
+        if not maze_file.storable_seed(seed):
+            self.misses += 1     # Never stored, see generate
+            return None
+        try:
+            grid, info = maze_file.load(self.path(generator, width, height, seed))
+        except (OSError, ValueError):
+            grid = info = None
+        if info is None or (info.generator, info.width, info.height, info.seed) != (generator, width, height, seed):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return grid
+
+    def put(self, grid, generator, seed):
+        """Store ``grid``; written to a temporary file first so readers never see half a maze."""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        os.close(fd)
+        try:
+            maze_file.save(tmp, grid, seed=seed, generator=generator)
+            os.replace(tmp, self.path(generator, grid.width, grid.height, seed))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def generate(self, generator_cls, width, height, seed):
+        """``generator_cls(width, height, seed).generate()``, from the cache when possible."""
+        grid = self.get(generator_cls.name, width, height, seed)
+        if grid is None:
+            grid = generator_cls(width, height, seed).generate()
+            if not maze_file.storable_seed(seed):
+                return grid     # The file header cannot record this seed
+            try:
+                self.put(grid, generator_cls.name, seed)
+            except OSError:
+                pass    # An unwritable cache only costs the speedup
+        return grid
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses}
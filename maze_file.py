@@ -0,0 +1,287 @@
+"""
+Bit-packed binary maze files.
+
+Layout (little-endian)::
+
+    header  36 bytes   magic b'MAZ1', width, height (u32), seed (i64, -1 if
+                       unknown), start x, start y, end x, end y (u32)
+    name    16 bytes   generator name, ASCII, NUL-padded
+    body    ceil(width * height / 8) bytes, one bit per cell in row-major
+            order, bit ``i & 7`` of byte ``i >> 3``; 1 = WALL. Padding bits
+            in the last byte are set, so they read as walls.
+
+A 1001x1001 maze takes about 125 KB instead of the 1 MB of a ``MazeGrid``.
+``load`` unpacks the body into an ordinary grid; ``load(path, mapped=True)``
+memory-maps the file instead and returns a grid backed by ``PackedCells``, so
+even huge mazes open instantly and pages are read only as they are touched.
+Solvers touch all of them once: the first solve builds the maze's neighbor
+table (one byte per cell, see neighbor_table.py) from the whole packed body.
+"""
+
+from collections import namedtuple
+import mmap
+import re
+import struct
+
+from maze_grid import MazeGrid, OPEN, WALL
+
+
+MAGIC = b'MAZ1'
+_HEADER = struct.Struct('<4sIIqIIII16s')
+HEADER_SIZE = _HEADER.size
+
+# Byte <-> 8 cells (LSB first), and set bits per byte
+_UNPACK = [bytes((b >> k) & 1 for k in range(8)) for b in range(256)]
+_PACK = {cells: b for b, cells in enumerate(_UNPACK)}
+_POPCOUNT = bytes(bin(b).count('1') for b in range(256))
+# Byte -> its 8 cells as open indicators (1 = OPEN), for PackedCells.open_cells
+_OPEN_CELLS = [bytes(1 - cell for cell in cells) for cells in _UNPACK]
+_HAS_OPEN = re.compile(b'[^\xff]')
+_HAS_WALL = re.compile(b'[^\x00]')
+
+MazeInfo = namedtuple('MazeInfo', 'width height seed generator start end')
+
+
+def storable_seed(seed):
+    """Whether ``seed`` fits the header: an i64 other than -1, which marks "unknown"."""
+    return isinstance(seed, int) and -2 ** 63 <= seed < 2 ** 63 and seed != -1
+
+
+def _check_seed(seed):
+    if seed is not None and not storable_seed(seed):
+        raise ValueError(f"seed {seed!r} cannot be stored: seeds must be 64-bit integers other than -1")
+
+
+def pack(cells):
+    """One bit per cell of a ``WALL``/``OPEN`` byte buffer, walls padding the end."""
+    cells = bytes(cells)
+    tail = len(cells) % 8
+    if tail:
+        cells += bytes([WALL]) * (8 - tail)
+    return bytes(_PACK[cells[i:i + 8]] for i in range(0, len(cells), 8))
+
+
+def unpack(data, count):
+    """Inverse of ``pack``: ``count`` cells as a bytearray."""
+    cells = bytearray(b''.join(_UNPACK[b] for b in data))
+    del cells[count:]
+    return cells
+
+
+class PackedCells:
+    """Read-only, cell-indexed view of a bit-packed body (e.g. inside an mmap).
+
+    Supports what ``MazeGrid`` and the solvers use of a ``bytearray``:
+    indexing, slicing, ``len``, ``find``, ``count`` and ``bytes()``.
+    """
+
+    __slots__ = ('_buf', '_offset', '_len')
+
+    def __init__(self, buf, offset, count):
+        self._buf = buf
+        self._offset = offset
+        self._len = count
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(self._len)
+            if step == 1 and start < stop:
+                first, last = start >> 3, (stop + 7) >> 3
+                body = self._buf[self._offset + first:self._offset + last]
+                cells = unpack(body, (last - first) * 8)
+                return cells[start - first * 8:stop - first * 8]
+            return bytearray(self[k] for k in range(start, stop, step))
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError("cell index out of range")
+        return (self._buf[self._offset + (i >> 3)] >> (i & 7)) & 1
+
+    def __iter__(self):
+        return iter(self[:])
+
+    def __bytes__(self):
+        return bytes(self[:])
+
+    def find(self, value, start=0):
+        """Index of the first cell equal to ``value`` at or after ``start``, or -1."""
+        n = self._len
+        i = max(start, 0)
+        while i < n and i & 7:
+            if self[i] == value:
+                return i
+            i += 1
+        if i >= n:
+            return -1
+        # Whole bytes: let the regex engine skip runs that cannot match
+        pattern = _HAS_OPEN if value == OPEN else _HAS_WALL
+        m = pattern.search(self._buf, self._offset + (i >> 3), self._offset + ((n + 7) >> 3))
+        if m is None:
+            return -1
+        i = (m.start() - self._offset) * 8
+        for k in range(i, min(i + 8, n)):
+            if self[k] == value:
+                return k
+        return -1   # Only padding matched
+
+    def open_cells(self):
+        """One byte per cell, 1 if OPEN else 0, read straight off the packed body."""
+        body = self._buf[self._offset:self._offset + ((self._len + 7) >> 3)]
+        return b''.join(map(_OPEN_CELLS.__getitem__, body))[:self._len]
+
+    def count(self, value):
+        body = self._buf[self._offset:self._offset + ((self._len + 7) >> 3)]
+        walls = sum(bytes(body).translate(_POPCOUNT)) - (-self._len % 8)
+        return walls if value == WALL else self._len - walls
+
+
+def save(path, grid, seed=None, generator='', start=None, end=None):
+    """Write ``grid`` (and where it came from) to ``path``.
+
+    ``start`` and ``end`` are ``(x, y)`` and default to the corners used by
+    ``MazeSolver``. Raises ``ValueError`` for a seed ``storable_seed`` rejects.
+    """
+    _check_seed(seed)
+    with open(path, 'wb') as f:
+        write_rows(f, grid.width, grid.height, [grid.cells], seed, generator, start, end)
+
+
+def write_rows(out, width, height, rows, seed=None, generator='', start=None, end=None):
+    """Stream a maze file to the binary file object ``out``.
+
+    ``rows`` yields the cells in row-major order in chunks of any length
+    (typically one row at a time); they are packed as they arrive, so a
+    generator of rows is written without ever holding the whole maze.
+    """
+    _check_seed(seed)
+    start = start or (1, 1)
+    end = end or (width - 2, height - 2)
+    out.write(_HEADER.pack(MAGIC, width, height, -1 if seed is None else seed,
+                           start[0], start[1], end[0], end[1],
+                           generator.encode('ascii')[:16]))
+    carry = b''
+    written = 0
+    for chunk in rows:
+        chunk = carry + bytes(chunk)
+        whole = len(chunk) - len(chunk) % 8
+        out.write(pack(chunk[:whole]))
+        carry = chunk[whole:]
+        written += whole
+    if written + len(carry) != width * height:
+        raise ValueError(f"expected {width * height} cells, got {written + len(carry)}")
+    if carry:
+        out.write(pack(carry))
+
+
+def read_info(data):
+    """Parse the header at the start of ``data`` into a ``MazeInfo``."""
+    if len(data) < HEADER_SIZE:
+        raise ValueError("not a maze file: truncated header")
+    magic, w, h, seed, sx, sy, ex, ey, name = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"not a maze file: bad magic {magic!r}")
+    if len(data) < HEADER_SIZE + (w * h + 7) // 8:
+        raise ValueError("not a maze file: truncated body")
+    return MazeInfo(w, h, None if seed == -1 else seed,
+                    name.rstrip(b'\0').decode('ascii'), (sx, sy), (ex, ey))
+
+
+def load(path, mapped=False):
+    """Read a maze file; returns ``(grid, info)``.
+
+    With ``mapped`` the file is memory-mapped and the grid reads its cells
+    straight from the mapping (read-only, paged in lazily); otherwise the
+    body is unpacked into a regular one-byte-per-cell grid.
+    """
+    with open(path, 'rb') as f:
+        if mapped:
+            # The mapping keeps its own handle, so the file object may close
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            data = f.read()
+    info = read_info(data)
+    count = info.width * info.height
+    if mapped:
+        cells = PackedCells(data, HEADER_SIZE, count)
+    else:
+        cells = unpack(data[HEADER_SIZE:HEADER_SIZE + (count + 7) // 8], count)
+    return MazeGrid(info.width, info.height, cells), info
+
+
+def tests():
+    import io
+    import os
+    import tempfile
+    from maze_algorithms import GENERATORS, MazeSolver
+
+    print("Running Maze File Tests...\n")
+
+    # TEST CASE 1: pack / unpack round-trip, walls padding the last byte
+    for count in (1, 7, 8, 9, 63):
+        cells = bytearray((i * 7 // 3) & 1 for i in range(count))
+        data = pack(cells)
+        assert len(data) == (count + 7) // 8, "Test 1 Failed: Wrong packed size"
+        assert unpack(data, count) == cells, "Test 1 Failed: Cells changed in the round-trip"
+        assert unpack(data, len(data) * 8)[count:] == bytes([WALL]) * (-count % 8), "Test 1 Failed: Padding is not walls"
+    print("Test 1 Passed: Cells survive pack / unpack.")
+
+    # TEST CASE 2: Streamed rows and header round-trip
+    grid = GENERATORS['backtracker'](21, 15, 42).generate()
+    out = io.BytesIO()
+    write_rows(out, grid.width, grid.height, grid, seed=42, generator='backtracker')
+    data = out.getvalue()
+    info = read_info(data)
+    assert info == MazeInfo(21, 15, 42, 'backtracker', (1, 1), (19, 13)), "Test 2 Failed: Wrong header"
+    assert unpack(data[HEADER_SIZE:], 21 * 15) == grid.cells, "Test 2 Failed: Wrong body"
+    out = io.BytesIO()
+    write_rows(out, grid.width, grid.height, [grid.cells])
+    assert read_info(out.getvalue()).seed is None, "Test 2 Failed: Unknown seed not kept"
+    try:
+        write_rows(io.BytesIO(), grid.width, grid.height, [grid.cells[:-1]])
+        assert False, "Test 2 Failed: Short body accepted"
+    except ValueError:
+        pass
+    try:
+        read_info(b'NOPE' + data[4:])
+        assert False, "Test 2 Failed: Bad magic accepted"
+    except ValueError:
+        pass
+    print("Test 2 Passed: write_rows and read_info agree.")
+
+    # TEST CASE 3: Memory-mapped files read like unpacked ones
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'maze.bin')
+        save(path, grid, seed=2 ** 63 - 1, generator='backtracker', start=(1, 1), end=(19, 1))
+        plain, info = load(path)
+        mapped, mapped_info = load(path, mapped=True)
+        assert info == mapped_info and info.seed == 2 ** 63 - 1, "Test 3 Failed: Headers differ"
+        assert plain.cells == grid.cells and bytes(mapped.cells) == bytes(grid.cells), "Test 3 Failed: Cells differ"
+        assert mapped.cells[20:40] == grid.cells[20:40], "Test 3 Failed: Mapped slice differs"
+        assert mapped.cells.find(OPEN, 5) == grid.cells.find(OPEN, 5), "Test 3 Failed: Mapped find differs"
+        assert mapped.cells.count(WALL) == grid.cells.count(WALL), "Test 3 Failed: Mapped count differs"
+        assert mapped.cells.open_cells() == grid.cells.translate(bytes([1, 0]) + bytes(254)), \
+            "Test 3 Failed: Mapped open cells differ"
+        expected, _ = MazeSolver(grid, end=(19, 1)).solve_bfs()
+        path_found, _ = MazeSolver(mapped, start=info.start, end=info.end).solve_bfs()
+        assert path_found == expected, "Test 3 Failed: Mapped grid solves differently"
+        del mapped  # Release the mapping before the directory is removed
+    print("Test 3 Passed: Mapped and unpacked files solve alike.")
+
+    # TEST CASE 4: Seeds the header cannot hold are refused
+    for seed in (-1, 2 ** 63, -2 ** 63 - 1, '7'):
+        try:
+            write_rows(io.BytesIO(), grid.width, grid.height, [grid.cells], seed=seed)
+            assert False, f"Test 4 Failed: Seed {seed!r} accepted"
+        except ValueError:
+            pass
+    assert storable_seed(-2 ** 63) and storable_seed(0), "Test 4 Failed: Valid seed refused"
+    print("Test 4 Passed: Seeds outside 64 bits and -1 are refused.")
+
+    print("\nAll tests passed successfully!")
+
+
+if __name__ == "__main__":
+    tests()
@@ -0,0 +1,291 @@
+"""
+Compact maze grid shared by the generator and every solver.
+
+A maze is stored row-major in one flat ``bytearray`` (one byte per cell,
+``OPEN`` or ``WALL``) instead of a list of lists of Python ints. Indexing
+``grid[y][x]`` returns a zero-copy row view, so code written against the old
+list-of-lists layout keeps working, and ``char_view`` adapts the same buffer
+to the ``'#'`` / ``'S'`` / ``'E'`` character convention used by the
+standalone solvers. An optional second buffer, ``weights``, gives each cell a
+small integer cost for stepping onto it (terrain, see terrain.py).
+"""
+
+import hashlib
+
+OPEN = 0
+WALL = 1
+
+
+class MazeGrid:
+    """Row-major maze of ``width x height`` cells backed by a flat buffer."""
+
+    __slots__ = ('width', 'height', 'cells', 'weights', '_view', '_derived')
+
+    def __init__(self, width, height, cells=None, fill=WALL, weights=None):
+        """
+        width, height: maze dimensions in cells
+        cells: optional existing buffer of ``width * height`` bytes, or any
+               object indexing like one (e.g. ``maze_file.PackedCells``);
+               it is used as-is, not copied
+        fill: initial value of every cell when ``cells`` is not given
+        weights: optional ``width * height`` bytes, the cost (>= 1) of
+                 stepping onto each cell; None means every step costs 1
+        """
+        if cells is None:
+            cells = bytearray([fill]) * (width * height)
+        elif len(cells) != width * height:
+            raise ValueError(f"expected {width * height} cells, got {len(cells)}")
+        if weights is not None and len(weights) != width * height:
+            raise ValueError(f"expected {width * height} weights, got {len(weights)}")
+        self.width = width
+        self.height = height
+        self.cells = cells
+        self.weights = weights
+        try:
+            self._view = memoryview(cells)
+        except TypeError:
+            self._view = cells  # Not a buffer: rows are sliced from it directly
+        self._derived = {}
+
+    def __reduce__(self):
+        # Pickle as the raw buffers (one byte per cell), e.g. for worker processes
+        return (MazeGrid, (self.width, self.height, bytearray(self.cells), WALL, self.weights))
+
+    @classmethod
+    def from_rows(cls, rows, wall_char=None):
+        """Build a grid from a list of rows (ints or characters).
+
+        With ``wall_char`` set, exactly the cells equal to it are walls;
+        otherwise every non-zero cell is a wall (the ``0 = open`` convention).
+        """
+        height, width = len(rows), len(rows[0])
+        cells = bytearray(width * height)
+        i = 0
+        for row in rows:
+            for v in row:
+                if (v == wall_char) if wall_char is not None else v != 0:
+                    cells[i] = WALL
+                i += 1
+        return cls(width, height, cells)
+
+    # ─── list-of-lists compatibility ───
+
+    def __len__(self):
+        return self.height
+
+    def __getitem__(self, y):
+        """Row ``y`` as a zero-copy view; ``grid[y][x]`` is the cell value."""
+        if y < 0:
+            y += self.height
+        if not 0 <= y < self.height:
+            raise IndexError("row index out of range")
+        w = self.width
+        return self._view[y * w:(y + 1) * w]
+
+    def __iter__(self):
+        for y in range(self.height):
+            yield self[y]
+
+    def to_rows(self):
+        """Copy into the legacy list-of-lists layout."""
+        return [list(row) for row in self]
+
+    # ─── flat access ───
+
+    def index(self, x, y):
+        return y * self.width + x
+
+    def coords(self, i):
+        y, x = divmod(i, self.width)
+        return x, y
+
+    def is_open(self, x, y):
+        return (0 <= x < self.width and 0 <= y < self.height
+                and self.cells[y * self.width + x] == OPEN)
+
+    # ─── per-maze preprocessing ───
+
+    def derived(self, key, build):
+        """Return ``build(self)``, computed once per grid and cached under ``key``.
+
+        Used for preprocessing shared by all solvers and players (junction
+        graphs, neighbor tables, ...). Call ``invalidate`` after mutating
+        cells or weights.
+        """
+        try:
+            return self._derived[key]
+        except KeyError:
+            value = self._derived[key] = build(self)
+            return value
+
+    def invalidate(self):
+        self._derived.clear()
+
+    def fingerprint(self):
+        """Content hash of the maze (dimensions, cells, weights), cached until invalidated."""
+        return self.derived('fingerprint', lambda g: hashlib.blake2b(
+            b'%d,%d:' % (g.width, g.height) + bytes(g.cells)
+            + (b'' if g.weights is None else b'w' + bytes(g.weights)), digest_size=16).hexdigest())
+
+    def char_view(self, start=None, end=None):
+        """Adapt the grid to the character convention (``'#'`` walls).
+
+        ``start`` and ``end`` are ``(row, col)`` and default to the corners
+        used by ``MazeSolver``; they read back as ``'S'`` and ``'E'``.
+        """
+        if start is None:
+            start = (1, 1)
+        if end is None:
+            end = (self.height - 2, self.width - 2)
+        return CharGridView(self, start, end)
+
+
+class CharGridView:
+    """Read-only ``'#'`` / ``' '`` / ``'S'`` / ``'E'`` view over a MazeGrid.
+
+    Exposes ``grid``, ``rows`` and ``cols`` like the Maze objects expected by
+    ``DFSMazeSolver``, and indexes as ``view[row][col]`` like the character
+    grids expected by ``bfs_maze_solver``.
+    """
+
+    __slots__ = ('maze', 'rows', 'cols', 'start', 'end')
+
+    def __init__(self, maze, start, end):
+        self.maze = maze
+        self.rows = maze.height
+        self.cols = maze.width
+        self.start = start
+        self.end = end
+
+    @property
+    def grid(self):
+        return self
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, r):
+        if r < 0:
+            r += self.rows
+        if not 0 <= r < self.rows:
+            raise IndexError("row index out of range")
+        return _CharRow(self, r)
+
+    def cell(self, r, c):
+        if (r, c) == self.start:
+            return 'S'
+        if (r, c) == self.end:
+            return 'E'
+        return '#' if self.maze.cells[r * self.cols + c] == WALL else ' '
+
+
+class _CharRow:
+    __slots__ = ('view', 'r')
+
+    def __init__(self, view, r):
+        self.view = view
+        self.r = r
+
+    def __len__(self):
+        return self.view.cols
+
+    def __getitem__(self, c):
+        if c < 0:
+            c += self.view.cols
+        if not 0 <= c < self.view.cols:
+            raise IndexError("column index out of range")
+        return self.view.cell(self.r, c)
+
+
+def is_perfect(grid):
+    """Whether the open cells form a tree: all connected, with no loops."""
+    w, cells = grid.width, grid.cells
+    size = len(cells)
+    first = cells.find(OPEN)
+    if first == -1:
+        return False
+    opened = cells.count(OPEN)
+    # A connected graph on n cells is a tree exactly when it has n - 1 edges
+    edges = 0
+    for i in range(size):
+        if cells[i] == OPEN:
+            edges += (i + 1) % w != 0 and cells[i + 1] == OPEN
+            edges += i + w < size and cells[i + w] == OPEN
+    seen = {first}
+    stack = [first]
+    while stack:
+        i = stack.pop()
+        for n in (i - w, i + w, i - 1 if i % w else -1, i + 1 if (i + 1) % w else -1):
+            if 0 <= n < size and cells[n] == OPEN and n not in seen:
+                seen.add(n)
+                stack.append(n)
+    return len(seen) == opened and edges == opened - 1
+
+
+def tests():
+    from neighbor_table import NeighborTable, DOWN, RIGHT
+    from junction_graph import JunctionGraph
+    from distance_field import DistanceField, UNREACHABLE
+
+    print("Running Maze Grid Tests...\n")
+
+    rows = [
+        [1, 1, 1, 1, 1],
+        [1, 0, 0, 0, 1],
+        [1, 0, 1, 0, 1],
+        [1, 0, 0, 0, 1],
+        [1, 1, 1, 1, 1],
+    ]
+
+    # TEST CASE 1: Layouts agree
+    grid = MazeGrid.from_rows(rows)
+    assert grid.to_rows() == rows, "Test 1 Failed: Rows did not round-trip"
+    assert grid[2][2] == WALL and grid.is_open(1, 2), "Test 1 Failed: Wrong cell values"
+    assert grid.coords(grid.index(3, 2)) == (3, 2), "Test 1 Failed: index/coords disagree"
+    view = grid.char_view()
+    assert view[1][1] == 'S' and view[3][3] == 'E' and view[2][2] == '#', "Test 1 Failed: Wrong char view"
+    assert not is_perfect(grid), "Test 1 Failed: A loop counted as a perfect maze"
+    print("Test 1 Passed: Rows, flat indices and char view agree.")
+
+    # TEST CASE 2: Derived tables are built once and reused
+    table = NeighborTable.of(grid)
+    graph = JunctionGraph.of(grid)
+    field = DistanceField.of(grid, (3, 3))
+    fingerprint = grid.fingerprint()
+    assert NeighborTable.of(grid) is table, "Test 2 Failed: Neighbor table rebuilt"
+    assert JunctionGraph.of(grid) is graph, "Test 2 Failed: Junction graph rebuilt"
+    assert DistanceField.of(grid, (3, 3)) is field, "Test 2 Failed: Distance field rebuilt"
+    assert table.mask[grid.index(1, 1)] == DOWN | RIGHT, "Test 2 Failed: Wrong neighbor mask"
+    assert field.distance((1, 1)) == 4, "Test 2 Failed: Wrong distance around the loop"
+    print("Test 2 Passed: Derived tables are cached per grid.")
+
+    # TEST CASE 3: Mutate a cell, invalidate, and every table is rebuilt
+    grid.cells[grid.index(2, 1)] = WALL
+    grid.cells[grid.index(1, 2)] = WALL
+    grid.invalidate()
+    assert grid.fingerprint() != fingerprint, "Test 3 Failed: Fingerprint not recomputed"
+    assert NeighborTable.of(grid) is not table, "Test 3 Failed: Stale neighbor table"
+    assert JunctionGraph.of(grid) is not graph, "Test 3 Failed: Stale junction graph"
+    assert DistanceField.of(grid, (3, 3)) is not field, "Test 3 Failed: Stale distance field"
+    assert NeighborTable.of(grid).mask[grid.index(1, 1)] == 0, "Test 3 Failed: Mask ignores new walls"
+    assert DistanceField.of(grid, (3, 3)).distance((1, 1)) == UNREACHABLE, "Test 3 Failed: Walled-in cell reachable"
+    path, _ = JunctionGraph.of(grid).solve((1, 1), (3, 3))
+    assert path is None, "Test 3 Failed: Junction graph found a path through walls"
+    print("Test 3 Passed: Mutated grid rebuilds its tables after invalidate.")
+
+    # TEST CASE 4: Buffers are checked and pickled
+    import pickle
+    try:
+        MazeGrid(5, 5, bytearray(24))
+        assert False, "Test 4 Failed: Short cell buffer accepted"
+    except ValueError:
+        pass
+    copy = pickle.loads(pickle.dumps(grid))
+    assert copy.cells == grid.cells and copy.fingerprint() == grid.fingerprint(), "Test 4 Failed: Pickle changed the maze"
+    print("Test 4 Passed: Bad buffers rejected, pickling keeps the maze.")
+
+    print("\nAll tests passed successfully!")
+
+
+if __name__ == "__main__":
+    tests()
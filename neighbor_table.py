@@ -0,0 +1,87 @@
+"""
+Precomputed open-neighbor table of a maze.
+
+Solvers used to find a cell's neighbors by testing four candidates for bounds
+and walls on every expansion, usually collecting them into a fresh list.
+``NeighborTable`` runs those tests once per maze: ``mask[i]`` holds one bit
+per open direction of cell ``i`` (0 for walls), and ``steps()`` maps each of
+the 16 possible masks to the flat index offsets of its open neighbors, so
+
+    for d in steps[mask[i]]:
+        n = i + d
+
+visits exactly the open neighbors of ``i``, with no bounds checks and nothing
+allocated. ``steps()`` takes the direction order, since it decides which of
+several equal paths a search finds.
+
+Build it with ``NeighborTable.of(grid)``: like the junction graph, it is
+cached on the grid and shared by every solver, player and repeated solve.
+"""
+
+from maze_grid import OPEN
+
+
+# Direction bits of a mask
+DOWN, UP, RIGHT, LEFT = 1, 2, 4, 8
+# MazeSolver's order; solvers with another one pass it to steps()
+ORDER = (DOWN, UP, RIGHT, LEFT)
+
+# Open-cell indicator: 1 for OPEN bytes, 0 for everything else
+_IS_OPEN = bytes(1 if v == OPEN else 0 for v in range(256))
+# Number of open directions of each mask, padded to 256 entries so that
+# ``mask.translate(DEGREE)`` gives the degree of every cell at once
+DEGREE = bytes(bin(m & 15).count('1') for m in range(256))
+
+
+class NeighborTable:
+    __slots__ = ('width', 'mask', '_steps')
+
+    def __init__(self, grid):
+        w, h = grid.width, grid.height
+        size = w * h
+        self.width = w
+        self._steps = {}
+        # As one little-endian int, the open indicators put cell i in byte i:
+        # shifting by 8 bits moves every cell one place at once and & / |
+        # then act on all cells together, since no byte ever exceeds 15.
+        cells = grid.cells
+        if hasattr(cells, 'open_cells'):
+            # Bit-packed (maze_file.PackedCells): expand the packed body in one go
+            # instead of unpacking a full copy of the cells first
+            open_cells = cells.open_cells()
+        else:
+            open_cells = cells.translate(_IS_OPEN)
+        o = int.from_bytes(open_cells, 'little')
+        all_cells = (1 << 8 * size) - 1
+        # Keep rows from wrapping into each other at the left and right edges
+        has_right = int.from_bytes((b'\1' * (w - 1) + b'\0') * h, 'little')
+        has_left = int.from_bytes((b'\0' + b'\1' * (w - 1)) * h, 'little')
+        down = o & (o >> 8 * w)
+        up = o & (o << 8 * w) & all_cells
+        right = o & (o >> 8) & has_right
+        left = o & (o << 8) & has_left
+        self.mask = bytearray((down | up << 1 | right << 2 | left << 3).to_bytes(size, 'little'))
+
+    @classmethod
+    def of(cls, grid):
+        """The neighbor table of ``grid``, built on first use and then reused."""
+        return grid.derived('neighbor_table', cls)
+
+    def steps(self, order=ORDER):
+        """Per mask, the flat index offsets of its open directions, in ``order``."""
+        order = tuple(order)
+        try:
+            return self._steps[order]
+        except KeyError:
+            w = self.width
+            delta = {DOWN: w, UP: -w, RIGHT: 1, LEFT: -1}
+            table = self._steps[order] = tuple(
+                tuple(delta[d] for d in order if m & d) for m in range(16))
+            return table
+
+    def neighbors(self, i, order=ORDER):
+        """Flat indices of the open neighbors of flat cell ``i``."""
+        return [i + d for d in self.steps(order)[self.mask[i]]]
+
+    def degree(self, i):
+        return DEGREE[self.mask[i]]
@@ -0,0 +1,110 @@
+"""
+Process-pool execution of MazeSolver algorithms.
+
+Each worker process receives the maze once, in its compact MazeGrid form,
+through the pool initializer; afterwards a task is just the name of a
+``MazeSolver`` method. Solvers therefore run truly in parallel instead of
+being serialized by the GIL, and their timings are measured inside the worker,
+free of any GUI interference.
+
+``cancel`` stops every solve submitted so far at its next budget check: the
+workers watch a shared generation counter that ``cancel`` advances.
+"""
+
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from maze_algorithms import MazeSolver
+from search_budget import Budget
+from solver_metrics import SolverMetrics
+
+
+_worker_maze = None
+_worker_generation = None
+
+
+def _init_worker(maze, generation):
+    global _worker_maze, _worker_generation
+    _worker_maze = maze
+    _worker_generation = generation
+
+
+class _GenerationToken:
+    """Cancelled once the pool's generation moves past the one a task was submitted in."""
+
+    __slots__ = ('generation',)
+
+    def __init__(self, generation):
+        self.generation = generation
+
+    @property
+    def cancelled(self):
+        return _worker_generation.value != self.generation
+
+
+def _solve_in_worker(method, generation, seconds, expansions, metrics):
+    solver = MazeSolver(_worker_maze)
+    budget = Budget(seconds, expansions, token=_GenerationToken(generation))
+    metrics = SolverMetrics() if metrics else None
+    t0 = time.perf_counter()
+    path, explored = getattr(solver, method)(budget=budget, metrics=metrics)
+    ms = (time.perf_counter() - t0) * 1000
+    return path, explored, ms, budget.reason, None if metrics is None else metrics.as_dict()
+
+
+class ParallelSolver:
+    """Pool of worker processes bound to a single maze.
+
+    The pool is reusable for any number of solves on that maze; create a new
+    ParallelSolver when the maze changes.
+    """
+
+    def __init__(self, maze, max_workers=4):
+        self.maze = maze
+        # 'spawn' keeps workers independent of the parent's threads and GUI state
+        context = multiprocessing.get_context('spawn')
+        self.generation = context.Value('q', 0)
+        self.pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                                        initializer=_init_worker, initargs=(maze, self.generation))
+
+    def submit(self, method, seconds=None, expansions=None, metrics=False):
+        """Schedule ``MazeSolver.<method>`` within an optional time / expansion budget.
+
+        The future yields ``(path, explored, ms, stopped, metrics)``: ``stopped``
+        is the budget's reason (see search_budget.py) when the result is only
+        partial, and ``metrics`` the run's SolverMetrics counters as a dict
+        when requested (None otherwise).
+        """
+        return self.pool.submit(_solve_in_worker, method, self.generation.value, seconds, expansions, metrics)
+
+    def cancel(self):
+        """Stop every solve submitted so far; later submissions run normally."""
+        with self.generation.get_lock():
+            self.generation.value += 1
+
+    def solve_all(self, methods, seconds=None, expansions=None, metrics=False):
+        """Yield ``(i, path, explored, ms, stopped, metrics, error)`` for ``methods[i]`` as each one finishes.
+
+        ``error`` is None, or the exception of a solve whose worker raised (or
+        whose pool broke); such a solve has no path.
+        """
+        futures = {self.submit(m, seconds, expansions, metrics): i for i, m in enumerate(methods)}
+        for future in as_completed(futures):
+            try:
+                result = future.result() + (None,)
+            except Exception as exc:
+                result = (None, [], 0.0, None, None, exc)
+            yield (futures[future],) + result
+
+    def shutdown(self):
+        """Stop every solve and wait for the workers to exit.
+
+        Running solves stop at their next budget check and queued ones stop
+        at their first, so this returns promptly. Waiting matters: on Python
+        3.8 a pool left to wind down on its own can hang interpreter exit,
+        and so does cancelling its queued futures before the join; the
+        generation counter stops them instead.
+        """
+        self.cancel()
+        self.pool.shutdown(wait=True)
@@ -0,0 +1,60 @@
+"""
+PhotoImage-backed maze rendering for large mazes.
+
+A Tk canvas slows down badly once it holds a few tens of thousands of items,
+so big mazes are painted into one ``tk.PhotoImage`` instead: every cell is a
+``scale`` x ``scale`` block of pixels whose color comes from a palette index
+kept per cell. Changes are flushed a maze row at a time, one ``put`` call per
+touched row covering just the span of cells that changed in it.
+"""
+
+import tkinter as tk
+
+
+class PixelBuffer:
+    def __init__(self, canvas, width, height, scale, colors, palette):
+        """
+        canvas: tk.Canvas the image is placed on (top-left corner)
+        width, height: maze size in cells
+        scale: pixels per cell side
+        colors: bytearray of palette indices, one per cell (kept, not copied)
+        palette: list of '#rrggbb' strings
+        """
+        self.width = width
+        self.height = height
+        self.scale = scale
+        self.colors = colors
+        self.palette = palette
+        self.image = tk.PhotoImage(width=width * scale, height=height * scale)
+        canvas.create_image(0, 0, image=self.image, anchor='nw')
+        self._flush({y: (0, width - 1) for y in range(height)})
+
+    def set(self, flat_cells, index):
+        """Give every cell in ``flat_cells`` palette color ``index``."""
+        colors, w = self.colors, self.width
+        dirty = {}
+        for i in flat_cells:
+            colors[i] = index
+            y, x = divmod(i, w)
+            span = dirty.get(y)
+            dirty[y] = (x, x) if span is None else (min(span[0], x), max(span[1], x))
+        self._flush(dirty)
+
+    def set_each(self, flat_cells, indices):
+        """Give each cell its own palette color, pairwise from the two lists."""
+        colors = self.colors
+        for i, index in zip(flat_cells, indices):
+            colors[i] = index
+        rows = {}
+        for i in flat_cells:
+            rows.setdefault(i // self.width, []).append(i % self.width)
+        self._flush({y: (min(xs), max(xs)) for y, xs in rows.items()})
+
+    def _flush(self, dirty):
+        """Repaint span ``x0..x1`` of each dirty row ``y`` with one ``put``."""
+        s, w = self.scale, self.width
+        palette, colors = self.palette, self.colors
+        for y, (x0, x1) in dirty.items():
+            base = y * w
+            pixels = ' '.join(palette[colors[base + x]] for x in range(x0, x1 + 1) for _ in range(s))
+            self.image.put(' '.join(['{' + pixels + '}'] * s), to=(x0 * s, y * s))
@@ -0,0 +1,74 @@
+"""
+Cooperative cancellation and search budgets.
+
+Solvers accept an optional ``budget`` and, instead of polling it on every
+expansion, ask it for a grant of expansions they may run before checking in
+again (``Budget.every`` at most). When a check finds the search cancelled,
+out of time or out of expansions, the grant is 0 and the solver stops,
+returning what it has: the cells explored so far and the best partial path it
+knows (start to the reached cell closest to the goal). ``Budget.reason`` then
+says why it stopped; it stays None for searches that ran to completion.
+
+A ``CancelToken`` can be shared by any number of budgets (e.g. every player of
+one race), so a single ``cancel()`` stops them all.
+"""
+
+import time
+
+
+class CancelToken:
+    """Flag set once from any thread; budgets watching it stop at their next check."""
+
+    __slots__ = ('cancelled',)
+
+    def __init__(self):
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class Budget:
+    CANCELLED = 'cancelled'
+    TIME = 'time'
+    EXPANSIONS = 'expansions'
+
+    def __init__(self, seconds=None, expansions=None, token=None, every=1024):
+        """
+        seconds: wall-clock limit, counted from construction
+        expansions: limit on expanded cells (or graph nodes)
+        token: CancelToken to watch; a private one is made when omitted
+        every: expansions between two checks
+        """
+        self.deadline = None if seconds is None else time.perf_counter() + seconds
+        self.expansions = expansions
+        self.token = token if token is not None else CancelToken()
+        self.every = max(1, every)
+        self.reason = None
+        self._spent = 0     # Expansions granted so far
+
+    def cancel(self):
+        self.token.cancel()
+
+    @property
+    def stopped(self):
+        return self.reason is not None
+
+    def grant(self):
+        """Expansions the caller may run before checking again; 0 means stop now.
+
+        Each call counts the previous grant as spent, so expansion limits are
+        exact as long as the caller only asks again once a grant is used up.
+        """
+        if self.reason is None:
+            if self.token.cancelled:
+                self.reason = self.CANCELLED
+            elif self.deadline is not None and time.perf_counter() >= self.deadline:
+                self.reason = self.TIME
+            elif self.expansions is not None and self._spent >= self.expansions:
+                self.reason = self.EXPANSIONS
+        if self.reason is not None:
+            return 0
+        n = self.every if self.expansions is None else min(self.every, self.expansions - self._spent)
+        self._spent += n
+        return n
@@ -0,0 +1,92 @@
+"""
+Bounded LRU cache of solver results.
+
+Maps ``(maze fingerprint, algorithm, start, end)`` to the ``(path, explored)``
+pair a solver returned, so re-running an unchanged maze (START, RESET, START
+again, or changing the player count) is answered without searching. The cache
+is bounded by an estimate of the memory its entries hold, not by entry count,
+since one result on a big maze can outweigh thousands on a small one.
+"""
+
+from collections import OrderedDict
+import sys
+import threading
+
+
+# Approximate cost of one (x, y) cell in a result list: the list slot, the
+# tuple and its two int objects.
+_BYTES_PER_CELL = 8 + sys.getsizeof((0, 0)) + 2 * sys.getsizeof(1000)
+
+
+def result_size(result):
+    """Estimated bytes held by a ``(path, explored)`` result."""
+    path, explored = result
+    cells = (len(path) if path else 0) + len(explored)
+    return sys.getsizeof(path or []) + sys.getsizeof(explored) + cells * _BYTES_PER_CELL
+
+
+def cells_for(nbytes):
+    """How many result cells fit in ``nbytes`` by the same estimate."""
+    return nbytes // _BYTES_PER_CELL
+
+
+class SolutionCache:
+    """Thread-safe LRU cache with a memory budget and hit/miss counters.
+
+    Cached results are shared, not copied: treat them as read-only.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()   # key -> (result, size)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(grid, algorithm, start, end):
+        return (grid.fingerprint(), algorithm, tuple(start), tuple(end))
+
+    def get(self, key):
+        """The cached result for ``key``, or None (counted as a miss)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, result):
+        size = result_size(result)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes_used -= old[1]
+            if size > self.max_bytes:
+                return      # Would evict everything and still not fit
+            self._entries[key] = (result, size)
+            self.bytes_used += size
+            while self.bytes_used > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.bytes_used -= evicted
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes_used = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {'entries': len(self._entries), 'bytes': self.bytes_used,
+                    'max_bytes': self.max_bytes, 'hits': self.hits,
+                    'misses': self.misses, 'evictions': self.evictions,
+                    'hit_rate': self.hits / lookups if lookups else 0.0}
@@ -0,0 +1,76 @@
+"""
+Per-run solver instrumentation.
+
+Solvers accept an optional ``metrics`` hook and report each frontier
+operation to it; without a hook all they pay is an ``is not None`` test per
+operation. The hook is any object with these methods (``SolverMetrics`` is
+the standard one; subclass it to log, sample or aggregate differently):
+
+    push(size)          an entry joined the frontier, which now holds ``size``
+    pop()               an entry left the frontier
+    stale()             ... and was dropped: it had been superseded (lazy deletion)
+    expand(checked)     ... and was expanded, after ``checked`` neighbor checks
+    duplicate()         a neighbor was not pushed: already seen, or no cheaper
+
+The goal is popped but never expanded, so a complete search reports one
+expansion less than it visited cells.
+"""
+
+import tracemalloc
+
+
+class SolverMetrics:
+    FIELDS = ('expansions', 'pushes', 'pops', 'stale_pops', 'duplicates',
+              'peak_frontier', 'neighbor_checks', 'peak_bytes')
+
+    def __init__(self, memory=False):
+        """
+        memory: have ``measure`` trace the peak allocated bytes (tracemalloc
+                slows the run down several times, so it is opt-in)
+        """
+        self.memory = memory
+        self.expansions = 0
+        self.pushes = 0
+        self.pops = 0
+        self.stale_pops = 0
+        self.duplicates = 0
+        self.peak_frontier = 0
+        self.neighbor_checks = 0
+        self.peak_bytes = None
+
+    def push(self, size):
+        self.pushes += 1
+        if size > self.peak_frontier:
+            self.peak_frontier = size
+
+    def pop(self):
+        self.pops += 1
+
+    def stale(self):
+        self.stale_pops += 1
+
+    def expand(self, checked):
+        self.expansions += 1
+        self.neighbor_checks += checked
+
+    def duplicate(self):
+        self.duplicates += 1
+
+    def measure(self, run):
+        """Return ``run()``, recording its peak allocation in ``peak_bytes`` if ``memory`` is set.
+
+        tracemalloc is process-wide: nothing is recorded while something else
+        is already tracing, and allocations by other threads count too.
+        """
+        if not self.memory or tracemalloc.is_tracing():
+            return run()
+        tracemalloc.start()
+        try:
+            return run()
+        finally:
+            self.peak_bytes = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.FIELDS}
+
@@ -0,0 +1,179 @@
+"""
+Streaming exploration events from solvers.
+
+Every solver can run as a generator of ``(kind, data)`` events:
+
+    (VISIT, cell)   a cell is expanded; in order, these form ``explored``
+    (PUSH, cell)    a cell joins the frontier (only when ``frontier=True``)
+    (STOPPED, why)  the search's budget ran out (see search_budget.py); the
+                    PATH that follows is then only the best partial path
+    (PATH, path)    always last: the final path, or None when unreachable
+
+``collect`` turns such a stream back into the classic ``(path, explored)``
+pair. ``SolverStream`` runs a stream on a background thread behind a bounded
+buffer so a GUI can start animating before the search ends, and
+``ReplayStream`` offers the same polling interface over a finished result.
+"""
+
+import queue
+import threading
+import time
+
+
+VISIT = 'visit'
+PUSH = 'push'
+PATH = 'path'
+STOPPED = 'stopped'
+
+
+def collect(events):
+    """Drain an event stream into ``(path, explored)``."""
+    explored = []
+    visit = explored.append
+    path = None
+    for kind, data in events:
+        if kind == VISIT:
+            visit(data)
+        elif kind == PATH:
+            path = data
+    return path, explored
+
+
+def replay(path, explored):
+    """Events equivalent to a finished ``(path, explored)`` result."""
+    for cell in explored:
+        yield VISIT, cell
+    yield PATH, path
+
+
+class ReplayStream:
+    """Polling interface over an already computed result."""
+
+    def __init__(self, path, explored, elapsed_ms=0.0):
+        self._events = replay(path, explored)
+        self._done = False
+        self.elapsed_ms = elapsed_ms
+        self.result = (path, explored)
+        self.error = None
+
+    def start(self):
+        return self
+
+    def poll(self, limit):
+        """Up to ``limit`` next events; never blocks."""
+        out = []
+        for event in self._events:
+            out.append(event)
+            if len(out) >= limit:
+                break
+        else:
+            self._done = True
+        return out
+
+    @property
+    def done(self):
+        return self._done
+
+    def cancel(self):
+        self._done = True
+
+
+class SolverStream:
+    """Run an event generator on a daemon thread behind a bounded buffer.
+
+    The producer hands events over in chunks and blocks once ``max_chunks``
+    are waiting, so at most ``chunk * max_chunks`` events are ever buffered
+    no matter how far the search runs ahead of the consumer. ``elapsed_ms``
+    counts only time spent inside the solver, not time blocked on the buffer.
+
+    With ``record_limit`` set, the stream also keeps the visited cells until
+    that many have been seen, so a small enough result can be cached
+    afterwards (``result``); past the limit the history is dropped, and a
+    search stopped by its budget is never recorded either.
+    """
+
+    _END = object()
+
+    def __init__(self, events, chunk=256, max_chunks=32, record_limit=0):
+        self._events = events
+        self._chunk = chunk
+        self._queue = queue.Queue(maxsize=max_chunks)
+        self._pending = []
+        self._cancelled = threading.Event()
+        self._finished = False
+        self._record_limit = record_limit
+        self.elapsed_ms = 0.0
+        self.result = None
+        self.error = None
+
+    def start(self):
+        threading.Thread(target=self._produce, daemon=True).start()
+        return self
+
+    def _put(self, item):
+        while not self._cancelled.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self):
+        events = iter(self._events)
+        history = [] if self._record_limit else None
+        path = None
+        try:
+            while not self._cancelled.is_set():
+                t0 = time.perf_counter()
+                chunk = []
+                for event in events:
+                    chunk.append(event)
+                    if len(chunk) >= self._chunk:
+                        break
+                self.elapsed_ms += (time.perf_counter() - t0) * 1000
+                if history is not None:
+                    for kind, data in chunk:
+                        if kind == VISIT:
+                            history.append(data)
+                        elif kind == PATH:
+                            path = data
+                        elif kind == STOPPED:
+                            history = None    # Partial: not worth caching
+                            break
+                    if history is not None and len(history) > self._record_limit:
+                        history = None
+                if chunk and not self._put(chunk):
+                    break
+                if len(chunk) < self._chunk:
+                    if history is not None:
+                        self.result = (path, history)
+                    break
+        except Exception as exc:  # Surface solver errors to the consumer
+            self.error = exc
+        finally:
+            if hasattr(events, 'close'):
+                events.close()
+            self._put(self._END)
+
+    def poll(self, limit):
+        """Up to ``limit`` buffered events; never blocks."""
+        out = self._pending
+        while len(out) < limit:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is self._END:
+                self._finished = True
+                break
+            out.extend(item)
+        self._pending = out[limit:]
+        return out[:limit]
+
+    @property
+    def done(self):
+        return self._finished and not self._pending
+
+    def cancel(self):
+        self._cancelled.set()
@@ -0,0 +1,165 @@
+"""
+Randomized Kruskal and Prim maze generators.
+
+Both build a random spanning tree over the rooms (cells on odd coordinates,
+room ``k = j * cols + i`` is cell ``(2i + 1, 2j + 1)``) and open the wall cell
+for every tree edge. Unlike the backtracker's long winding corridors, they
+give mazes with many short dead ends and branch points.
+
+Kruskal shuffles every room-to-room edge once and keeps the edges that join
+two different components, tracked in a flat union-find (``array`` parents,
+``bytearray`` ranks, path halving and union by rank). Prim grows one tree
+from the start room; its frontier is a plain list with O(1) random removal
+(swap the chosen entry with the last one, then pop).
+"""
+
+from array import array
+import random
+
+from maze_grid import MazeGrid, OPEN
+
+
+class _SpanningTreeGenerator:
+    name = None
+
+    def __init__(self, width, height, seed=None):
+        """
+        width, height: odd maze dimensions in cells
+        seed: makes the maze reproducible; a random one is drawn when omitted
+        """
+        self.width = width
+        self.height = height
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+        self.cols = (width - 1) // 2
+        self.rows = (height - 1) // 2
+
+    def generate(self):
+        w, h = self.width, self.height
+        maze = MazeGrid(w, h)
+        if self.rows and self.cols:
+            cells = maze.cells
+            for j in range(self.rows):
+                y = (2 * j + 1) * w
+                cells[y + 1:y + 2 * self.cols:2] = bytes(self.cols)
+            self._carve(cells)
+            cells[w + 1] = OPEN
+            cells[(h - 2) * w + w - 2] = OPEN
+        return maze
+
+
+class KruskalGenerator(_SpanningTreeGenerator):
+    name = 'kruskal'
+
+    def _carve(self, cells):
+        cols, rows, w = self.cols, self.rows, self.width
+        # Edges are encoded as (wall cell << 1 | vertical); the rooms either
+        # side of a wall cell are one step away, so no coordinates are needed
+        edges = [(2 * j + 1) * w + 2 * i + 2 << 1 for j in range(rows) for i in range(cols - 1)]
+        edges += [(2 * j + 2) * w + 2 * i + 1 << 1 | 1 for j in range(rows - 1) for i in range(cols)]
+        self.rng.shuffle(edges)
+
+        # Union-find over flat cell indices; only room entries are ever used
+        parent = array('i', range(w * self.height))
+        rank = bytearray(w * self.height)
+        remaining = cols * rows - 1
+        for e in edges:
+            wall = e >> 1
+            step = w if e & 1 else 1
+            a, b = wall - step, wall + step
+            # Find both roots, halving the paths on the way up
+            while parent[a] != a:
+                parent[a] = a = parent[parent[a]]
+            while parent[b] != b:
+                parent[b] = b = parent[parent[b]]
+            if a == b:
+                continue
+            if rank[a] < rank[b]:
+                a, b = b, a
+            parent[b] = a
+            if rank[a] == rank[b]:
+                rank[a] += 1
+            cells[wall] = OPEN
+            remaining -= 1
+            if not remaining:
+                break   # Spanning tree complete: every remaining edge is a cycle
+
+
+class PrimGenerator(_SpanningTreeGenerator):
+    name = 'prim'
+
+    def _carve(self, cells):
+        cols, w = self.cols, self.width
+        count = cols * self.rows
+        randrange = self.rng.randrange
+        state = bytearray(count)    # Per room: 0 = untouched, 1 = frontier, 2 = in the maze
+        frontier = []
+        push = frontier.append
+
+        k = 0
+        while True:
+            # Room k joins the maze; its untouched neighbours join the frontier
+            state[k] = 2
+            i = k % cols
+            if k >= cols and not state[k - cols]:
+                state[k - cols] = 1
+                push(k - cols)
+            if k + cols < count and not state[k + cols]:
+                state[k + cols] = 1
+                push(k + cols)
+            if i and not state[k - 1]:
+                state[k - 1] = 1
+                push(k - 1)
+            if i + 1 < cols and not state[k + 1]:
+                state[k + 1] = 1
+                push(k + 1)
+            if not frontier:
+                break
+
+            # O(1) random removal: move the last entry into the chosen slot
+            pick = randrange(len(frontier))
+            k = frontier[pick]
+            frontier[pick] = frontier[-1]
+            frontier.pop()
+
+            # Connect it to a random neighbour already in the maze
+            i = k % cols
+            inside = []
+            if k >= cols and state[k - cols] == 2:
+                inside.append(-w)
+            if k + cols < count and state[k + cols] == 2:
+                inside.append(w)
+            if i and state[k - 1] == 2:
+                inside.append(-1)
+            if i + 1 < cols and state[k + 1] == 2:
+                inside.append(1)
+            step = inside[randrange(len(inside))] if len(inside) > 1 else inside[0]
+            cells[(2 * (k // cols) + 1) * w + 2 * i + 1 + step] = OPEN
+
+
+def tests():
+    from maze_grid import is_perfect
+
+    print("Running Spanning Tree Generator Tests...\n")
+
+    # TEST CASE 1: Every maze is perfect
+    for cls in (KruskalGenerator, PrimGenerator):
+        for width, height in ((5, 5), (21, 15), (41, 61), (3, 31)):
+            for seed in range(5):
+                maze = cls(width, height, seed).generate()
+                assert is_perfect(maze), f"Test 1 Failed: {cls.name} {width}x{height} seed {seed} is not perfect"
+                assert maze.is_open(1, 1) and maze.is_open(width - 2, height - 2), "Test 1 Failed: Corners walled"
+    print("Test 1 Passed: Kruskal and Prim mazes are perfect.")
+
+    # TEST CASE 2: A seed always gives the same maze
+    for cls in (KruskalGenerator, PrimGenerator):
+        first = cls(31, 21, 7).generate()
+        assert cls(31, 21, 7).generate().cells == first.cells, f"Test 2 Failed: {cls.name} is not reproducible"
+        assert cls(31, 21, 8).generate().cells != first.cells, f"Test 2 Failed: {cls.name} ignores the seed"
+    print("Test 2 Passed: Seeds are reproducible.")
+
+    print("\nAll tests passed successfully!")
+
+
+if __name__ == "__main__":
+    tests()
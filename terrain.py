@@ -0,0 +1,149 @@
+"""
+Terrain costs for weighted mazes.
+
+A ``MazeGrid`` may carry ``weights``: one byte per cell, the cost of stepping
+onto it. Plain ground costs 1; slow tiles, water and pipes cost more, so the
+cheapest route is no longer simply the shortest one. Only the weighted
+searches (``MazeSolver.solve_dijkstra`` and ``solve_weighted_astar``) take
+the costs into account; every other solver still counts steps.
+
+``add_terrain`` scatters patches of terrain over a maze, reproducibly from a
+seed; ``clear_terrain`` removes it again.
+"""
+
+import random
+
+from maze_grid import OPEN
+from neighbor_table import NeighborTable
+
+
+PLAIN, SLOW, WATER, PIPE = 1, 2, 3, 5
+TERRAIN = {'plain': PLAIN, 'slow': SLOW, 'water': WATER, 'pipe': PIPE}
+
+
+def add_terrain(grid, seed=None, coverage=0.35, patch=12):
+    """Give ``grid`` random patches of slow tiles, water and pipes.
+
+    coverage: fraction of the open cells to cover (patches may overlap)
+    patch: cells per patch, each grown as a BFS blob from a random open cell
+
+    Replaces any previous terrain and invalidates the grid's derived data
+    (its fingerprint changes). Returns the new ``weights``.
+    """
+    rng = random.Random(seed)
+    cells = grid.cells
+    table = NeighborTable.of(grid)
+    mask, steps = table.mask, table.steps()
+    weights = bytearray([PLAIN]) * len(cells)
+    open_cells = [i for i in range(len(cells)) if cells[i] == OPEN]
+    kinds = (SLOW, WATER, PIPE)
+    for _ in range(int(len(open_cells) * coverage / patch)):
+        cost = rng.choice(kinds)
+        blob = [rng.choice(open_cells)]
+        seen = {blob[0]}
+        for i in blob:
+            if len(blob) >= patch:
+                break
+            for d in steps[mask[i]]:
+                if i + d not in seen:
+                    seen.add(i + d)
+                    blob.append(i + d)
+        for i in blob[:patch]:
+            weights[i] = cost
+    grid.weights = weights
+    grid.invalidate()
+    return weights
+
+
+def clear_terrain(grid):
+    """Make every step of ``grid`` cost 1 again."""
+    grid.weights = None
+    grid.invalidate()
+
+
+def step_costs(grid):
+    """Per-cell step costs of ``grid``: its weights, or all 1 (cached per grid)."""
+    if grid.weights is not None:
+        return grid.weights
+    return grid.derived('unit_weights', lambda g: bytes([PLAIN]) * (g.width * g.height))
+
+
+def path_cost(grid, path):
+    """Total cost of walking ``path`` ((x, y) cells): every cell after the first is paid for."""
+    if not path:
+        return None
+    costs, w = step_costs(grid), grid.width
+    return sum(costs[y * w + x] for x, y in path[1:])
+
+
+def tests():
+    import heapq
+    from maze_algorithms import GENERATORS, MazeSolver
+
+    print("Running Terrain Tests...\n")
+
+    def heap_dijkstra(grid, start, end):
+        # Plain binary-heap Dijkstra over the weights, as the reference cost
+        w, cells, costs = grid.width, grid.cells, step_costs(grid)
+        s, t = grid.index(*start), grid.index(*end)
+        best = {s: 0}
+        heap = [(0, s)]
+        while heap:
+            d, i = heapq.heappop(heap)
+            if i == t:
+                return d
+            if d > best[i]:
+                continue
+            for n in (i - w, i + w, i - 1 if i % w else -1, i + 1 if (i + 1) % w else -1):
+                if 0 <= n < len(cells) and cells[n] == OPEN and (n not in best or d + costs[n] < best[n]):
+                    best[n] = d + costs[n]
+                    heapq.heappush(heap, (best[n], n))
+        return None
+
+    # TEST CASE 1: Weighted searches find paths as cheap as a heap Dijkstra
+    for name in ('backtracker', 'kruskal'):
+        for seed in range(4):
+            grid = GENERATORS[name](31, 21, seed).generate()
+            rng = random.Random(seed)
+            # Knock out inner walls so that cheap and short routes differ
+            for _ in range(60):
+                x, y = rng.randrange(1, 30), rng.randrange(1, 20)
+                grid.cells[grid.index(x, y)] = OPEN
+            grid.invalidate()
+            add_terrain(grid, seed, coverage=0.6)
+            for start, end in (((1, 1), (29, 19)), ((29, 1), (1, 19)), ((15, 9), (1, 1))):
+                if not (grid.is_open(*start) and grid.is_open(*end)):
+                    continue
+                expected = heap_dijkstra(grid, start, end)
+                for method in ('solve_dijkstra', 'solve_weighted_astar'):
+                    path, _ = getattr(MazeSolver(grid, start=start, end=end), method)()
+                    assert path[0] == start and path[-1] == end, f"Test 1 Failed: {method} wrong endpoints"
+                    assert path_cost(grid, path) == expected, \
+                        f"Test 1 Failed: {method} on {name} seed {seed} costs {path_cost(grid, path)}, expected {expected}"
+    print("Test 1 Passed: Dijkstra and weighted A* costs match a heap Dijkstra.")
+
+    # TEST CASE 2: Terrain is reproducible and covers only open cells with known costs
+    grid = GENERATORS['backtracker'](31, 21, 5).generate()
+    fingerprint = grid.fingerprint()
+    weights = bytes(add_terrain(grid, 9))
+    assert grid.fingerprint() != fingerprint, "Test 2 Failed: Fingerprint ignores terrain"
+    assert bytes(add_terrain(grid, 9)) == weights, "Test 2 Failed: Terrain not reproducible"
+    assert set(weights) <= set(TERRAIN.values()) and set(weights) != {PLAIN}, "Test 2 Failed: Unexpected costs"
+    assert all(weights[i] == PLAIN for i in range(len(weights)) if grid.cells[i] != OPEN), \
+        "Test 2 Failed: Terrain on a wall"
+    print("Test 2 Passed: Terrain is reproducible.")
+
+    # TEST CASE 3: Without terrain, every step costs 1
+    clear_terrain(grid)
+    assert grid.fingerprint() == fingerprint, "Test 3 Failed: Fingerprint not restored"
+    path, _ = MazeSolver(grid).solve_dijkstra()
+    shortest, _ = MazeSolver(grid).solve_bfs()
+    assert path_cost(grid, path) == len(shortest) - 1, "Test 3 Failed: Unit costs differ from steps"
+    assert path_cost(grid, []) is None, "Test 3 Failed: Empty path has a cost"
+    print("Test 3 Passed: Cleared terrain counts steps.")
+
+    print("\nAll tests passed successfully!")
+
+
+if __name__ == "__main__":
+    tests()